@@ -8,7 +8,7 @@
 # 
 #  Create Date       : 03/03/2020
 #  File Name         : pybme280.py
-#  Module Dependency : -
+#  Module Dependency : pysensorimport.py
 #  
 #  Tool Version      : -
 #  
@@ -21,9 +21,11 @@
 #                         Import Library                          #
 ###################################################################
 import time
-import cffi
 import math
-import numpy as np
+from pysensorimport import lazyImport
+
+# NumPy is loaded by first use (batch compensation, records, streaming)
+np = lazyImport("numpy")
 
 ###################################################################
 #                     Constants Declaration                       #
@@ -46,6 +48,9 @@ BME280_CTRL_MEAS_ADDR              = 0XF4
 BME280_CONFIG_ADDR                 = 0XF5
 BME280_DATA_ADDR                   = 0XF7
 
+# API Success Code
+BME280_OK                          = 0
+
 # API Error Codes
 BME280_E_NULL_PTR                  = -1
 BME280_E_DEV_NOT_FOUND             = -2
@@ -53,6 +58,7 @@ BME280_E_INVALID_LEN               = -3
 BME280_E_COMM_FAIL                 = -4
 BME280_E_SLEEP_MODE_FAIL           = -5
 BME280_E_NVM_COPY_FAILED           = -6
+BME280_E_MEAS_TIMEOUT              = -7
 
 # API Warning Codes
 BME280_W_INVALID_OSR_MACRO         = 1
@@ -100,6 +106,12 @@ BME280_FILTER_COEFF_16             = 0x04
 BME280_STATUS_REG_ADDR             = 0xF3
 BME280_SOFT_RESET_COMMAND          = 0xB6
 BME280_STATUS_IM_UPDATE            = 0x01
+BME280_STATUS_MEASURING            = 0x08
+
+# Forced Measurement Status Polling (back-off delay in second)
+BME280_MEAS_POLL_DELAY             = 0.0002
+BME280_MEAS_POLL_MAX_DELAY         = 0.002
+BME280_MEAS_POLL_TRIES             = 10
 
 # Measurement Delay Calculation Macros
 BME280_MEAS_OFFSET                 = 1250
@@ -107,6 +119,30 @@ BME280_MEAS_DUR                    = 2300
 BME280_PRES_HUM_MEAS_OFFSET        = 575
 BME280_MEAS_SCALING_FACTOR         = 1000
 
+# Typical Measurement Time Macros (in microsecond)
+BME280_MEAS_TYP_OFFSET             = 1000
+BME280_MEAS_TYP_DUR                = 2000
+BME280_PRES_HUM_MEAS_TYP_OFFSET    = 500
+
+# Normal Mode Streaming
+BME280_STREAM_BLOCK_LEN            = 16
+BME280_STREAM_RETRY_FRACTION       = 0.01      # Retry delay after repeated frame (fraction of period)
+BME280_STREAM_DRIFT_FRACTION       = 0.25      # Read drift per period (fraction of retry delay)
+
+# AXI Quad SPI FIFO Depth (in transaction word)
+BME280_SPI_FIFO_DEPTH              = 16
+
+# AXI Quad SPI Status Polling (maximum number of status reads per transfer)
+BME280_SPI_POLL_TRIES              = 1000
+
+# AXI Quad SPI Control Register Bits
+BME280_SPI_CR_FIFO_RESET           = 0x60
+BME280_SPI_CR_INHIBIT              = 0x100
+
+# AXI Quad SPI Status Register Bits
+BME280_SPI_SR_RX_EMPTY             = 0x01
+BME280_SPI_SR_TX_EMPTY             = 0x04
+
 # Standby Duration Select
 BME280_STANDBY_TIME_0_5_MS         = 0x00
 BME280_STANDBY_TIME_62_5_MS        = 0x01
@@ -117,6 +153,41 @@ BME280_STANDBY_TIME_1000_MS        = 0x05
 BME280_STANDBY_TIME_10_MS          = 0x06
 BME280_STANDBY_TIME_20_MS          = 0x07
 
+# Standby Duration of Each Standby Time Select (in milisecond)
+BME280_STANDBY_TIME_MAP            = (0.5, 62.5, 125, 250, 500, 1000, 10, 20)
+
+# IIR Filter Step Response (samples to reach 75 % of step input)
+BME280_FILTER_RESPONSE_MAP         = (1, 2, 5, 11, 22)
+
+# Calibration coefficients in compensation order
+BME280_CALIB_COEF_NAMES     = ("temp_coef_1", "temp_coef_2", "temp_coef_3",
+                               "pres_coef_1", "pres_coef_2", "pres_coef_3", "pres_coef_4", "pres_coef_5",
+                               "pres_coef_6", "pres_coef_7", "pres_coef_8", "pres_coef_9",
+                               "humid_coef_1", "humid_coef_2", "humid_coef_3", "humid_coef_4",
+                               "humid_coef_5", "humid_coef_6")
+# Signed calibration coefficients (name, bit length)
+BME280_CALIB_SIGNED_COEFS   = (("temp_coef_2", 16), ("temp_coef_3", 16),
+                               ("pres_coef_2", 16), ("pres_coef_3", 16), ("pres_coef_4", 16), ("pres_coef_5", 16),
+                               ("pres_coef_6", 16), ("pres_coef_7", 16), ("pres_coef_8", 16), ("pres_coef_9", 16),
+                               ("humid_coef_2", 16), ("humid_coef_4", 12), ("humid_coef_5", 12), ("humid_coef_6", 8))
+
+# Registers kept in shadow register cache (start address, length)
+BME280_CACHED_REG_RANGES    = ((BME280_TEMP_PRESS_CALIB_DATA_ADDR, BME280_TEMP_PRESS_CALIB_DATA_LEN),
+                               (BME280_HUMIDITY_CALIB_DATA_ADDR, BME280_HUMIDITY_CALIB_DATA_LEN),
+                               (BME280_CTRL_HUM_ADDR, 1),
+                               (BME280_CTRL_MEAS_ADDR, 2))
+BME280_CACHED_REGS          = frozenset(reg_addr for start_addr, reg_len in BME280_CACHED_REG_RANGES
+                                        for reg_addr in range(start_addr, start_addr + reg_len))
+# Configuration registers (reset value is 0x00)
+BME280_CONFIG_REGS          = (BME280_CTRL_HUM_ADDR, BME280_CTRL_MEAS_ADDR, BME280_CONFIG_ADDR)
+
+# Sensor sample record (compensated data)
+# (dtype spec, so numpy isn't loaded at import)
+BME280_SAMPLE_DTYPE         = [("timestamp", "f8"),
+                               ("pressure", "f8"),
+                               ("temperature", "f8"),
+                               ("humidity", "f8")]
+
 # Macros for selecting sensor settings
 BME_280_OSR_SETTINGS        = 0x07
 BME_280_FILTER_SETTINGS     = 0x18
@@ -139,7 +210,7 @@ BME280_STANDBY_POS          = 0x05
 #                      Function Declaration                       #
 ###################################################################
 class BME280:
-    def __init__(self, master, cpol, cpha):
+    def __init__(self, master, cpol, cpha, cache=None):
         """
             Create a new driver for BME280 sensor
             -------------------------------------
@@ -147,6 +218,8 @@ class BME280:
             master: Master SPI instance (AXI quad spi class)
             cpol: Clock polarity (0 - active high clock ; 1 - active low clock)
             cpha: Clock phase (0 - sample data at rising edge ; 1 - sample data at falling edge) 
+            cache: Persisted calibration cache (e.g. SensorCache), calibration
+            is restored at startup and stored by getCalibData
         """
         # Initialize sensor
         self.uncomp_sensor_data = {
@@ -191,22 +264,59 @@ class BME280:
             # Intermediate temperature coefficient
             "temp_imm":0
         }
+        # Precomputed compensation constants (set by prepareCompensation)
+        self.comp_const = None
+        self.comp_int_const = None
+
+        # Sample record (allocated by first readSensorRecord)
+        self.sensor_record = None
+        # Update uncomp_sensor_data and sensor_data from readSensorRecord
+        self.record_dict_view = False
+        
+        # Shadow register cache for calibration and configuration registers
+        self.use_reg_cache = True
+        self.reg_cache = {}
+
+        # Pending register writes of configuration transaction
+        self.config_depth = 0
+        self.pending_writes = {}
+        self.pending_force = set()
+
+        # Instrumentation (e.g. SensorInstrument, None disables timing)
+        self.instrument = None
+
+        # Persisted calibration cache
+        self.cache = cache
+
+        # Normal mode stream status (period in second)
+        self.stream_stats = {
+            "samples":0,
+            "reads":0,
+            "duplicates":0,
+            "missed":0,
+            "period":0.0
+        }
         
         # Initialize SPI Communication
         self.master = master
         self.spi_mode = 0 if (cpol == 0) else 1
         # Set SPI parameter
         if (self.spi_mode == 0):
-            self.master.write(0x60,0b00_00000110)
+            self.spi_ctrl = 0b00_00000110
         else:
-            self.master.write(0x60,0b00_00011110) 
+            self.spi_ctrl = 0b00_00011110
+        self.master.write(0x60,self.spi_ctrl)
 
         # Read chip ID
         chip_id = self.SPIRead(BME280_CHIP_ID_ADDR, 1)
+        self.chip_id = chip_id[0]
         
         # Check chip validity
         if (chip_id[0] == BME280_CHIP_ID):
             print("[Status] Chip is valid!")
+            # Load calibration and configuration registers (persisted cache or sensor)
+            if ((self.cache is None) or (not(self.cache.load(self)))):
+                self.resync()
         else:
             print("[Status] Chip isn't valid! Please check the sensor!")
             
@@ -216,68 +326,310 @@ class BME280:
             -------------------------------------
             Parameters
             reg_addr: SPI slave register address 
+            read_len: Number of bytes to be read
         """
+        # Serve calibration and configuration registers from pending writes and cache
+        if ((reg_addr in BME280_CACHED_REGS) or (reg_addr in self.pending_writes)):
+            receive_buffer = [self.pending_writes.get(addr, self.reg_cache.get(addr) if self.use_reg_cache else None)
+                              for addr in range(reg_addr, reg_addr + read_len)]
+            if (None not in receive_buffer):
+                return receive_buffer
+
         # Declare internal variable
-        count = 0
         receive_buffer = []
         slave_reg_addr = reg_addr
-        
+        remaining = read_len
+        # Maximum bytes per burst (first word carries address byte)
+        burst_max = (2 * BME280_SPI_FIFO_DEPTH) - 1
+
+        # Read data in bursts (one chip select frame per TX FIFO length)
+        while (remaining > 0):
+            burst_len = min(remaining, burst_max)
+            receive_buffer.extend(self.SPIBurstRead(slave_reg_addr, burst_len))
+
+            # Decrement counter and increment address
+            remaining -= burst_len
+            slave_reg_addr += burst_len
+
+        # Store calibration and configuration registers to cache
+        if (self.use_reg_cache):
+            for i in range(read_len):
+                if ((reg_addr + i) in BME280_CACHED_REGS):
+                    self.updateRegCache(reg_addr + i, receive_buffer[i])
+
+        # Pending writes overwrite data read from sensor
+        if (self.pending_writes):
+            for i in range(read_len):
+                if ((reg_addr + i) in self.pending_writes):
+                    receive_buffer[i] = self.pending_writes[reg_addr + i]
+
+        # Return value
+        return receive_buffer
+
+    def SPIBurstRead(self, reg_addr, read_len, out=None):
+        """
+            Method for reading consecutive registers from SPI slave in
+            a single chip select frame (the sensor auto-increments its
+            register address)
+            -------------------------------------
+            Parameters
+            reg_addr: SPI slave register address (first register)
+            read_len: Number of bytes to be read (max 2 * BME280_SPI_FIFO_DEPTH - 1)
+            (raises IOError with errno BME280_E_COMM_FAIL if transfer doesn't finish)
+            out: Buffer which receives the data in place (e.g. uint8 array row,
+            default: new list)
+        """
+        # First word carries address and first data byte, other words two data bytes
+        word_num = 1 + (read_len // 2)
+
+        # Instrumentation timestamps (skipped when disabled)
+        instrument = self.instrument
+        if (instrument is not None):
+            start_time = time.perf_counter()
+
         # Set chip select to low (enable slave)
         self.master.write(0x70,0b1111_1110)
-            
-        # Send command to slave
-        while (count < read_len):
-            # Reset AXI quad SPI RX FIFO
-            if (self.spi_mode == 0):
-                self.master.write(0x60,0b00_01100110)
-                self.master.write(0x60,0b00_00000110)
-            else:
-                self.master.write(0x60,0b00_01111110)
-                self.master.write(0x60,0b00_00011110)
 
-            # Write data to master TX FIFO
-            tx_data  = (slave_reg_addr | 0x80) << 8
-            self.master.write(0x68,tx_data)
+        # Reset AXI quad SPI FIFO and hold transfer until TX FIFO is filled
+        self.master.write(0x60,self.spi_ctrl | BME280_SPI_CR_FIFO_RESET | BME280_SPI_CR_INHIBIT)
+
+        # Write address and dummy data to master TX FIFO
+        self.master.write(0x68,(reg_addr | 0x80) << 8)
+        for i in range(word_num - 1):
+            self.master.write(0x68,0x0000)
+
+        # Start transfer
+        self.master.write(0x60,self.spi_ctrl)
+        if (instrument is not None):
+            fill_time = time.perf_counter()
+
+        # Wait until all words are received
+        self.SPIWaitTransfer(reg_addr, word_num)
+        if (instrument is not None):
+            wait_time = time.perf_counter()
+
+        # Drain RX FIFO into receive buffer (extra byte of last word is discarded)
+        if (out is None):
+            out = [0] * read_len
+        out[0] = self.master.read(0x6C) & 0xFF
+        for i in range(1, read_len, 2):
             rx_data = self.master.read(0x6C)
-            
-            # Append data to received buffer
-            receive_buffer.append(rx_data)
-            
-            # Increment counter and address
-            count += 1
-            slave_reg_addr += 1
-        
+            out[i] = (rx_data >> 8) & 0xFF
+            if ((i + 1) < read_len):
+                out[i + 1] = rx_data & 0xFF
+
         # Set chip select to high (disable slave)
         self.master.write(0x70,0b1111_1111)
-        
+
+        # Report transfer phases
+        if (instrument is not None):
+            end_time = time.perf_counter()
+            instrument.event("spi_read.fill", reg_addr, read_len, fill_time - start_time)
+            instrument.event("spi_read.wait", reg_addr, read_len, wait_time - fill_time)
+            instrument.event("spi_read.drain", reg_addr, read_len, end_time - wait_time)
+            instrument.event("spi_read", reg_addr, read_len, end_time - start_time)
+
         # Return value
-        return receive_buffer
+        return out
     
-    def SPIWrite(self, reg_addr, data):
+    def SPIWaitTransfer(self, reg_addr, word_num):
+        """
+            Method for waiting until all words of the current frame
+            are shifted (TX FIFO is empty and one word is received per
+            sent word), raises IOError with errno BME280_E_COMM_FAIL
+            if transfer doesn't finish
+            -------------------------------------
+            Parameters
+            reg_addr: SPI slave register address (for error message)
+            word_num: Number of words sent in current frame
+        """
+        # Poll status with bounded tries (RX FIFO occupancy is count - 1)
+        for try_count in range(BME280_SPI_POLL_TRIES):
+            status = self.master.read(0x64)
+            if ((status & BME280_SPI_SR_TX_EMPTY) and not(status & BME280_SPI_SR_RX_EMPTY)
+                and (self.master.read(0x78) >= (word_num - 1))):
+                return
+
+        # Set chip select to high (disable slave) and report failed transfer
+        self.master.write(0x70,0b1111_1111)
+        raise IOError(BME280_E_COMM_FAIL, "SPI transfer of register {} timed out".format(hex(reg_addr)))
+
+    def SPIWrite(self, reg_addr, data, force=False):
         """
             Method for writing to SPI slave
             -------------------------------------
             Parameters
             reg_addr: SPI slave register address
             data: Data to be written to SPI slave
+            force: Set to TRUE to write even if register already contains the data
         """
-        # Set chip select to low (enable slave)
-        self.master.write(0x70,0b1111_1110)
-        
-        # Reset AXI quad SPI RX FIFO
-        if (self.spi_mode == 0):
-            self.master.write(0x60,0b00_01100110)
-            self.master.write(0x60,0b00_00000110)
+        # Record write if configuration transaction is active
+        # (soft reset is written immediately after pending writes)
+        if (self.config_depth > 0):
+            if (reg_addr != BME280_RESET_ADDR):
+                self.pending_writes[reg_addr] = data
+                if (force):
+                    self.pending_force.add(reg_addr)
+                return
+            self.writePendingConfig()
+
+        # Skip write if register already contains the data
+        if (self.use_reg_cache and not(force) and (self.reg_cache.get(reg_addr) == data)):
+            return
+
+        # Send data to slave
+        self.SPIBurstWrite([(reg_addr, data)])
+
+    def SPIBurstWrite(self, write_list):
+        """
+            Method for writing several registers of SPI slave in a
+            single chip select frame (one address and data pair per
+            transaction word)
+            -------------------------------------
+            Parameters
+            write_list: List of (register address, data) pairs
+        """
+        # Instrumentation timestamps (skipped when disabled)
+        instrument = self.instrument
+        if (instrument is not None):
+            start_time = time.perf_counter()
+
+        # Write pairs in chunks of TX FIFO length
+        for chunk_start in range(0, len(write_list), BME280_SPI_FIFO_DEPTH):
+            # Set chip select to low (enable slave)
+            self.master.write(0x70,0b1111_1110)
+
+            # Reset AXI quad SPI FIFO and hold transfer until TX FIFO is filled
+            self.master.write(0x60,self.spi_ctrl | BME280_SPI_CR_FIFO_RESET | BME280_SPI_CR_INHIBIT)
+
+            # Write data to master TX FIFO
+            write_chunk = write_list[chunk_start:chunk_start + BME280_SPI_FIFO_DEPTH]
+            for reg_addr, data in write_chunk:
+                tx_data  = ((reg_addr & ~0x80) << 8) | data
+                self.master.write(0x68,tx_data)
+
+            # Start transfer and wait until all words are shifted out
+            self.master.write(0x60,self.spi_ctrl)
+            self.SPIWaitTransfer(write_chunk[0][0], len(write_chunk))
+
+            # Set chip select to high (disable slave)
+            self.master.write(0x70,0b1111_1111)
+
+        # Report transfer time
+        if (instrument is not None):
+            instrument.event("spi_write", write_list[0][0], len(write_list), time.perf_counter() - start_time)
+
+        # Update shadow register cache
+        if (self.use_reg_cache):
+            for reg_addr, data in write_list:
+                if ((reg_addr == BME280_RESET_ADDR) and (data == BME280_SOFT_RESET_COMMAND)):
+                    # Configuration registers return to reset value
+                    for config_addr in BME280_CONFIG_REGS:
+                        self.reg_cache[config_addr] = 0x00
+                elif (reg_addr in BME280_CACHED_REGS):
+                    self.updateRegCache(reg_addr, data)
+
+    def sleep(self, delay):
+        """
+            Method for blocking delay (reported as "sleep" event when
+            instrumentation is enabled)
+            -------------------------------------
+            Parameters
+            delay: Delay time (in second)
+        """
+        if (self.instrument is None):
+            time.sleep(delay)
         else:
-            self.master.write(0x60,0b00_01111110)
-            self.master.write(0x60,0b00_00011110)
-        
-        # Write data to master TX FIFO
-        tx_data  = ((reg_addr & ~0x80) << 8) | data
-        self.master.write(0x68,tx_data)
-        
-        # Set chip select to high (disable slave)
-        self.master.write(0x70,0b1111_1111)
+            start_time = time.perf_counter()
+            time.sleep(delay)
+            self.instrument.event("sleep", None, 0, time.perf_counter() - start_time)
+
+    def beginConfig(self):
+        """
+            Method for starting configuration transaction (register
+            writes are collected until commitConfig is called)
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.config_depth += 1
+
+    def commitConfig(self):
+        """
+            Method for writing collected register updates to sensor
+            (all registers are written in one chip select frame)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Nested transaction is written by outermost commit
+        self.config_depth = max(self.config_depth - 1, 0)
+        if (self.config_depth == 0):
+            self.writePendingConfig()
+
+    def abortConfig(self):
+        """
+            Method for discarding collected register updates
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.config_depth = 0
+        self.pending_writes = {}
+        self.pending_force = set()
+
+    def writePendingConfig(self):
+        """
+            Method for writing collected register updates, ctrl_meas
+            is written last (it applies ctrl_hum and may start normal
+            mode, which can ignore config register writes)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Skip registers which already contain the data
+        pending_writes = self.pending_writes
+        pending_force = self.pending_force
+        self.pending_writes = {}
+        self.pending_force = set()
+        write_list = []
+        for reg_addr in sorted(pending_writes, key=lambda addr: (addr == BME280_CTRL_MEAS_ADDR, addr)):
+            data = pending_writes[reg_addr]
+            if ((reg_addr in pending_force) or not(self.use_reg_cache and (self.reg_cache.get(reg_addr) == data))):
+                write_list.append((reg_addr, data))
+
+        # Write registers to sensor
+        if (len(write_list) > 0):
+            self.SPIBurstWrite(write_list)
+
+    def updateRegCache(self, reg_addr, data):
+        """
+            Method for storing register value to shadow register cache
+            -------------------------------------
+            Parameters
+            reg_addr: SPI slave register address
+            data: Register value
+        """
+        # Sensor returns to sleep mode after forced measurement,
+        # so sleep mode is cached in forced mode
+        if (reg_addr == BME280_CTRL_MEAS_ADDR):
+            sensor_mode = self.getBitsPos(data, BME280_SENSOR_MODE_MSK, BME280_SENSOR_MODE_POS)
+            if ((sensor_mode != BME280_SLEEP_MODE) and (sensor_mode != BME280_NORMAL_MODE)):
+                data = self.setBitsPos(data, BME280_SLEEP_MODE, BME280_SENSOR_MODE_MSK, BME280_SENSOR_MODE_POS)
+        self.reg_cache[reg_addr] = data
+
+    def resync(self):
+        """
+            Method for reloading shadow register cache from sensor
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Clear cache and read cached registers in bursts
+        self.reg_cache.clear()
+        if (self.use_reg_cache):
+            for start_addr, reg_len in BME280_CACHED_REG_RANGES:
+                self.SPIRead(start_addr, reg_len)
 
     def setSensorConfig(self, settings_sel):
         """
@@ -293,10 +645,12 @@ class BME280:
             self.setSleepMode()
         
         # Check whether user wants to change oversampling or filter and standby settings
+        self.beginConfig()
         if (BME_280_OSR_SETTINGS & settings_sel):
             self.setOSRSettings(settings_sel)
         if (BME_280_FILTER_SETTINGS & settings_sel):
             self.setFilterStby(settings_sel)
+        self.commitConfig()
 
     def getSensorConfig(self):
         """
@@ -363,6 +717,23 @@ class BME280:
             Parameters
             -
         """
+        # Run soft reset steps with blocking delay
+        reset_steps = self.softResetSteps()
+        try:
+            while (True):
+                self.sleep(next(reset_steps))
+        except StopIteration as reset_done:
+            return reset_done.value
+
+    def softResetSteps(self):
+        """
+            Generator for performing soft reset on the sensor, yields
+            delay (in second) which must pass before the next step and
+            returns the reset result
+            -------------------------------------
+            Parameters
+            -
+        """
         # Declare variable
         try_count = 5
         # Write self reset command to the sensor
@@ -371,7 +742,7 @@ class BME280:
         # Wait for sensor to reboot
         while(True):
             # Startup time for the sensor is 2ms
-            time.sleep(0.002)
+            yield 0.002
             result = self.SPIRead(BME280_STATUS_REG_ADDR, 1)
 
             # Check sensor condition
@@ -385,6 +756,221 @@ class BME280:
         # Return result
         return result
     
+    def getForcedSensorData(self, comp_sel=BME280_ALL):
+        """
+            Method for performing one forced mode measurement and
+            compensating the fresh data (stored in sensor_data), returns
+            BME280_OK or BME280_E_MEAS_TIMEOUT
+            -------------------------------------
+            Parameters
+            comp_sel: Parameter for selecting which data value to be compensated
+        """
+        # Run measurement steps with blocking delay
+        forced_steps = self.forcedMeasurementSteps(comp_sel)
+        try:
+            while (True):
+                self.sleep(next(forced_steps))
+        except StopIteration as forced_done:
+            return forced_done.value
+
+    def forcedMeasurementSteps(self, comp_sel=BME280_ALL):
+        """
+            Generator for performing one forced mode measurement, yields
+            delay (in second) which must pass before the next step and
+            returns BME280_OK or BME280_E_MEAS_TIMEOUT
+            -------------------------------------
+            Parameters
+            comp_sel: Parameter for selecting which data value to be compensated
+        """
+        # Start measurement (oversampling settings are kept)
+        self.triggerForcedMeasurement()
+
+        # Wait for worst-case conversion time without bus access
+        yield self.maxMeasDelay() / 1000
+
+        # Poll measuring bit with bounded back-off
+        poll_delay = BME280_MEAS_POLL_DELAY
+        for try_count in range(BME280_MEAS_POLL_TRIES):
+            status = self.SPIRead(BME280_STATUS_REG_ADDR, 1)
+            if (not(status[0] & BME280_STATUS_MEASURING)):
+                break
+            yield poll_delay
+            poll_delay = min(poll_delay * 2, BME280_MEAS_POLL_MAX_DELAY)
+        else:
+            return BME280_E_MEAS_TIMEOUT
+
+        # Read and compensate fresh data
+        self.getSensorData(comp_sel)
+        return BME280_OK
+
+    def triggerForcedMeasurement(self):
+        """
+            Method for starting one forced mode measurement (sensor
+            returns to sleep mode after measurement)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Set mode bits of current measurement control register
+        ctrl_meas = self.SPIRead(BME280_CTRL_MEAS_ADDR, 1)
+        new_mode = self.setBitsPos(ctrl_meas[0], BME280_FORCED_MODE, BME280_SENSOR_MODE_MSK, BME280_SENSOR_MODE_POS)
+        # Write result to slave (always written, even if cached value matches)
+        self.SPIWrite(BME280_CTRL_MEAS_ADDR, new_mode, True)
+
+    def streamNormalMode(self, block_len=BME280_STREAM_BLOCK_LEN, sample_num=0):
+        """
+            Generator for reading each normal mode conversion once, reads
+            are phase-locked just after the conversion end and repeated
+            frames are suppressed, yields (timestamps, frames, data) blocks
+            of read times, (N, 8) raw data registers and dictionary of
+            compensated arrays (statistics are stored in stream_stats,
+            previous power mode is restored when stream is closed)
+            -------------------------------------
+            Parameters
+            block_len: Number of samples per yielded block
+            sample_num: Number of samples to be read (0 for endless stream)
+        """
+        # Run stream steps with blocking delay
+        stream_steps = self.streamNormalModeSteps(block_len, sample_num)
+        try:
+            for delay, block_data in stream_steps:
+                if (block_data is None):
+                    self.sleep(delay)
+                else:
+                    yield block_data
+        finally:
+            stream_steps.close()
+
+    def streamNormalModeSteps(self, block_len=BME280_STREAM_BLOCK_LEN, sample_num=0):
+        """
+            Generator for reading each normal mode conversion once, yields
+            (delay, None) when delay (in second) must pass before the next
+            step and (0.0, block_data) for each block (see streamNormalMode)
+            -------------------------------------
+            Parameters
+            block_len: Number of samples per yielded block
+            sample_num: Number of samples to be read (0 for endless stream)
+        """
+        # Reset stream status
+        for key in self.stream_stats:
+            self.stream_stats[key] = 0
+        # Read applied configuration (timing is derived from settings)
+        self.getSensorConfig()
+        # Start normal mode with current settings
+        power_mode = self.getSensorMode()
+        if (power_mode != BME280_NORMAL_MODE):
+            self.setSensorMode(BME280_NORMAL_MODE)
+
+        try:
+            # Declare internal variables
+            timing = self.getNormalModeTiming()
+            period = timing["period"]
+            retry_delay = max(BME280_MEAS_POLL_DELAY, period * BME280_STREAM_RETRY_FRACTION)
+            # Reads start two retry delays after conversion end and drift early until a repeated frame is read
+            read_offset = 2 * retry_delay
+            read_period = period - (retry_delay * BME280_STREAM_DRIFT_FRACTION)
+            last_frame = None
+            duplicate_time = None
+
+            # Lock to end of a running conversion (fall back to current time)
+            conv_end = yield from self.syncConversionEndSteps(timing["meas_time"], period)
+            if (conv_end is None):
+                conv_end = time.monotonic()
+            first_lock = conv_end
+            next_read = conv_end + read_offset
+
+            # Preallocate first block
+            block_times = np.zeros(block_len, dtype=np.float64)
+            block_frames = np.zeros((block_len, BME280_P_T_H_DATA_LEN), dtype=np.uint8)
+            block_idx = 0
+
+            while ((sample_num == 0) or (self.stream_stats["samples"] < sample_num)):
+                # Wait until predicted conversion end
+                delay = next_read - time.monotonic()
+                if (delay > 0):
+                    yield delay, None
+
+                # Skip conversions which have passed while the consumer was busy
+                read_time = time.monotonic()
+                late_periods = int((read_time - next_read) / period)
+                if ((late_periods > 0) and (duplicate_time is None)):
+                    self.stream_stats["missed"] += late_periods
+                    conv_end += late_periods * period
+
+                # Read data registers
+                frame = self.SPIRead(BME280_DATA_ADDR, BME280_P_T_H_DATA_LEN)
+                self.stream_stats["reads"] += 1
+
+                # Conversion hasn't finished yet (frame is accepted as repeated value after half period)
+                if ((frame == last_frame) and ((read_time - conv_end) < (period / 2))):
+                    self.stream_stats["duplicates"] += 1
+                    duplicate_time = read_time
+                    next_read = read_time + retry_delay
+                    continue
+
+                # Correct phase, conversion has ended after the last repeated read
+                if (duplicate_time is not None):
+                    conv_end = duplicate_time
+                    # Update period from all conversions since first lock
+                    conv_num = round((duplicate_time - first_lock) / period)
+                    if (conv_num > 0):
+                        period = (duplicate_time - first_lock) / conv_num
+                        read_period = period - (retry_delay * BME280_STREAM_DRIFT_FRACTION)
+                    duplicate_time = None
+
+                # Store new sample
+                last_frame = frame
+                block_times[block_idx] = read_time
+                block_frames[block_idx] = frame
+                block_idx += 1
+                self.stream_stats["samples"] += 1
+                self.stream_stats["period"] = period
+
+                # Predict next conversion end
+                conv_end += read_period
+                next_read = conv_end + read_offset
+
+                # Return full or last block with compensated data
+                if ((block_idx == block_len) or (self.stream_stats["samples"] == sample_num)):
+                    uncomp_pres, uncomp_temp, uncomp_humid = self.parseSensorDataBatch(block_frames[:block_idx])
+                    yield 0.0, (block_times[:block_idx], block_frames[:block_idx], self.compensateDataBatch(uncomp_pres, uncomp_temp, uncomp_humid))
+
+                    # New block (yielded arrays belong to the consumer)
+                    block_times = np.zeros(block_len, dtype=np.float64)
+                    block_frames = np.zeros((block_len, BME280_P_T_H_DATA_LEN), dtype=np.uint8)
+                    block_idx = 0
+        finally:
+            # Put device back in sleep mode when stream is closed (forced mode ends in sleep mode)
+            if (power_mode != BME280_NORMAL_MODE):
+                self.setSensorMode(BME280_SLEEP_MODE)
+
+    def syncConversionEndSteps(self, meas_time, period):
+        """
+            Generator for waiting for the end of a normal mode conversion
+            (measuring status bit is cleared), yields (delay, None) stream
+            steps and returns earliest conversion end time or None if no
+            conversion is observed within two periods
+            -------------------------------------
+            Parameters
+            meas_time: Measurement time (in second)
+            period: Output data period (in second)
+        """
+        # Declare internal variables
+        timeout = time.monotonic() + (2 * period) + meas_time
+        # Coarse polling can't miss a conversion
+        coarse_delay = max(meas_time / 2, BME280_MEAS_POLL_DELAY)
+        measuring = False
+
+        while (time.monotonic() < timeout):
+            # Wait for measuring bit to be set, then to be cleared
+            status = self.SPIRead(BME280_STATUS_REG_ADDR, 1)
+            if (status[0] & BME280_STATUS_MEASURING):
+                measuring = True
+            elif (measuring):
+                return time.monotonic() - BME280_MEAS_POLL_DELAY
+            yield (BME280_MEAS_POLL_DELAY if (measuring) else coarse_delay), None
+        return None
+
     def getSensorData(self, comp_sel):
         """
             Method for reading data from sensor and compensate the received data
@@ -396,9 +982,75 @@ class BME280:
         pres_temp_data = self.SPIRead(BME280_DATA_ADDR, BME280_P_T_H_DATA_LEN)
         
         # Parse sensor data
+        if (self.instrument is not None):
+            start_time = time.perf_counter()
         self.parseSensorData(pres_temp_data)
+
         # Compensate sensor data
-        self.compensateData(comp_sel)
+        if (self.comp_const is None):
+            self.compensateData(comp_sel)
+        else:
+            pressure, temperature, humidity = self.compensateFloat(self.uncomp_sensor_data["pressure"],
+                                                                   self.uncomp_sensor_data["temperature"],
+                                                                   self.uncomp_sensor_data["humidity"])
+            self.sensor_data["temperature"] = temperature if (comp_sel & (BME280_PRESS | BME280_TEMP | BME280_HUM)) else 0
+            self.sensor_data["pressure"] = pressure if (comp_sel & BME280_PRESS) else 0
+            self.sensor_data["humidity"] = humidity if (comp_sel & BME280_HUM) else 0
+
+        # Report conversion time
+        if (self.instrument is not None):
+            self.instrument.event("getSensorData.compensate", None, 0, time.perf_counter() - start_time)
+
+    def readSensorRecord(self, out=None, index=0):
+        """
+            Method for reading one compensated sample in place into a
+            BME280_SAMPLE_DTYPE record (no dictionary update unless
+            record_dict_view is set), returns the record
+            -------------------------------------
+            Parameters
+            out: BME280_SAMPLE_DTYPE array (default: sensor_record)
+            index: Record index in out array
+        """
+        # Select output record (allocated on first use)
+        if (out is None):
+            if (self.sensor_record is None):
+                self.sensor_record = np.zeros(1, dtype=BME280_SAMPLE_DTYPE)
+            out = self.sensor_record
+        record = out[index]
+
+        # Read the pressure, temperature, and humidity data from the sensor
+        record["timestamp"] = time.monotonic()
+        reg_data = self.SPIRead(BME280_DATA_ADDR, BME280_P_T_H_DATA_LEN)
+
+        # Parse sensor data
+        uncomp_pres = (reg_data[0] << 12) | (reg_data[1] << 4) | (reg_data[2] >> 4)
+        uncomp_temp = (reg_data[3] << 12) | (reg_data[4] << 4) | (reg_data[5] >> 4)
+        uncomp_humid = (reg_data[6] << 8) | reg_data[7]
+
+        # Compensate sensor data
+        if (self.comp_const is None):
+            self.parseSensorData(reg_data)
+            self.compensateData(BME280_ALL)
+            pressure, temperature, humidity = self.sensor_data["pressure"], self.sensor_data["temperature"], self.sensor_data["humidity"]
+        else:
+            pressure, temperature, humidity = self.compensateFloat(uncomp_pres, uncomp_temp, uncomp_humid)
+
+        # Store data into record
+        record["pressure"] = pressure
+        record["temperature"] = temperature
+        record["humidity"] = humidity
+
+        # Update dictionary view
+        if (self.record_dict_view):
+            self.uncomp_sensor_data["pressure"] = uncomp_pres
+            self.uncomp_sensor_data["temperature"] = uncomp_temp
+            self.uncomp_sensor_data["humidity"] = uncomp_humid
+            self.sensor_data["pressure"] = pressure
+            self.sensor_data["temperature"] = temperature
+            self.sensor_data["humidity"] = humidity
+
+        # Return record
+        return record
 
     def parseSensorData(self, reg_data):
         """
@@ -486,6 +1138,41 @@ class BME280:
         # Return value
         return max_meas_delay
 
+    def getNormalModeTiming(self):
+        """
+            Method for getting normal mode timing from current settings,
+            returns dictionary of typical measurement time, standby time,
+            output data period and IIR filter step response time (in second)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Map osr settings to actual osr values
+        osr_setting_map = [0, 1, 2, 4, 8, 16]
+        temp_osr = osr_setting_map[min(self.settings["temp_osr"], 5)]
+        pres_osr = osr_setting_map[min(self.settings["pres_osr"], 5)]
+        humid_osr = osr_setting_map[min(self.settings["humid_osr"], 5)]
+
+        # Calculate typical measurement time (skipped measurements take no time)
+        meas_time = BME280_MEAS_TYP_OFFSET + (BME280_MEAS_TYP_DUR * temp_osr)
+        if (pres_osr):
+            meas_time += (BME280_MEAS_TYP_DUR * pres_osr) + BME280_PRES_HUM_MEAS_TYP_OFFSET
+        if (humid_osr):
+            meas_time += (BME280_MEAS_TYP_DUR * humid_osr) + BME280_PRES_HUM_MEAS_TYP_OFFSET
+        meas_time = meas_time / 1e6
+
+        # Output data period is measurement time + standby time
+        stby_time = BME280_STANDBY_TIME_MAP[self.settings["stby_time"] & 0x07] / 1000
+        period = meas_time + stby_time
+
+        # Return timing
+        return {
+            "meas_time":meas_time,
+            "stby_time":stby_time,
+            "period":period,
+            "filter_response":BME280_FILTER_RESPONSE_MAP[min(self.settings["filter_coef"], 4)] * period
+        }
+
     def setOSRSettings(self, settings_sel):
         """
             Method for setting oversampling rate of the sensor
@@ -515,7 +1202,7 @@ class BME280:
 
         # Write value to ctrl_meas register to update humidity oversampling 
         ctrl_meas = self.SPIRead(BME280_CTRL_MEAS_ADDR, 1)
-        self.SPIWrite(BME280_CTRL_MEAS_ADDR, ctrl_meas[0])
+        self.SPIWrite(BME280_CTRL_MEAS_ADDR, ctrl_meas[0], True)
 
     def setOSRPresTemp(self, settings_sel):
         """
@@ -595,10 +1282,13 @@ class BME280:
             Parameters
             -
         """
+        # Write all settings in one transaction
+        self.beginConfig()
         # Write oversampling settings to sensor
         self.setOSRSettings(BME280_ALL_SETTINGS_SEL)
         # Write filter coefficient and standby time to sensor
         self.setFilterStby(BME280_ALL_SETTINGS_SEL)
+        self.commitConfig()
     
     def compensateTemperature(self):
         """
@@ -612,13 +1302,13 @@ class BME280:
         temp_max = 85
 
         # Perform calculations
-        comp_1 = np.double((self.uncomp_sensor_data["temperature"] / 16384.0) - (np.double(self.calib_data["temp_coef_1"]) / 1024.0))
-        comp_1 = (comp_1 * np.double(self.calib_data["temp_coef_2"]))
-        comp_2 = ((np.double(self.uncomp_sensor_data["temperature"]) / 131072.0) - (np.double(self.calib_data["temp_coef_1"]) / 8192.0))
-        comp_2 = ((comp_2 * comp_2) * np.double(self.calib_data["temp_coef_3"]))
+        comp_1 = float((self.uncomp_sensor_data["temperature"] / 16384.0) - (float(self.calib_data["temp_coef_1"]) / 1024.0))
+        comp_1 = (comp_1 * float(self.calib_data["temp_coef_2"]))
+        comp_2 = ((float(self.uncomp_sensor_data["temperature"]) / 131072.0) - (float(self.calib_data["temp_coef_1"]) / 8192.0))
+        comp_2 = ((comp_2 * comp_2) * float(self.calib_data["temp_coef_3"]))
 
         # Store immediate temperature value
-        self.calib_data["temp_imm"] = np.int32(comp_1 + comp_2)
+        self.calib_data["temp_imm"] = int(comp_1 + comp_2)
         temperature = (comp_1 + comp_2) / 5120.0
 
         # Check temeperature value whether it pass threshold or not
@@ -644,21 +1334,21 @@ class BME280:
         pressure_max = 110000.0
 
         # Perform calculations
-        comp_1 = (np.double(self.calib_data["temp_imm"]) / 2) - 64000.0
-        comp_2 = comp_1 * comp_1 * np.double(self.calib_data["pres_coef_6"]) / 32768.0
-        comp_2 = comp_2 + (comp_1 * np.double(self.calib_data["pres_coef_5"]) * 2.0)
-        comp_2 = (comp_2 / 4.0) + (np.double(self.calib_data["pres_coef_4"]) * 65536.0)
-        comp_3 = (np.double(self.calib_data["pres_coef_3"])) * comp_1 * comp_1 / 524288.0
-        comp_1 = (comp_3 + (np.double(self.calib_data["pres_coef_3"]) * comp_1)) / 524288.0
-        comp_1 = (1.0 + (comp_1 / 32768.0) * np.double(self.calib_data["pres_coef_1"]))
+        comp_1 = (float(self.calib_data["temp_imm"]) / 2) - 64000.0
+        comp_2 = comp_1 * comp_1 * float(self.calib_data["pres_coef_6"]) / 32768.0
+        comp_2 = comp_2 + (comp_1 * float(self.calib_data["pres_coef_5"]) * 2.0)
+        comp_2 = (comp_2 / 4.0) + (float(self.calib_data["pres_coef_4"]) * 65536.0)
+        comp_3 = (float(self.calib_data["pres_coef_3"])) * comp_1 * comp_1 / 524288.0
+        comp_1 = (comp_3 + (float(self.calib_data["pres_coef_2"]) * comp_1)) / 524288.0
+        comp_1 = (1.0 + (comp_1 / 32768.0)) * float(self.calib_data["pres_coef_1"])
 
         # Avoid divide by zero oparation
         if (comp_1 > 0.0):
             pressure = 1048576.0 - self.uncomp_sensor_data["pressure"]
             pressure = (pressure - (comp_2 / 4096)) * 6250.0 / comp_1
-            comp_1 = np.double(self.calib_data["pres_coef_9"]) * pressure * pressure / 2147483648.0
-            comp_2 = pressure * np.double(self.calib_data["pres_coef_8"]) / 32768.0
-            pressure = pressure + (comp_1 + comp_2 + np.double(self.calib_data["pres_coef_7"]) / 16.0)
+            comp_1 = float(self.calib_data["pres_coef_9"]) * pressure * pressure / 2147483648.0
+            comp_2 = pressure * float(self.calib_data["pres_coef_8"]) / 32768.0
+            pressure = pressure + ((comp_1 + comp_2 + float(self.calib_data["pres_coef_7"])) / 16.0)
 
             # Check whether pressure value is passing threshold or not
             if (pressure < pressure_min):
@@ -685,14 +1375,14 @@ class BME280:
         humidity_max = 100.0
 
         # Perform calculations
-        comp_1 = np.double(self.calib_data["temp_imm"]) - 76800.0
-        comp_2 = (np.double(self.calib_data["humid_coef_4"]) * 64.0) + ((np.double(self.calib_data["humid_coef_5"]) / 16384.0) * comp_1)
+        comp_1 = float(self.calib_data["temp_imm"]) - 76800.0
+        comp_2 = (float(self.calib_data["humid_coef_4"]) * 64.0) + ((float(self.calib_data["humid_coef_5"]) / 16384.0) * comp_1)
         comp_3 = self.uncomp_sensor_data["humidity"] - comp_2
-        comp_4 = np.double(self.calib_data["humid_coef_2"]) / 65536.0
-        comp_5 = (1.0 + (np.double(self.calib_data["humid_coef_3"]) / 67108864.0) * comp_1)
-        comp_6 = 1.0 + (np.double(self.calib_data["humid_coef_6"]) / 67108864.0) * comp_1 * comp_5
+        comp_4 = float(self.calib_data["humid_coef_2"]) / 65536.0
+        comp_5 = (1.0 + (float(self.calib_data["humid_coef_3"]) / 67108864.0) * comp_1)
+        comp_6 = 1.0 + (float(self.calib_data["humid_coef_6"]) / 67108864.0) * comp_1 * comp_5
         comp_6 = comp_3 * comp_4 * comp_5 * comp_6
-        humidity = comp_6 * (1.0 - np.double(np.double(self.calib_data["humid_coef_1"])) * comp_6 / 524288.0)
+        humidity = comp_6 * (1.0 - float(self.calib_data["humid_coef_1"]) * comp_6 / 524288.0)
 
         # Check threshold value
         if (humidity > humidity_max):
@@ -705,6 +1395,258 @@ class BME280:
         # Save humidity value
         self.sensor_data["humidity"] = humidity
 
+    def prepareCompensation(self):
+        """
+            Method for folding calibration data into compensation
+            constants (used by compensateFloat and compensateInteger)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Signed coefficients are converted in place (used by all compensation methods)
+        calib = self.signCalibData(self.calib_data)
+
+        # Floating point constants (power of two scaling is exact)
+        self.comp_const = (
+            float(calib["temp_coef_1"]) / 1024.0,
+            float(calib["temp_coef_1"]) / 8192.0,
+            float(calib["temp_coef_2"]),
+            float(calib["temp_coef_3"]),
+            float(calib["pres_coef_1"]),
+            float(calib["pres_coef_3"]) / 524288.0,
+            float(calib["pres_coef_2"]),
+            float(calib["pres_coef_4"]) * 65536.0,
+            float(calib["pres_coef_5"]) * 2.0,
+            float(calib["pres_coef_6"]) / 32768.0,
+            float(calib["pres_coef_7"]) / 16.0,
+            float(calib["pres_coef_8"]) / 524288.0,
+            float(calib["pres_coef_9"]) / 34359738368.0,
+            float(calib["humid_coef_1"]) / 524288.0,
+            float(calib["humid_coef_2"]) / 65536.0,
+            float(calib["humid_coef_3"]) / 67108864.0,
+            float(calib["humid_coef_4"]) * 64.0,
+            float(calib["humid_coef_5"]) / 16384.0,
+            float(calib["humid_coef_6"]) / 67108864.0
+        )
+
+        # Integer constants
+        self.comp_int_const = tuple(int(calib[coef_name]) for coef_name in BME280_CALIB_COEF_NAMES)
+
+    def signCalibData(self, calib_data):
+        """
+            Method for converting signed calibration coefficients of
+            parsed register data to two's complement value (in place,
+            converted data is kept), returns calib_data
+            -------------------------------------
+            Parameters
+            calib_data: Calibration data dictionary
+        """
+        for coef_name, bit_len in BME280_CALIB_SIGNED_COEFS:
+            calib_data[coef_name] = self.signedValue(calib_data[coef_name], bit_len)
+        return calib_data
+
+    def compensateFloat(self, uncomp_pres, uncomp_temp, uncomp_humid):
+        """
+            Method for compensating raw data with precomputed constants
+            (same result as compensateData), returns pressure (Pa),
+            temperature (degC) and humidity (%RH)
+            -------------------------------------
+            Parameters
+            uncomp_pres: Uncompensated pressure data
+            uncomp_temp: Uncompensated temperature data
+            uncomp_humid: Uncompensated humidity data
+        """
+        # Declare variables
+        (t1_1024, t1_8192, t2, t3, p1, p3_s, p2, p4, p5, p6, p7, p8, p9,
+         h1, h2, h3, h4, h5, h6) = self.comp_const
+
+        # Temperature compensation
+        comp_1 = ((uncomp_temp / 16384.0) - t1_1024) * t2
+        comp_2 = (uncomp_temp / 131072.0) - t1_8192
+        comp_2 = (comp_2 * comp_2) * t3
+        temp_imm = float(int(comp_1 + comp_2))
+        temperature = (comp_1 + comp_2) / 5120.0
+        if (temperature < -40):
+            temperature = -40
+        elif (temperature > 85):
+            temperature = 85
+        self.calib_data["temp_imm"] = int(temp_imm)
+
+        # Pressure compensation
+        comp_1 = (temp_imm / 2) - 64000.0
+        comp_2 = comp_1 * comp_1 * p6
+        comp_2 = comp_2 + (comp_1 * p5)
+        comp_2 = (comp_2 / 4.0) + p4
+        comp_3 = p3_s * comp_1 * comp_1
+        comp_1 = (comp_3 + (p2 * comp_1)) / 524288.0
+        comp_1 = (1.0 + (comp_1 / 32768.0)) * p1
+        if (comp_1 > 0.0):
+            pressure = 1048576.0 - uncomp_pres
+            pressure = (pressure - (comp_2 / 4096)) * 6250.0 / comp_1
+            pressure = pressure + ((p9 * pressure * pressure) + (pressure * p8) + p7)
+            if (pressure < 30000.0):
+                pressure = 30000.0
+            elif (pressure > 110000.0):
+                pressure = 110000.0
+        else:
+            pressure = 30000.0
+
+        # Humidity compensation
+        comp_1 = temp_imm - 76800.0
+        comp_3 = uncomp_humid - (h4 + (h5 * comp_1))
+        comp_5 = 1.0 + (h3 * comp_1)
+        comp_6 = 1.0 + h6 * comp_1 * comp_5
+        comp_6 = comp_3 * h2 * comp_5 * comp_6
+        humidity = comp_6 * (1.0 - h1 * comp_6)
+        if (humidity > 100.0):
+            humidity = 100.0
+        elif (humidity < 0.0):
+            humidity = 0.0
+
+        # Return data
+        return pressure, temperature, humidity
+
+    def compensateInteger(self, uncomp_pres, uncomp_temp, uncomp_humid):
+        """
+            Method for compensating raw data using integer-only
+            arithmetic (Bosch 32-bit temperature/humidity and 64-bit
+            pressure fixed-point formulas), returns pressure (Pa),
+            temperature (degC) and humidity (%RH)
+            -------------------------------------
+            Parameters
+            uncomp_pres: Uncompensated pressure data
+            uncomp_temp: Uncompensated temperature data
+            uncomp_humid: Uncompensated humidity data
+        """
+        # Declare variables
+        (t1, t2, t3, p1, p2, p3, p4, p5, p6, p7, p8, p9,
+         h1, h2, h3, h4, h5, h6) = self.comp_int_const
+
+        # Temperature compensation (resolution 0.01 degC)
+        var_1 = ((((uncomp_temp >> 3) - (t1 << 1))) * t2) >> 11
+        var_2 = (((((uncomp_temp >> 4) - t1) * ((uncomp_temp >> 4) - t1)) >> 12) * t3) >> 14
+        temp_imm = var_1 + var_2
+        temperature = ((temp_imm * 5) + 128) >> 8
+        temperature = min(max(temperature, -4000), 8500)
+
+        # Pressure compensation (Q24.8 format)
+        var_1 = temp_imm - 128000
+        var_2 = var_1 * var_1 * p6
+        var_2 = var_2 + ((var_1 * p5) << 17)
+        var_2 = var_2 + (p4 << 35)
+        var_1 = ((var_1 * var_1 * p3) >> 8) + ((var_1 * p2) << 12)
+        var_1 = (((1 << 47) + var_1) * p1) >> 33
+        if (var_1 != 0):
+            pressure = 1048576 - uncomp_pres
+            pressure = ((pressure << 31) - var_2) * 3125
+            # Division is truncated toward zero
+            if ((pressure < 0) != (var_1 < 0)):
+                pressure = -(abs(pressure) // abs(var_1))
+            else:
+                pressure = abs(pressure) // abs(var_1)
+            var_1 = (p9 * (pressure >> 13) * (pressure >> 13)) >> 25
+            var_2 = (p8 * pressure) >> 19
+            pressure = ((pressure + var_1 + var_2) >> 8) + (p7 << 4)
+            pressure = min(max(pressure, 30000 * 256), 110000 * 256)
+        else:
+            pressure = 30000 * 256
+
+        # Humidity compensation (Q22.10 format)
+        var_1 = temp_imm - 76800
+        var_1 = (((((uncomp_humid << 14) - (h4 << 20) - (h5 * var_1)) + 16384) >> 15) *
+                 (((((((var_1 * h6) >> 10) * (((var_1 * h3) >> 11) + 32768)) >> 10) + 2097152) * h2 + 8192) >> 14))
+        var_1 = var_1 - (((((var_1 >> 15) * (var_1 >> 15)) >> 7) * h1) >> 4)
+        var_1 = min(max(var_1, 0), 419430400)
+        humidity = var_1 >> 12
+
+        # Return data
+        return pressure / 256.0, temperature / 100.0, humidity / 1024.0
+
+    def parseSensorDataBatch(self, reg_data):
+        """
+            Method for parsing batch of raw sensor data, returns arrays
+            of uncompensated pressure, temperature and humidity data
+            -------------------------------------
+            Parameters
+            reg_data: (N, 8) array of data registers (BME280_DATA_ADDR
+            to BME280_DATA_ADDR + 7)
+        """
+        # Convert register data
+        reg_data = np.asarray(reg_data, dtype=np.int32)
+
+        # Parse pressure, temperature and humidity data
+        uncomp_pres = (reg_data[:, 0] << 12) | (reg_data[:, 1] << 4) | (reg_data[:, 2] >> 4)
+        uncomp_temp = (reg_data[:, 3] << 12) | (reg_data[:, 4] << 4) | (reg_data[:, 5] >> 4)
+        uncomp_humid = (reg_data[:, 6] << 8) | reg_data[:, 7]
+
+        # Return data
+        return uncomp_pres, uncomp_temp, uncomp_humid
+
+    def compensateDataBatch(self, uncomp_pres, uncomp_temp, uncomp_humid, calib_data=None):
+        """
+            Method for compensating arrays of raw data reading from sensor
+            (same calculation and limits as compensateData), returns
+            dictionary of pressure, temperature and humidity arrays
+            -------------------------------------
+            Parameters
+            uncomp_pres: Array of uncompensated pressure data
+            uncomp_temp: Array of uncompensated temperature data
+            uncomp_humid: Array of uncompensated humidity data
+            calib_data: Calibration data snapshot (default: current calib_data)
+        """
+        # Use current calibration data if no snapshot is given
+        if (calib_data is None):
+            calib_data = self.calib_data
+        calib_data = self.signCalibData(dict(calib_data))
+
+        # Convert raw data
+        uncomp_pres = np.asarray(uncomp_pres, dtype=np.double)
+        uncomp_temp = np.asarray(uncomp_temp, dtype=np.double)
+        uncomp_humid = np.asarray(uncomp_humid, dtype=np.double)
+
+        # Temperature compensation
+        comp_1 = (uncomp_temp / 16384.0) - (calib_data["temp_coef_1"] / 1024.0)
+        comp_1 = comp_1 * calib_data["temp_coef_2"]
+        comp_2 = (uncomp_temp / 131072.0) - (calib_data["temp_coef_1"] / 8192.0)
+        comp_2 = (comp_2 * comp_2) * calib_data["temp_coef_3"]
+        temp_imm = (comp_1 + comp_2).astype(np.int32).astype(np.double)
+        temperature = np.clip((comp_1 + comp_2) / 5120.0, -40, 85)
+
+        # Pressure compensation
+        comp_1 = (temp_imm / 2) - 64000.0
+        comp_2 = comp_1 * comp_1 * calib_data["pres_coef_6"] / 32768.0
+        comp_2 = comp_2 + (comp_1 * calib_data["pres_coef_5"] * 2.0)
+        comp_2 = (comp_2 / 4.0) + (calib_data["pres_coef_4"] * 65536.0)
+        comp_3 = calib_data["pres_coef_3"] * comp_1 * comp_1 / 524288.0
+        comp_1 = (comp_3 + (calib_data["pres_coef_2"] * comp_1)) / 524288.0
+        comp_1 = (1.0 + (comp_1 / 32768.0)) * calib_data["pres_coef_1"]
+        # Avoid divide by zero oparation
+        valid = comp_1 > 0.0
+        pressure = 1048576.0 - uncomp_pres
+        pressure = (pressure - (comp_2 / 4096)) * 6250.0 / np.where(valid, comp_1, 1.0)
+        comp_1 = calib_data["pres_coef_9"] * pressure * pressure / 2147483648.0
+        comp_2 = pressure * calib_data["pres_coef_8"] / 32768.0
+        pressure = pressure + ((comp_1 + comp_2 + calib_data["pres_coef_7"]) / 16.0)
+        pressure = np.where(valid, np.clip(pressure, 30000.0, 110000.0), 30000.0)
+
+        # Humidity compensation
+        comp_1 = temp_imm - 76800.0
+        comp_2 = (calib_data["humid_coef_4"] * 64.0) + ((calib_data["humid_coef_5"] / 16384.0) * comp_1)
+        comp_3 = uncomp_humid - comp_2
+        comp_4 = calib_data["humid_coef_2"] / 65536.0
+        comp_5 = (1.0 + (calib_data["humid_coef_3"] / 67108864.0) * comp_1)
+        comp_6 = 1.0 + (calib_data["humid_coef_6"] / 67108864.0) * comp_1 * comp_5
+        comp_6 = comp_3 * comp_4 * comp_5 * comp_6
+        humidity = comp_6 * (1.0 - calib_data["humid_coef_1"] * comp_6 / 524288.0)
+        humidity = np.clip(humidity, 0.0, 100.0)
+
+        # Return data
+        return {
+            "pressure":pressure,
+            "temperature":temperature,
+            "humidity":humidity
+        }
+
     def getCalibData(self):
         """
             Method for getting calibration data from sensor and parse the data
@@ -720,6 +1662,13 @@ class BME280:
         humid_calib = self.SPIRead(BME280_HUMIDITY_CALIB_DATA_ADDR, BME280_HUMIDITY_CALIB_DATA_LEN)
         self.parseHumidCalib(humid_calib)
 
+        # Precompute compensation constants
+        self.prepareCompensation()
+
+        # Persist calibration
+        if (self.cache is not None):
+            self.cache.store(self)
+
     def parseTempPressCalib(self, reg_data):
         """
             Method for parsing sensor configuration data
@@ -789,4 +1738,17 @@ class BME280:
             lsb_data: 8 bit lsb data
         """
         result = (msb_data << 8) | lsb_data
-        return result
\ No newline at end of file
+        return result
+
+    def signedValue(self, data, bit_len):
+        """
+            Method for converting unsigned data to two's complement value
+            -------------------------------------
+            Parameters
+            data: Unsigned data
+            bit_len: Bit length of the data
+        """
+        data = int(data) & ((1 << bit_len) - 1)
+        if (data >> (bit_len - 1)):
+            data -= (1 << bit_len)
+        return data
\ No newline at end of file
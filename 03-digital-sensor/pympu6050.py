@@ -8,7 +8,7 @@
 # 
 #  Create Date       : 03/16/2020
 #  File Name         : pympu6050.py
-#  Module Dependency : -
+#  Module Dependency : pysensorimport.py
 #  
 #  Tool Version      : -
 #  
@@ -21,9 +21,15 @@
 #                         Import Library                          #
 ###################################################################
 import time
-import cffi
+import struct
+import threading
 import math
-import numpy as np
+from pysensorimport import lazyImport
+
+# Heavy dependencies are loaded by first use (cffi by first driver instance for
+# its I2C transfer buffer, numpy by FIFO, batch conversion and records)
+cffi = lazyImport("cffi")
+np = lazyImport("numpy")
 
 ###################################################################
 #                     Constants Declaration                       #
@@ -45,6 +51,7 @@ MPU6050_REG_GYRO_YOFFS_H      = 0x15
 MPU6050_REG_GYRO_YOFFS_L      = 0x16
 MPU6050_REG_GYRO_ZOFFS_H      = 0x17
 MPU6050_REG_GYRO_ZOFFS_L      = 0x18
+MPU6050_REG_SMPLRT_DIV        = 0x19
 MPU6050_REG_CONFIG            = 0x1A
 MPU6050_REG_GYRO_CONFIG       = 0x1B
 MPU6050_REG_ACCEL_CONFIG      = 0x1C 
@@ -54,6 +61,7 @@ MPU6050_REG_MOT_THRESHOLD     = 0x1F
 MPU6050_REG_MOT_DURATION      = 0x20
 MPU6050_REG_ZMOT_THRESHOLD    = 0x21
 MPU6050_REG_ZMOT_DURATION     = 0x22
+MPU6050_REG_FIFO_EN           = 0x23
 MPU6050_REG_INT_PIN_CFG       = 0x37 
 MPU6050_REG_INT_ENABLE        = 0x38 
 MPU6050_REG_INT_STATUS        = 0x3A
@@ -75,6 +83,9 @@ MPU6050_REG_MOT_DETECT_STATUS = 0x61
 MPU6050_REG_MOT_DETECT_CTRL   = 0x69
 MPU6050_REG_USER_CTRL         = 0x6A 
 MPU6050_REG_PWR_MGMT_1        = 0x6B 
+MPU6050_REG_FIFO_COUNT_H      = 0x72
+MPU6050_REG_FIFO_COUNT_L      = 0x73
+MPU6050_REG_FIFO_R_W          = 0x74
 MPU6050_REG_WHO_AM_I          = 0x75 
 
 # Macro for Configuring Clock Settings
@@ -95,6 +106,10 @@ MPU6050_DLPF_2                = 0b010
 MPU6050_DLPF_1                = 0b001
 MPU6050_DLPF_0                = 0b000
 
+# Gyroscope output rate (DLPF disabled / enabled)
+MPU6050_GYRO_RATE_DLPF_OFF    = 8000.0
+MPU6050_GYRO_RATE_DLPF_ON     = 1000.0
+
 # Macro for configuring high pass filter settings
 MPU6050_DHPF_HOLD             = 0b111
 MPU6050_DHPF_0_63HZ           = 0b100
@@ -121,26 +136,107 @@ MPU6050_RANGE_8G              = 0b10
 MPU6050_RANGE_4G              = 0b01
 MPU6050_RANGE_2G              = 0b00
 
+# Size of I2C transfer buffer (maximum bytes per burst transaction)
+MPU6050_I2C_BUFFER_LEN        = 32
+
+# Size of motion data block (ACCEL_XOUT_H to GYRO_ZOUT_L)
+MPU6050_MOTION_DATA_LEN       = 14
+
+# Maximum bytes per AXI IIC receive (dynamic mode length is 8-bit)
+MPU6050_I2C_MAX_BURST_LEN     = 255
+
+# Macros for selecting FIFO channels (FIFO_EN register)
+MPU6050_FIFO_TEMP             = 0b10000000
+MPU6050_FIFO_XGYRO            = 0b01000000
+MPU6050_FIFO_YGYRO            = 0b00100000
+MPU6050_FIFO_ZGYRO            = 0b00010000
+MPU6050_FIFO_GYRO             = 0b01110000
+MPU6050_FIFO_ACCEL            = 0b00001000
+MPU6050_FIFO_ALL              = 0b11111000
+
+# Size of MPU6050 FIFO buffer
+MPU6050_FIFO_SIZE             = 1024
+
+# FIFO drain capacity of 400 kHz I2C bus (bytes/s, with transaction and host overhead)
+MPU6050_I2C_DRAIN_RATE        = 20000
+
+# Maximum number of FIFO overflows before gyroscope calibration fails
+MPU6050_CALIB_MAX_OVERFLOWS   = 3
+
+# Standard gravity (m/s^2)
+MPU6050_GRAVITY               = 9.80665
+
+# Motion sample record (raw signed accelerometer and gyroscope data, temperature in degC)
+# (dtype spec, so numpy isn't loaded at import)
+MPU6050_MOTION_DTYPE          = [("timestamp", "f8"),
+                                 ("accel", "i2", (3,)),
+                                 ("temperature", "f4"),
+                                 ("gyro", "i2", (3,))]
+
+# Configuration registers kept in shadow register cache (start address, length)
+MPU6050_CACHED_REG_RANGES     = ((MPU6050_REG_ACCEL_XOFFS_H, 6),
+                                 (MPU6050_REG_GYRO_XOFFS_H, 6),
+                                 (MPU6050_REG_SMPLRT_DIV, 11),
+                                 (MPU6050_REG_INT_PIN_CFG, 2),
+                                 (MPU6050_REG_MOT_DETECT_CTRL, 3))
+MPU6050_CACHED_REGS           = frozenset(reg_addr for start_addr, reg_len in MPU6050_CACHED_REG_RANGES
+                                          for reg_addr in range(start_addr, start_addr + reg_len))
+
+# Self-clearing bits of cached registers (reset bits)
+MPU6050_SELF_CLEAR_BITS       = {
+    MPU6050_REG_USER_CTRL:0b00000111,
+    MPU6050_REG_PWR_MGMT_1:0b10000000
+}
 
 ###################################################################
 #                      Function Declaration                       #
 ###################################################################
-# Call FFI function
-ffi = cffi.FFI()
+# FFI instance (created by loadFFI, building it imports the C parser)
+ffi = None
+
+def loadFFI():
+    """
+        Function for getting shared FFI instance, created on first call
+        -------------------------------------
+        Parameters
+        -
+    """
+    global ffi
+    if (ffi is None):
+        ffi = cffi.FFI()
+    return ffi
 
 class MPU6050:
-    def __init__(self, master, sensor_scale, sensor_range):
+    def __init__(self, master, sensor_scale, sensor_range, slv_addr=MPU6050_I2C_ADDR_PRIM, cache=None):
         """
             Create a new driver for MPU6050 sensor
             -------------------------------------
             Parameters
             master: I2C master instance (AXIIIC Module)
-            slv_addr: I2C slave address 
+            sensor_scale: Gyroscope full scale setting
+            sensor_range: Accelerometer full scale setting
+            slv_addr: I2C slave address (MPU6050_I2C_ADDR_PRIM or MPU6050_I2C_ADDR_SEC)
+            cache: Persisted calibration cache (e.g. SensorCache), gyroscope
+            calibration is restored at startup and stored after calibration
         """
         # Initialize sensor
         self.master = master
-        self.slv_addr = MPU6050_I2C_ADDR_PRIM
-        self.buffer = ffi.new("unsigned char [32]")
+        self.slv_addr = slv_addr
+        self.buffer = loadFFI().new("unsigned char []", MPU6050_I2C_BUFFER_LEN)
+
+        # Shadow register cache for configuration registers
+        self.use_reg_cache = True
+        self.reg_cache = {}
+
+        # Pending register writes of configuration transaction
+        self.config_depth = 0
+        self.pending_writes = {}
+
+        # Instrumentation (e.g. SensorInstrument, None disables timing)
+        self.instrument = None
+
+        # Persisted calibration cache
+        self.cache = cache
         
         # Declare dictionary for storing status and data
         # Raw accelerometer and gyroscope data
@@ -198,13 +294,39 @@ class MPU6050:
         }
 
         # Internal config variables
+        self.temperature = 0.0
         self.use_calibrate = False
+        self.fifo_channels = 0
+        self.fifo_frame_len = 0
+        self.fifo_overflow_count = 0
+        self.dlpf_mode = MPU6050_DLPF_0
+        self.smplrt_div = 0
+        self.sample_rate = MPU6050_GYRO_RATE_DLPF_OFF
+
+        # Data ready interrupt status
+        self.int_stats = {
+            "events":0,
+            "timeouts":0
+        }
+
+        # Acquisition scheduler status
+        self.schedule_stats = {}
+        self.resetScheduleStats()
         self.actual_threshold = 0
         self.dps_per_digit = 0.0
         self.range_per_digit = 0.0
 
+        # Gyroscope calibration statistics (calibrateGyroSteps)
+        self.resetGyroCalibration()
+
+        # Motion record and receive buffer (allocated by first readMotionRecord)
+        self.motion_record = None
+        # Update raw_accel, raw_gyro and temperature from readMotionRecord
+        self.record_dict_view = False
+
         # Read chip ID
         chip_id = self.I2CRead(MPU6050_REG_WHO_AM_I, 1)
+        self.chip_id = chip_id[0]
         
         # Check chip validity
         if (chip_id[0] == 0x98):
@@ -214,6 +336,14 @@ class MPU6050:
             print("Chip ID: {}".format(hex(chip_id[0])))
             return
 
+        # Load configuration registers into shadow register cache
+        self.resync()
+        # Output data rate of current sensor configuration
+        self.loadSampleRate()
+
+        # Write initial configuration in one transaction
+        self.beginConfig()
+
         # Set clock source
         self.setSensorClock(MPU6050_CLOCK_PLL_XGYRO)
 
@@ -224,38 +354,106 @@ class MPU6050:
         # Disable sleep mode
         self.setSleepMode(False)
 
+        # Write configuration to sensor
+        self.commitConfig()
+
+        # Restore gyroscope calibration from persisted cache
+        if (self.cache is not None):
+            self.cache.load(self)
+
     def I2CRead(self, reg_addr, len):
         """
             Method for reading from I2C slave
             -------------------------------------
             Parameters
             reg_addr: I2C slave register address 
+            len: Number of bytes to be read
         """
+        # Serve configuration registers from pending writes and shadow register cache
+        if ((reg_addr in MPU6050_CACHED_REGS) or (reg_addr in self.pending_writes)):
+            receive_buffer = [self.pending_writes.get(addr, self.reg_cache.get(addr) if self.use_reg_cache else None)
+                              for addr in range(reg_addr, reg_addr + len)]
+            if (None not in receive_buffer):
+                return receive_buffer
+
         # Declare internal variable
-        count = 0
         receive_buffer = []
         slave_reg_addr = reg_addr
+        remaining = len
 
-        # Send command to slave
-        while (count < len):
-            self.buffer[0] = slave_reg_addr
-            self.master.send(self.slv_addr, self.buffer, 1, 1)
-            self.master.receive(self.slv_addr, self.buffer, 1)
-            self.master.wait()
+        # Read data in bursts (one transaction per buffer length)
+        while (remaining > 0):
+            burst_len = min(remaining, MPU6050_I2C_BUFFER_LEN)
+            self.I2CBurstRead(slave_reg_addr, burst_len)
 
-            # Clear interrupt register
-            self.master.write(0x20, self.master.read(0x20))
-            
             # Append data to received buffer
-            receive_buffer.append(self.buffer[0])
-            
-            # Increment counter and address
-            count += 1
-            slave_reg_addr += 1
+            receive_buffer.extend(ffi.unpack(self.buffer, burst_len))
+
+            # Decrement counter and increment address
+            remaining -= burst_len
+            slave_reg_addr += burst_len
+
+        # Store configuration registers to shadow register cache
+        if (self.use_reg_cache):
+            for i in range(len):
+                if ((reg_addr + i) in MPU6050_CACHED_REGS):
+                    self.updateRegCache(reg_addr + i, receive_buffer[i])
+
+        # Pending writes overwrite data read from sensor
+        if (self.pending_writes):
+            for i in range(len):
+                if ((reg_addr + i) in self.pending_writes):
+                    receive_buffer[i] = self.pending_writes[reg_addr + i]
         
         # Return value
         return receive_buffer
 
+    def I2CBurstRead(self, reg_addr, read_len, rx_buffer=None):
+        """
+            Method for reading consecutive registers from I2C slave
+            in a single repeated-start transaction (the sensor
+            auto-increments its register pointer)
+            -------------------------------------
+            Parameters
+            reg_addr: I2C slave register address (first register)
+            read_len: Number of bytes to be read
+            rx_buffer: cffi buffer for received data (default: transfer buffer,
+            max MPU6050_I2C_BUFFER_LEN bytes)
+        """
+        # Use transfer buffer if no receive buffer is given
+        if (rx_buffer is None):
+            rx_buffer = self.buffer
+
+        # Instrumentation timestamps (skipped when disabled)
+        instrument = self.instrument
+        if (instrument is not None):
+            start_time = time.perf_counter()
+
+        # Set register pointer without stop condition (repeated start)
+        self.buffer[0] = reg_addr
+        self.master.send(self.slv_addr, self.buffer, 1, 1)
+        # Receive all bytes into receive buffer
+        self.master.receive(self.slv_addr, rx_buffer, read_len)
+        if (instrument is not None):
+            transfer_time = time.perf_counter()
+        self.master.wait()
+        if (instrument is not None):
+            wait_time = time.perf_counter()
+
+        # Clear interrupt register
+        self.master.write(0x20, self.master.read(0x20))
+
+        # Report transfer phases
+        if (instrument is not None):
+            end_time = time.perf_counter()
+            instrument.event("i2c_read.transfer", reg_addr, read_len, transfer_time - start_time)
+            instrument.event("i2c_read.wait", reg_addr, read_len, wait_time - transfer_time)
+            instrument.event("i2c_read.irq_clear", reg_addr, read_len, end_time - wait_time)
+            instrument.event("i2c_read", reg_addr, read_len, end_time - start_time)
+
+        # Return view of received bytes (no copy)
+        return ffi.buffer(rx_buffer, read_len)
+
     def I2CWrite(self, reg_addr, data):
         """
             Method for writing to I2C slave
@@ -264,14 +462,152 @@ class MPU6050:
             reg_addr: I2C slave register address
             data: Data to be written to I2C slave
         """
+        # Record write if configuration transaction is active
+        if (self.config_depth > 0):
+            self.pending_writes[reg_addr] = data
+            return
+
+        # Skip write if register already contains the data
+        if (self.use_reg_cache and (self.reg_cache.get(reg_addr) == data)):
+            return
+
+        # Send data to slave
+        self.I2CBurstWrite(reg_addr, [data])
+
+    def I2CBurstWrite(self, reg_addr, data):
+        """
+            Method for writing consecutive registers of I2C slave
+            in a single transaction (the sensor auto-increments its
+            register pointer)
+            -------------------------------------
+            Parameters
+            reg_addr: I2C slave register address (first register)
+            data: List of data to be written (max MPU6050_I2C_BUFFER_LEN - 1)
+        """
+        # Instrumentation timestamps (skipped when disabled)
+        instrument = self.instrument
+        if (instrument is not None):
+            start_time = time.perf_counter()
+
         # Send data to slave
         self.buffer[0] = reg_addr
-        self.buffer[1] = data
-        self.master.send(self.slv_addr, self.buffer, 2)
+        for i in range(len(data)):
+            self.buffer[i + 1] = data[i]
+        self.master.send(self.slv_addr, self.buffer, len(data) + 1)
+        if (instrument is not None):
+            transfer_time = time.perf_counter()
         self.master.wait()
+        if (instrument is not None):
+            wait_time = time.perf_counter()
 
         # Clear interrupt register
         self.master.write(0x20, self.master.read(0x20))
+
+        # Report transfer phases
+        if (instrument is not None):
+            end_time = time.perf_counter()
+            instrument.event("i2c_write.transfer", reg_addr, len(data), transfer_time - start_time)
+            instrument.event("i2c_write.wait", reg_addr, len(data), wait_time - transfer_time)
+            instrument.event("i2c_write.irq_clear", reg_addr, len(data), end_time - wait_time)
+            instrument.event("i2c_write", reg_addr, len(data), end_time - start_time)
+
+        # Update shadow register cache
+        if (self.use_reg_cache):
+            for i in range(len(data)):
+                if ((reg_addr + i) in MPU6050_CACHED_REGS):
+                    self.updateRegCache(reg_addr + i, data[i])
+
+    def sleep(self, delay):
+        """
+            Method for blocking delay (reported as "sleep" event when
+            instrumentation is enabled)
+            -------------------------------------
+            Parameters
+            delay: Delay time (in second)
+        """
+        if (self.instrument is None):
+            time.sleep(delay)
+        else:
+            start_time = time.perf_counter()
+            time.sleep(delay)
+            self.instrument.event("sleep", None, 0, time.perf_counter() - start_time)
+
+    def beginConfig(self):
+        """
+            Method for starting configuration transaction (register
+            writes are collected until commitConfig is called)
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.config_depth += 1
+
+    def commitConfig(self):
+        """
+            Method for writing collected register updates to sensor
+            (contiguous registers are written in one burst)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Nested transaction is written by outermost commit
+        self.config_depth = max(self.config_depth - 1, 0)
+        if (self.config_depth > 0):
+            return
+
+        # Skip registers which already contain the data
+        pending_writes = self.pending_writes
+        self.pending_writes = {}
+        reg_list = [reg_addr for reg_addr in sorted(pending_writes)
+                    if not(self.use_reg_cache and (self.reg_cache.get(reg_addr) == pending_writes[reg_addr]))]
+
+        # Write groups of contiguous registers
+        group_addr = []
+        for reg_addr in reg_list:
+            if ((len(group_addr) > 0) and ((reg_addr != group_addr[-1] + 1) or (len(group_addr) >= MPU6050_I2C_BUFFER_LEN - 1))):
+                self.I2CBurstWrite(group_addr[0], [pending_writes[addr] for addr in group_addr])
+                group_addr = []
+            group_addr.append(reg_addr)
+        if (len(group_addr) > 0):
+            self.I2CBurstWrite(group_addr[0], [pending_writes[addr] for addr in group_addr])
+
+    def abortConfig(self):
+        """
+            Method for discarding collected register updates
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.config_depth = 0
+        self.pending_writes = {}
+
+    def updateRegCache(self, reg_addr, data):
+        """
+            Method for storing register value to shadow register cache
+            -------------------------------------
+            Parameters
+            reg_addr: I2C slave register address
+            data: Register value
+        """
+        # Device reset restores default value of all registers
+        if ((reg_addr == MPU6050_REG_PWR_MGMT_1) and (data & 0b10000000)):
+            self.reg_cache.clear()
+            return
+        # Self-clearing bits always read back as zero
+        self.reg_cache[reg_addr] = data & ~MPU6050_SELF_CLEAR_BITS.get(reg_addr, 0)
+
+    def resync(self):
+        """
+            Method for reloading shadow register cache from sensor
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Clear cache and read configuration registers in bursts
+        self.reg_cache.clear()
+        if (self.use_reg_cache):
+            for start_addr, reg_len in MPU6050_CACHED_REG_RANGES:
+                self.I2CRead(start_addr, reg_len)
     
     def readRegisterBit(self, reg_addr, bit_pos):
         """
@@ -453,6 +789,175 @@ class MPU6050:
         # Write data to sensor
         self.I2CWrite(MPU6050_REG_CONFIG, new_setting)
 
+        # Gyroscope output rate depends on low pass filter setting
+        self.dlpf_mode = dlpf_mode
+        self.calcSampleRate()
+
+    def calcSampleRate(self):
+        """
+            Method for calculating output data rate from low pass
+            filter mode and sample rate divider (in Hz)
+            ----------------------------------------------
+            Parameters
+            -
+        """
+        # Gyroscope output rate is 8 kHz when low pass filter is disabled
+        if ((self.dlpf_mode == MPU6050_DLPF_0) or (self.dlpf_mode == 0b111)):
+            gyro_rate = MPU6050_GYRO_RATE_DLPF_OFF
+        else:
+            gyro_rate = MPU6050_GYRO_RATE_DLPF_ON
+        # Calculate sample rate
+        self.sample_rate = gyro_rate / (1 + self.smplrt_div)
+        # Return data
+        return self.sample_rate
+
+    def loadSampleRate(self):
+        """
+            Method for reading low pass filter mode and sample rate
+            divider from sensor and calculating output data rate (in Hz)
+            ----------------------------------------------
+            Parameters
+            -
+        """
+        # Read data from sensor
+        current_setting = self.I2CRead(MPU6050_REG_CONFIG, 1)
+        self.dlpf_mode = current_setting[0] & 0b00000111
+        self.smplrt_div = self.getSampleRateDivider()
+        # Calculate sample rate
+        return self.calcSampleRate()
+
+    def getSampleRateDivider(self):
+        """
+            Method for getting sample rate divider value
+            ----------------------------------------------
+            Parameters
+            -
+        """
+        # Read data from sensor
+        current_data = self.I2CRead(MPU6050_REG_SMPLRT_DIV, 1)
+        smplrt_div = current_data[0]
+        # Return data
+        return smplrt_div
+
+    def setSampleRateDivider(self, smplrt_div):
+        """
+            Method for setting sample rate divider value
+            (sample rate = gyroscope output rate / (1 + smplrt_div))
+            ----------------------------------------------
+            Parameters
+            smplrt_div: Sample rate divider value (0 - 255)
+        """
+        # Write data to sensor
+        self.I2CWrite(MPU6050_REG_SMPLRT_DIV, smplrt_div)
+        # Update internal config
+        self.smplrt_div = smplrt_div
+        self.calcSampleRate()
+
+    def setSampleRate(self, sample_rate):
+        """
+            Method for setting output data rate (in Hz), the nearest
+            rate supported by the divider is used and returned
+            ----------------------------------------------
+            Parameters
+            sample_rate: Desired output data rate (in Hz)
+        """
+        # Calculate divider from gyroscope output rate
+        self.smplrt_div = 0
+        gyro_rate = self.calcSampleRate()
+        smplrt_div = int(round(gyro_rate / sample_rate)) - 1
+        smplrt_div = min(max(smplrt_div, 0), 255)
+
+        # Write data to sensor
+        self.setSampleRateDivider(smplrt_div)
+        # Return actual sample rate
+        return self.sample_rate
+
+    def resetScheduleStats(self):
+        """
+            Method for resetting acquisition scheduler status
+            ----------------------------------------------
+            Parameters
+            -
+        """
+        self.schedule_stats["samples"] = 0
+        self.schedule_stats["missed_deadlines"] = 0
+        self.schedule_stats["skipped_samples"] = 0
+        self.schedule_stats["period"] = 0.0
+        self.schedule_stats["last_jitter"] = 0.0
+        self.schedule_stats["max_jitter"] = 0.0
+        self.schedule_stats["mean_jitter"] = 0.0
+
+    def streamMotion(self, sample_num=0):
+        """
+            Generator for reading one motion sample per output data
+            rate period (deadline schedule, periods which have already
+            passed are skipped), yields (read time, raw_accel,
+            temperature, raw_gyro) (statistics are stored in
+            schedule_stats, jitter in second)
+            ----------------------------------------------
+            Parameters
+            sample_num: Number of samples to be read (0 for endless stream)
+        """
+        # Run stream steps with blocking delay
+        stream_steps = self.streamMotionSteps(sample_num)
+        try:
+            for delay, motion_data in stream_steps:
+                if (motion_data is None):
+                    self.sleep(delay)
+                else:
+                    yield motion_data
+        finally:
+            stream_steps.close()
+
+    def streamMotionSteps(self, sample_num=0):
+        """
+            Generator for reading one motion sample per output data
+            rate period, yields (delay, None) when delay (in second)
+            must pass before the next step and (0.0, motion_data) for
+            each sample (see streamMotion)
+            ----------------------------------------------
+            Parameters
+            sample_num: Number of samples to be read (0 for endless stream)
+        """
+        # Reset scheduler status
+        self.resetScheduleStats()
+        jitter_sum = 0.0
+
+        # Declare internal variables (deadlines from configured output data rate)
+        period = 1.0 / self.sample_rate
+        self.schedule_stats["period"] = period
+        start_time = time.monotonic()
+        sample_idx = 0
+
+        while ((sample_num == 0) or (self.schedule_stats["samples"] < sample_num)):
+            # Wait until next deadline
+            deadline = start_time + (sample_idx * period)
+            delay = deadline - time.monotonic()
+            if (delay > 0):
+                yield delay, None
+
+            # Read one motion sample
+            read_time = time.monotonic()
+            motion_data = self.readMotion()
+
+            # Update jitter statistics (read time after deadline)
+            jitter = read_time - deadline
+            jitter_sum += jitter
+            self.schedule_stats["samples"] += 1
+            self.schedule_stats["last_jitter"] = jitter
+            self.schedule_stats["max_jitter"] = max(self.schedule_stats["max_jitter"], jitter)
+            self.schedule_stats["mean_jitter"] = jitter_sum / self.schedule_stats["samples"]
+
+            # Return data with its read time
+            yield 0.0, (read_time,) + motion_data
+
+            # Skip sample periods which have passed while the consumer was busy
+            late_periods = int((time.monotonic() - deadline) / period)
+            if (late_periods > 0):
+                self.schedule_stats["missed_deadlines"] += 1
+                self.schedule_stats["skipped_samples"] += late_periods
+            sample_idx += 1 + late_periods
+
     def getSleepMode(self):
         """
             Method for getting sensor sleep mode status
@@ -762,6 +1267,96 @@ class MPU6050:
         # Return data
         return sensor_status
     
+    def getIntDataReady(self):
+        """
+            Method for getting data ready interrupt status
+            ---------------------------------------------------
+            Parameters
+            -
+        """
+        # Read data from sensor
+        data_ready = self.readRegisterBit(MPU6050_REG_INT_ENABLE, 0)
+        # Return data
+        return data_ready
+
+    def setIntDataReady(self, data_ready_state, active_low=False):
+        """
+            Method for setting data ready interrupt (INT pin is pulsed
+            and interrupt status is cleared by any register read)
+            ---------------------------------------------------
+            Parameters
+            data_ready_state: Set to TRUE to enable, disable otherwise
+            active_low: Set to TRUE for active low INT pin
+        """
+        # Write data to sensor in one transaction
+        self.beginConfig()
+        self.writeRegisterBit(MPU6050_REG_INT_PIN_CFG, 7, active_low)
+        self.writeRegisterBit(MPU6050_REG_INT_PIN_CFG, 5, False)
+        self.writeRegisterBit(MPU6050_REG_INT_PIN_CFG, 4, True)
+        self.writeRegisterBit(MPU6050_REG_INT_ENABLE, 0, data_ready_state)
+        self.commitConfig()
+
+    def getIntConfig(self):
+        """
+            Method for getting interrupt pin configuration and
+            interrupt enable register, returns (int_pin_cfg, int_enable)
+            ---------------------------------------------------
+            Parameters
+            -
+        """
+        # Read data from sensor (INT_PIN_CFG is followed by INT_ENABLE)
+        current_data = self.I2CRead(MPU6050_REG_INT_PIN_CFG, 2)
+        # Return data
+        return current_data[0], current_data[1]
+
+    def setIntConfig(self, int_config):
+        """
+            Method for restoring interrupt pin configuration and
+            interrupt enable register
+            ---------------------------------------------------
+            Parameters
+            int_config: (int_pin_cfg, int_enable) from getIntConfig
+        """
+        # Write data to sensor in one transaction
+        self.beginConfig()
+        self.I2CWrite(MPU6050_REG_INT_PIN_CFG, int_config[0])
+        self.I2CWrite(MPU6050_REG_INT_ENABLE, int_config[1])
+        self.commitConfig()
+
+    def streamDataReady(self, wait_source, sample_num=0, timeout=1.0):
+        """
+            Generator for reading one motion sample per data ready
+            interrupt (statistics are stored in int_stats)
+            ---------------------------------------------------
+            Parameters
+            wait_source: Interrupt source with wait(timeout) method which
+            returns TRUE when INT pin was triggered (e.g. GPIO interrupt
+            wrapper or pysensorsim.SimInterrupt)
+            sample_num: Number of samples to be read (0 for endless stream)
+            timeout: Maximum waiting time for one interrupt (in second)
+        """
+        # Reset interrupt status
+        for key in self.int_stats:
+            self.int_stats[key] = 0
+
+        # Enable data ready interrupt (previous interrupt setting is kept)
+        int_config = self.getIntConfig()
+        self.setIntDataReady(True)
+
+        try:
+            while ((sample_num == 0) or (self.int_stats["events"] < sample_num)):
+                # Wait for interrupt without polling the bus
+                if (not(wait_source.wait(timeout))):
+                    self.int_stats["timeouts"] += 1
+                    continue
+
+                # Read new sample
+                self.int_stats["events"] += 1
+                yield self.readMotion()
+        finally:
+            # Restore interrupt setting when stream is closed
+            self.setIntConfig(int_config)
+
     def getSensorActivities(self):
         """
             Method for getting sensor activities
@@ -787,6 +1382,156 @@ class MPU6050:
         self.sensor_activities["neg_value_z"] = (detect_status[0] >> 3) & 1
         self.sensor_activities["pos_value_z"] = (detect_status[0] >> 2) & 1
 
+    def setFIFOChannels(self, fifo_channels):
+        """
+            Method for selecting which data is written to FIFO
+            ---------------------------------------------------
+            Parameters
+            fifo_channels: FIFO channel macros (e.g. MPU6050_FIFO_ACCEL | MPU6050_FIFO_GYRO)
+        """
+        # Calculate FIFO frame length (accelerometer uses 3 axis)
+        frame_len = 0
+        if (fifo_channels & MPU6050_FIFO_ACCEL):
+            frame_len += 6
+        if (fifo_channels & MPU6050_FIFO_TEMP):
+            frame_len += 2
+        if (fifo_channels & MPU6050_FIFO_XGYRO):
+            frame_len += 2
+        if (fifo_channels & MPU6050_FIFO_YGYRO):
+            frame_len += 2
+        if (fifo_channels & MPU6050_FIFO_ZGYRO):
+            frame_len += 2
+
+        # Store internal config
+        self.fifo_channels = fifo_channels & MPU6050_FIFO_ALL
+        self.fifo_frame_len = frame_len
+
+        # Write data to sensor
+        self.I2CWrite(MPU6050_REG_FIFO_EN, self.fifo_channels)
+
+    def resetFIFO(self):
+        """
+            Method for clearing FIFO content
+            ---------------------------------------------------
+            Parameters
+            -
+        """
+        # Set FIFO reset bit (cleared automatically by sensor)
+        self.writeRegisterBit(MPU6050_REG_USER_CTRL, 2, True)
+
+    def enableFIFO(self, fifo_channels):
+        """
+            Method for enabling FIFO for selected channels
+            ---------------------------------------------------
+            Parameters
+            fifo_channels: FIFO channel macros (e.g. MPU6050_FIFO_ACCEL | MPU6050_FIFO_GYRO)
+        """
+        # Stop FIFO before changing its content
+        self.writeRegisterBit(MPU6050_REG_USER_CTRL, 6, False)
+        # Select FIFO channels
+        self.setFIFOChannels(fifo_channels)
+        # Enable FIFO overflow status
+        self.writeRegisterBit(MPU6050_REG_INT_ENABLE, 4, True)
+        # Clear FIFO and overflow status
+        self.resetFIFO()
+        self.getIntStatus()
+        self.fifo_overflow_count = 0
+        # Start FIFO
+        self.writeRegisterBit(MPU6050_REG_USER_CTRL, 6, True)
+
+    def disableFIFO(self):
+        """
+            Method for disabling FIFO
+            ---------------------------------------------------
+            Parameters
+            -
+        """
+        # Stop FIFO and deselect all channels
+        self.writeRegisterBit(MPU6050_REG_USER_CTRL, 6, False)
+        self.setFIFOChannels(0)
+
+    def getFIFOCount(self):
+        """
+            Method for getting number of bytes stored in FIFO
+            ---------------------------------------------------
+            Parameters
+            -
+        """
+        # Read data from sensor
+        fifo_count = self.I2CRead(MPU6050_REG_FIFO_COUNT_H, 2)
+        # Return data
+        return (fifo_count[0] << 8) | fifo_count[1]
+
+    def readFIFO(self, max_frames=0, min_frames=0):
+        """
+            Method for draining complete frames from FIFO
+            (returns int16 array with one row per frame, overflowed
+            FIFO is reset, counted in fifo_overflow_count and its
+            frames are discarded)
+            ---------------------------------------------------
+            Parameters
+            max_frames: Maximum number of frames to be read (0 for all)
+            min_frames: Minimum number of frames to be read (return empty
+            array if less frames are available)
+        """
+        # Check FIFO configuration
+        frame_len = self.fifo_frame_len
+        if (frame_len == 0):
+            raise RuntimeError("FIFO has no enabled channel, call enableFIFO() first")
+
+        # Get number of complete frames in FIFO
+        frame_num = self.getFIFOCount() // frame_len
+        if ((max_frames > 0) and (frame_num > max_frames)):
+            frame_num = max_frames
+        if (frame_num < min_frames):
+            frame_num = 0
+
+        # Read frames in bursts of whole frames
+        fifo_data = np.empty(frame_num * frame_len, dtype=np.uint8)
+        burst_len = (MPU6050_I2C_MAX_BURST_LEN // frame_len) * frame_len
+        offset = 0
+        while (offset < fifo_data.size):
+            read_len = min(burst_len, fifo_data.size - offset)
+            rx_buffer = ffi.from_buffer("unsigned char []", fifo_data[offset:offset + read_len])
+            self.I2CBurstRead(MPU6050_REG_FIFO_R_W, read_len, rx_buffer)
+            offset += read_len
+
+        # Check FIFO overflow (latched until status is read)
+        if ((self.getIntStatus() >> 4) & 1):
+            # Frame alignment is lost, restart FIFO and discard frames
+            self.fifo_overflow_count += 1
+            self.resetFIFO()
+            fifo_data = fifo_data[:0]
+            frame_num = 0
+
+        # Convert big-endian data into frames
+        return fifo_data.view(">i2").astype(np.int16).reshape(frame_num, frame_len // 2)
+
+    def streamFIFO(self, fifo_channels, min_frames=1, poll_delay=0.001):
+        """
+            Generator for streaming FIFO data in blocks of frames
+            (overflowed FIFO is reset and counted in fifo_overflow_count)
+            ---------------------------------------------------
+            Parameters
+            fifo_channels: FIFO channel macros (e.g. MPU6050_FIFO_ACCEL | MPU6050_FIFO_GYRO)
+            min_frames: Minimum number of frames per block
+            poll_delay: Delay between FIFO count polling (in second)
+        """
+        # Enable FIFO
+        self.enableFIFO(fifo_channels)
+
+        try:
+            while (True):
+                # Drain FIFO if enough frames are available
+                fifo_data = self.readFIFO(min_frames=min_frames)
+                if (fifo_data.shape[0] > 0):
+                    yield fifo_data
+                else:
+                    self.sleep(poll_delay)
+        finally:
+            # Disable FIFO when stream is closed
+            self.disableFIFO()
+
     def getRawAccel(self):
         """
             Method for getting raw accelerometer data
@@ -859,9 +1604,10 @@ class MPU6050:
 
         # Check for calibration
         if (self.use_calibrate):
-            self.norm_gyro["x_axis"] = (self.raw_gyro["x_axis"] - self.delta_gyro["x_axis"]) * self.dps_per_digit
-            self.norm_gyro["y_axis"] = (self.raw_gyro["y_axis"] - self.delta_gyro["y_axis"]) * self.dps_per_digit
-            self.norm_gyro["z_axis"] = (self.raw_gyro["z_axis"] - self.delta_gyro["z_axis"]) * self.dps_per_digit
+            # Calibration mean is signed data
+            self.norm_gyro["x_axis"] = (self.signedValue(self.raw_gyro["x_axis"]) - self.delta_gyro["x_axis"]) * self.dps_per_digit
+            self.norm_gyro["y_axis"] = (self.signedValue(self.raw_gyro["y_axis"]) - self.delta_gyro["y_axis"]) * self.dps_per_digit
+            self.norm_gyro["z_axis"] = (self.signedValue(self.raw_gyro["z_axis"]) - self.delta_gyro["z_axis"]) * self.dps_per_digit
         else:
             self.norm_gyro["x_axis"] = self.raw_gyro["x_axis"] * self.dps_per_digit
             self.norm_gyro["y_axis"] = self.raw_gyro["y_axis"] * self.dps_per_digit
@@ -894,6 +1640,203 @@ class MPU6050:
         # Return data
         return temp_data
 
+    def readMotion(self):
+        """
+            Method for getting raw accelerometer, temperature and raw
+            gyroscope data from the same sample in one burst transaction
+            ---------------------------------------------------
+            Parameters
+            -
+        """
+        # Read data from sensor (14 register address)
+        motion_data = self.I2CBurstRead(MPU6050_REG_ACCEL_XOUT_H, MPU6050_MOTION_DATA_LEN)
+        if (self.instrument is not None):
+            start_time = time.perf_counter()
+        motion_words = struct.unpack(">7H", motion_data)
+        self.storeMotion(motion_words)
+
+        # Report conversion time
+        if (self.instrument is not None):
+            self.instrument.event("readMotion.convert", None, 0, time.perf_counter() - start_time)
+
+        # Return data
+        return self.raw_accel, self.temperature, self.raw_gyro
+
+    def storeMotion(self, motion_words):
+        """
+            Method for storing unpacked motion data
+            ---------------------------------------------------
+            Parameters
+            motion_words: Raw accelerometer, temperature and raw gyroscope words
+        """
+        (accel_x, accel_y, accel_z, temp_data, gyro_x, gyro_y, gyro_z) = motion_words
+
+        # Store accelerometer and gyroscope data
+        self.raw_accel["x_axis"] = accel_x
+        self.raw_accel["y_axis"] = accel_y
+        self.raw_accel["z_axis"] = accel_z
+        self.raw_gyro["x_axis"] = gyro_x
+        self.raw_gyro["y_axis"] = gyro_y
+        self.raw_gyro["z_axis"] = gyro_z
+
+        # Process raw temperature data
+        self.temperature = (temp_data / 340) + 36.53
+
+    def readMotionRecord(self, out=None, index=0):
+        """
+            Method for reading one motion sample in place into a
+            MPU6050_MOTION_DTYPE record (no dictionary update unless
+            record_dict_view is set), returns the record
+            ---------------------------------------------------
+            Parameters
+            out: MPU6050_MOTION_DTYPE array (default: motion_record)
+            index: Record index in out array
+        """
+        # Allocate motion record and receive buffer on first use
+        if (self.motion_record is None):
+            self.allocMotionRecord()
+
+        # Select output record
+        if (out is None):
+            out = self.motion_record
+        record = out[index]
+
+        # Read data from sensor directly into receive buffer (14 register address)
+        self.I2CBurstRead(MPU6050_REG_ACCEL_XOUT_H, MPU6050_MOTION_DATA_LEN, self.motion_data_ptr)
+
+        # Store signed data into record
+        record["timestamp"] = time.monotonic()
+        record["accel"] = self.motion_words[0:3]
+        temperature = (self.motion_words[3] / 340) + 36.53
+        record["temperature"] = temperature
+        record["gyro"] = self.motion_words[4:7]
+
+        # Update dictionary view
+        if (self.record_dict_view):
+            self.raw_accel["x_axis"], self.raw_accel["y_axis"], self.raw_accel["z_axis"] = record["accel"].tolist()
+            self.raw_gyro["x_axis"], self.raw_gyro["y_axis"], self.raw_gyro["z_axis"] = record["gyro"].tolist()
+            self.temperature = float(temperature)
+
+        # Return record
+        return record
+
+    def allocMotionRecord(self):
+        """
+            Method for allocating motion record and receive buffer of
+            readMotionRecord
+            ---------------------------------------------------
+            Parameters
+            -
+        """
+        self.motion_record = np.zeros(1, dtype=MPU6050_MOTION_DTYPE)
+        self.motion_data = np.zeros(MPU6050_MOTION_DATA_LEN, dtype=np.uint8)
+        self.motion_data_ptr = loadFFI().from_buffer("unsigned char []", self.motion_data)
+        self.motion_words = self.motion_data.view(">i2")
+
+    def splitMotionBatch(self, raw_frames):
+        """
+            Method for splitting batch of raw frames into accelerometer,
+            temperature and gyroscope columns (as signed 16-bit data)
+            ---------------------------------------------------
+            Parameters
+            raw_frames: (N, 6) accel/gyro or (N, 7) accel/temp/gyro raw frames,
+            or MPU6050_MOTION_DTYPE records (temperature column is None)
+        """
+        # Motion records are already signed (single record is a batch of one)
+        raw_frames = np.asarray(raw_frames)
+        if (raw_frames.dtype.names is not None):
+            raw_frames = np.atleast_1d(raw_frames)
+            return raw_frames["accel"], None, raw_frames["gyro"]
+
+        # Sign conversion (unsigned register data wraps to int16, single frame is a batch of one)
+        raw_frames = np.atleast_2d(raw_frames)
+        if (raw_frames.dtype != np.int16):
+            raw_frames = raw_frames.astype(np.int16)
+
+        # Split columns
+        if (raw_frames.shape[1] == 6):
+            return raw_frames[:, 0:3], None, raw_frames[:, 3:6]
+        elif (raw_frames.shape[1] == 7):
+            return raw_frames[:, 0:3], raw_frames[:, 3], raw_frames[:, 4:7]
+        else:
+            raise ValueError("Raw frames must have 6 or 7 columns")
+
+    def convertAccelBatch(self, raw_frames, scaled=False):
+        """
+            Method for converting batch of raw frames into normalized
+            (m/s^2) or scaled (g) accelerometer data (signed data,
+            getNormAccel uses unsigned register data), returns (N, 3) array
+            ---------------------------------------------------
+            Parameters
+            raw_frames: (N, 6) accel/gyro or (N, 7) accel/temp/gyro raw frames
+            scaled: Set to TRUE for scaled data (g)
+        """
+        # Get accelerometer columns
+        raw_accel, raw_temp, raw_gyro = self.splitMotionBatch(raw_frames)
+
+        # Normalize data
+        if (scaled):
+            return raw_accel * self.range_per_digit
+        else:
+            return raw_accel * (self.range_per_digit * MPU6050_GRAVITY)
+
+    def convertGyroBatch(self, raw_frames):
+        """
+            Method for converting batch of raw frames into normalized
+            gyroscope data (signed data, uncalibrated getNormGyro uses
+            unsigned register data), returns (N, 3) array
+            ---------------------------------------------------
+            Parameters
+            raw_frames: (N, 6) accel/gyro or (N, 7) accel/temp/gyro raw frames
+        """
+        # Get gyroscope columns
+        raw_accel, raw_temp, raw_gyro = self.splitMotionBatch(raw_frames)
+
+        # Check for calibration
+        if (self.use_calibrate):
+            norm_gyro = (raw_gyro - self.getSignedDeltaGyro()) * self.dps_per_digit
+        else:
+            norm_gyro = raw_gyro * self.dps_per_digit
+
+        # Check for threshold
+        if (self.actual_threshold):
+            threshold_gyro = np.array([self.threshold_gyro["x_axis"], self.threshold_gyro["y_axis"], self.threshold_gyro["z_axis"]])
+            norm_gyro[np.abs(norm_gyro) < threshold_gyro] = 0.0
+
+        # Return data
+        return norm_gyro
+
+    def getSignedDeltaGyro(self):
+        """
+            Method for getting gyroscope calibration mean as signed raw
+            data, returns (3,) array (x, y, z)
+            ---------------------------------------------------
+            Parameters
+            -
+        """
+        # Calibration statistics are kept on signed data
+        return np.array([self.delta_gyro["x_axis"], self.delta_gyro["y_axis"], self.delta_gyro["z_axis"]], dtype=np.float64)
+
+    def convertTemperatureBatch(self, raw_frames):
+        """
+            Method for converting batch of (N, 7) raw frames into
+            temperature data, returns (N,) array
+            ---------------------------------------------------
+            Parameters
+            raw_frames: (N, 7) accel/temp/gyro raw frames or MPU6050_MOTION_DTYPE records
+        """
+        # Motion records already contain temperature
+        if (np.asarray(raw_frames).dtype.names is not None):
+            return np.atleast_1d(raw_frames)["temperature"]
+
+        # Get temperature column
+        raw_accel, raw_temp, raw_gyro = self.splitMotionBatch(raw_frames)
+        if (raw_temp is None):
+            raise ValueError("Raw frames don't contain temperature data")
+
+        # Process raw data
+        return (raw_temp / 340) + 36.53
+
     def getGyroOffsetX(self):
         """
             Method for getting gyroscope X offset value
@@ -1050,56 +1993,212 @@ class MPU6050:
         # Write second 8-bit (low bit) data to register
         self.I2CWrite(MPU6050_REG_ACCEL_ZOFFS_H, low_offset)
 
-    def calibrateGyro(self, sample_num):
+    def calibrateGyro(self, sample_num, delay=0.005, use_fifo=False):
         """
             Method for calibrating gyroscope sensor
             ---------------------------------------------------
             Parameters
             sample_num: number of sample data
+            delay: Delay between burst reads (in second)
+            use_fifo: Set to TRUE for collecting samples through FIFO
         """ 
-        # Set calibrate value
-        self.use_calibrate = True
+        # Run calibration steps with blocking delay
+        for step_delay in self.calibrateGyroSteps(sample_num, delay, use_fifo):
+            self.sleep(step_delay)
+
+    def calibrateGyroThread(self, sample_num, bus_lock, delay=0.005, use_fifo=False):
+        """
+            Method for calibrating gyroscope sensor in a background
+            thread, returns the started thread (bus lock is held during
+            each step and released while waiting for the next one)
+            ---------------------------------------------------
+            Parameters
+            sample_num: number of sample data
+            bus_lock: Lock of the bus master shared with other users of
+            the bus (pysensorasync.getBusLock(master) or BusScheduler.getBusLock(master))
+            delay: Delay between burst reads (in second)
+            use_fifo: Set to TRUE for collecting samples through FIFO
+        """
+        def runCalibration(calib_steps):
+            # Access bus only while holding the lock
+            while (True):
+                with bus_lock:
+                    step_delay = next(calib_steps, None)
+                if (step_delay is None):
+                    return
+                self.sleep(step_delay)
+
+        calib_thread = threading.Thread(target=runCalibration, args=(self.calibrateGyroSteps(sample_num, delay, use_fifo),), daemon=True)
+        calib_thread.start()
+        return calib_thread
+
+    def calibrateGyroSteps(self, sample_num, delay=0.005, use_fifo=False):
+        """
+            Generator for calibrating gyroscope sensor, yields delay
+            (in second) which must pass before the next step, result
+            is published when all samples are collected (FIFO sample
+            rate is reduced to the I2C drain capacity, statistics are
+            restarted after FIFO overflow)
+            ---------------------------------------------------
+            Parameters
+            sample_num: number of sample data
+            delay: Delay between burst reads (in second)
+            use_fifo: Set to TRUE for collecting samples through FIFO
+        """ 
+        # Reset calibration statistics
+        self.resetGyroCalibration()
+
+        if (use_fifo):
+            # Reduce sample rate until gyroscope frames (6 bytes) can be drained over I2C
+            prev_fifo_channels = self.fifo_channels
+            prev_smplrt_div = self.smplrt_div
+            if ((self.sample_rate * 6) > MPU6050_I2C_DRAIN_RATE):
+                gyro_rate = self.sample_rate * (1 + self.smplrt_div)
+                self.setSampleRateDivider(min(math.ceil((gyro_rate * 6) / MPU6050_I2C_DRAIN_RATE) - 1, 255))
+
+            # Collect gyroscope frames through FIFO
+            self.enableFIFO(MPU6050_FIFO_GYRO)
+            try:
+                while (self.gyro_calib["count"] < sample_num):
+                    # Wait until FIFO is partly filled (at most half of FIFO)
+                    remaining = sample_num - self.gyro_calib["count"]
+                    yield min(remaining, (MPU6050_FIFO_SIZE // 2) // 6) / self.sample_rate
+
+                    # Signed gyroscope data (mean of noise around zero)
+                    overflow_count = self.fifo_overflow_count
+                    gyro_frames = self.readFIFO(max_frames=remaining)
+
+                    # Frames around FIFO overflow are misaligned, restart statistics
+                    if (self.fifo_overflow_count != overflow_count):
+                        if (self.fifo_overflow_count > MPU6050_CALIB_MAX_OVERFLOWS):
+                            raise RuntimeError("FIFO overflowed during gyroscope calibration")
+                        self.resetGyroCalibration()
+                        continue
+                    self.updateGyroCalibration(gyro_frames.astype(np.int16))
+            finally:
+                # Restore FIFO and sample rate setting
+                if (prev_fifo_channels):
+                    self.enableFIFO(prev_fifo_channels)
+                else:
+                    self.disableFIFO()
+                if (self.smplrt_div != prev_smplrt_div):
+                    self.setSampleRateDivider(prev_smplrt_div)
+        else:
+            # Collect samples through gyroscope burst read
+            for i in range(sample_num):
+                self.getRawGyro()
+                self.addGyroSample(self.signedValue(self.raw_gyro["x_axis"]), self.signedValue(self.raw_gyro["y_axis"]), self.signedValue(self.raw_gyro["z_axis"]))
+                yield delay
 
-        # Declare internal variables
-        sum_x = 0.0
-        sum_y = 0.0
-        sum_z = 0.0
-        sigma_x = 0.0
-        sigma_y = 0.0
-        sigma_z = 0.0
+        # Publish result
+        self.publishGyroCalibration()
 
-        # Read n-samples
-        for i in range(sample_num):
-            # Read raw gyro data
-            self.getRawGyro()
+    def signedValue(self, data, bit_len=16):
+        """
+            Method for converting unsigned register data to two's
+            complement value
+            ---------------------------------------------------
+            Parameters
+            data: Unsigned data
+            bit_len: Bit length of the data
+        """
+        data = int(data) & ((1 << bit_len) - 1)
+        if (data >> (bit_len - 1)):
+            data -= (1 << bit_len)
+        return data
+
+    def resetGyroCalibration(self):
+        """
+            Method for resetting gyroscope calibration statistics
+            ---------------------------------------------------
+            Parameters
+            -
+        """
+        self.gyro_calib = {
+            "count":0,
+            "mean":[0.0, 0.0, 0.0],
+            "m2":[0.0, 0.0, 0.0]
+        }
 
-            # Sum each sample data
-            sum_x += self.raw_gyro["x_axis"]
-            sum_y += self.raw_gyro["y_axis"]
-            sum_z += self.raw_gyro["z_axis"]
+    def addGyroSample(self, gyro_x, gyro_y, gyro_z):
+        """
+            Method for adding one raw gyroscope sample to calibration
+            statistics (Welford streaming mean and variance)
+            ---------------------------------------------------
+            Parameters
+            gyro_x, gyro_y, gyro_z: Signed raw gyroscope data
+        """
+        # Update sample count
+        self.gyro_calib["count"] += 1
+        count = self.gyro_calib["count"]
+        mean = self.gyro_calib["mean"]
+        m2 = self.gyro_calib["m2"]
 
-            # Calculate sigma
-            sigma_x += (self.raw_gyro["x_axis"] * self.raw_gyro["x_axis"])
-            sigma_y += (self.raw_gyro["y_axis"] * self.raw_gyro["y_axis"])
-            sigma_z += (self.raw_gyro["z_axis"] * self.raw_gyro["z_axis"])
+        # Update mean and sum of squared difference of each axis
+        for axis, value in enumerate((gyro_x, gyro_y, gyro_z)):
+            delta = value - mean[axis]
+            mean[axis] += delta / count
+            m2[axis] += delta * (value - mean[axis])
 
-            # Delay
-            time.sleep(0.005)
+    def updateGyroCalibration(self, gyro_samples):
+        """
+            Method for adding raw gyroscope samples to calibration
+            statistics (Welford / Chan streaming mean and variance)
+            ---------------------------------------------------
+            Parameters
+            gyro_samples: (N, 3) signed raw gyroscope samples (x, y, z)
+        """
+        # Statistics of new samples
+        gyro_samples = np.asarray(gyro_samples, dtype=np.float64)
+        batch_count = gyro_samples.shape[0]
+        if (batch_count == 0):
+            return
+        batch_mean = gyro_samples.mean(axis=0)
+        batch_m2 = ((gyro_samples - batch_mean) ** 2).sum(axis=0)
+
+        # Merge with previous statistics
+        count = self.gyro_calib["count"]
+        total_count = count + batch_count
+        mean = np.array(self.gyro_calib["mean"])
+        delta = batch_mean - mean
+        self.gyro_calib["mean"] = (mean + (delta * (batch_count / total_count))).tolist()
+        self.gyro_calib["m2"] = (np.array(self.gyro_calib["m2"]) + batch_m2 + ((delta ** 2) * (count * batch_count / total_count))).tolist()
+        self.gyro_calib["count"] = total_count
+
+    def publishGyroCalibration(self):
+        """
+            Method for storing calibration statistics as delta and
+            threshold vectors (signed mean and standard deviation)
+            ---------------------------------------------------
+            Parameters
+            -
+        """
+        # Check collected samples
+        count = self.gyro_calib["count"]
+        if (count == 0):
+            return
+        mean = self.gyro_calib["mean"]
+        m2 = self.gyro_calib["m2"]
 
         # Calculate delta vectors
-        self.delta_gyro["x_axis"] = sum_x / sample_num
-        self.delta_gyro["y_axis"] = sum_y / sample_num
-        self.delta_gyro["z_axis"] = sum_z / sample_num
-        
-        # Calculate threshold vectors
-        self.threshold_data["x_axis"] = math.sqrt((sigma_x / 50) - (self.delta_gyro["x_axis"] * self.delta_gyro["x_axis"]))
-        self.threshold_data["y_axis"] = math.sqrt((sigma_y / 50) - (self.delta_gyro["y_axis"] * self.delta_gyro["y_axis"]))
-        self.threshold_data["z_axis"] = math.sqrt((sigma_z / 50) - (self.delta_gyro["z_axis"] * self.delta_gyro["z_axis"]))
+        self.delta_gyro["x_axis"] = mean[0]
+        self.delta_gyro["y_axis"] = mean[1]
+        self.delta_gyro["z_axis"] = mean[2]
+
+        # Calculate threshold vectors (standard deviation)
+        self.threshold_data["x_axis"] = math.sqrt(m2[0] / count)
+        self.threshold_data["y_axis"] = math.sqrt(m2[1] / count)
+        self.threshold_data["z_axis"] = math.sqrt(m2[2] / count)
 
-        # Set threshold value
+        # Set calibrate value and threshold value
+        self.use_calibrate = True
         if (self.actual_threshold > 0):
             self.setThreshold(self.actual_threshold)
 
+        # Persist calibration
+        if (self.cache is not None):
+            self.cache.store(self)
+
     def getThreshold(self):
         """
             Method for getting threshold value
@@ -0,0 +1,327 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : pysensorasync.py
+#  Module Dependency : pympu6050.py, pybme280.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      asyncio front-end for MPU6050 and BME280 sensor libraries,
+#      delays and interrupt waits yield to the event loop and bus
+#      transfers run in the default executor behind one lock per
+#      bus master, so one event loop can serve several sensors
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import asyncio
+import threading
+
+from pympu6050 import *
+from pybme280 import *
+
+###################################################################
+#                     Constants Declaration                       #
+###################################################################
+# Lock of each bus master (keyed by master id) and lock for creating them
+ASYNC_BUS_LOCKS = {}
+ASYNC_BUS_LOCKS_GUARD = threading.Lock()
+
+###################################################################
+#                      Function Declaration                       #
+###################################################################
+def getBusLock(master):
+    """
+        Function for getting the shared lock of a bus master, hold it
+        while accessing the sensors of this master from other threads
+        -------------------------------------
+        Parameters
+        master: I2C or SPI master instance
+    """
+    with ASYNC_BUS_LOCKS_GUARD:
+        if (id(master) not in ASYNC_BUS_LOCKS):
+            ASYNC_BUS_LOCKS[id(master)] = threading.Lock()
+        return ASYNC_BUS_LOCKS[id(master)]
+
+def callLocked(bus_lock, method, args):
+    """
+        Function for calling a blocking driver method while holding
+        the bus lock (runs in executor thread)
+        -------------------------------------
+        Parameters
+        bus_lock: Lock of the bus master
+        method: Driver method
+        args: Arguments of the method
+    """
+    with bus_lock:
+        return method(*args)
+
+def nextStep(steps):
+    """
+        Function for running one step of a driver step generator,
+        returns (done, value) with delay of the next step or result
+        of the generator (StopIteration can't leave an executor)
+        -------------------------------------
+        Parameters
+        steps: Driver step generator (e.g. MPU6050.calibrateGyroSteps)
+    """
+    try:
+        return False, next(steps)
+    except StopIteration as steps_done:
+        return True, steps_done.value
+
+async def runBus(bus_lock, method, *args):
+    """
+        Function for running a blocking driver method in the default
+        executor, the event loop keeps running during the transfer
+        -------------------------------------
+        Parameters
+        bus_lock: Lock of the bus master
+        method: Driver method
+        args: Arguments of the method
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, callLocked, bus_lock, method, args)
+
+async def runSteps(bus_lock, steps):
+    """
+        Function for running a driver step generator, bus access runs
+        in the default executor and delays yield to the event loop,
+        returns result of the generator
+        -------------------------------------
+        Parameters
+        bus_lock: Lock of the bus master
+        steps: Driver step generator (e.g. BME280.forcedMeasurementSteps)
+    """
+    while (True):
+        steps_done, value = await runBus(bus_lock, nextStep, steps)
+        if (steps_done):
+            return value
+        await asyncio.sleep(value)
+
+class AsyncMPU6050:
+    def __init__(self, sensor, bus_lock=None):
+        """
+            Create a new asyncio front-end for MPU6050 sensor
+            -------------------------------------
+            Parameters
+            sensor: MPU6050 driver instance
+            bus_lock: Lock held during bus access (default: getBusLock(sensor.master),
+            BusScheduler.getBusLock(master) for sensors which are also scheduled)
+        """
+        self.sensor = sensor
+        self.bus_lock = bus_lock if (bus_lock is not None) else getBusLock(sensor.master)
+
+    async def readMotion(self):
+        """
+            Method for getting raw accelerometer, temperature and raw
+            gyroscope data (see MPU6050.readMotion)
+            -------------------------------------
+            Parameters
+            -
+        """
+        return await runBus(self.bus_lock, self.sensor.readMotion)
+
+    async def readFIFO(self, max_frames=0, min_frames=0):
+        """
+            Method for draining complete frames from FIFO
+            (see MPU6050.readFIFO)
+            -------------------------------------
+            Parameters
+            max_frames: Maximum number of frames to be read (0 for all)
+            min_frames: Minimum number of frames to be read
+        """
+        return await runBus(self.bus_lock, self.sensor.readFIFO, max_frames, min_frames)
+
+    async def calibrateGyro(self, sample_num, delay=0.005, use_fifo=False):
+        """
+            Method for calibrating gyroscope sensor, delays between
+            samples yield to the event loop
+            -------------------------------------
+            Parameters
+            sample_num: number of sample data
+            delay: Delay between burst reads (in second)
+            use_fifo: Set to TRUE for collecting samples through FIFO
+        """
+        return await runSteps(self.bus_lock, self.sensor.calibrateGyroSteps(sample_num, delay, use_fifo))
+
+    async def streamMotion(self, sample_num=0):
+        """
+            Async generator for reading one motion sample per output
+            data rate period (see MPU6050.streamMotion, statistics are
+            stored in sensor schedule_stats)
+            -------------------------------------
+            Parameters
+            sample_num: Number of samples to be read (0 for endless stream)
+        """
+        stream_steps = self.sensor.streamMotionSteps(sample_num)
+        try:
+            while (True):
+                # Run next stream step
+                steps_done, step = await runBus(self.bus_lock, nextStep, stream_steps)
+                if (steps_done):
+                    return
+
+                # Wait without blocking or return new sample
+                delay, motion_data = step
+                if (motion_data is None):
+                    await asyncio.sleep(delay)
+                else:
+                    yield motion_data
+        finally:
+            # Close driver stream
+            await runBus(self.bus_lock, stream_steps.close)
+
+    async def streamDataReady(self, interrupt, sample_num=0):
+        """
+            Async generator for reading one motion sample per data ready
+            interrupt (statistics are stored in sensor int_stats)
+            -------------------------------------
+            Parameters
+            interrupt: Interrupt with awaitable wait() method
+            (e.g. pynq.Interrupt connected to INT pin)
+            sample_num: Number of samples to be read (0 for endless stream)
+        """
+        # Reset interrupt status
+        for key in self.sensor.int_stats:
+            self.sensor.int_stats[key] = 0
+
+        # Enable data ready interrupt (previous interrupt setting is kept)
+        int_config = await runBus(self.bus_lock, self.sensor.getIntConfig)
+        await runBus(self.bus_lock, self.sensor.setIntDataReady, True)
+
+        try:
+            while ((sample_num == 0) or (self.sensor.int_stats["events"] < sample_num)):
+                # Wait for interrupt in event loop
+                await interrupt.wait()
+
+                # Read new sample
+                self.sensor.int_stats["events"] += 1
+                yield await runBus(self.bus_lock, self.sensor.readMotion)
+        finally:
+            # Restore interrupt setting when stream is closed
+            await runBus(self.bus_lock, self.sensor.setIntConfig, int_config)
+
+class AsyncBME280:
+    def __init__(self, sensor, bus_lock=None):
+        """
+            Create a new asyncio front-end for BME280 sensor
+            -------------------------------------
+            Parameters
+            sensor: BME280 driver instance
+            bus_lock: Lock held during bus access (default: getBusLock(sensor.master),
+            BusScheduler.getBusLock(master) for sensors which are also scheduled)
+        """
+        self.sensor = sensor
+        self.bus_lock = bus_lock if (bus_lock is not None) else getBusLock(sensor.master)
+
+    async def getSensorData(self, comp_sel):
+        """
+            Method for reading data from sensor and compensate the
+            received data, returns sensor_data dictionary
+            -------------------------------------
+            Parameters
+            comp_sel: Parameter for selecting which data value to be compensated
+        """
+        await runBus(self.bus_lock, self.sensor.getSensorData, comp_sel)
+        return self.sensor.sensor_data
+
+    async def getForcedSensorData(self, comp_sel=BME280_ALL):
+        """
+            Method for performing one forced mode measurement, conversion
+            time yields to the event loop, returns (result, sensor_data)
+            -------------------------------------
+            Parameters
+            comp_sel: Parameter for selecting which data value to be compensated
+        """
+        forced_result = await runSteps(self.bus_lock, self.sensor.forcedMeasurementSteps(comp_sel))
+        return forced_result, self.sensor.sensor_data
+
+    async def streamNormalMode(self, block_len=BME280_STREAM_BLOCK_LEN, sample_num=0):
+        """
+            Async generator for reading each normal mode conversion once
+            (see BME280.streamNormalMode, statistics are stored in sensor
+            stream_stats)
+            -------------------------------------
+            Parameters
+            block_len: Number of samples per yielded block
+            sample_num: Number of samples to be read (0 for endless stream)
+        """
+        stream_steps = self.sensor.streamNormalModeSteps(block_len, sample_num)
+        try:
+            while (True):
+                # Run next stream step
+                steps_done, step = await runBus(self.bus_lock, nextStep, stream_steps)
+                if (steps_done):
+                    return
+
+                # Wait without blocking or return new block
+                delay, block_data = step
+                if (block_data is None):
+                    await asyncio.sleep(delay)
+                else:
+                    yield block_data
+        finally:
+            # Close driver stream (power mode is restored)
+            await runBus(self.bus_lock, stream_steps.close)
+
+    async def softReset(self):
+        """
+            Method for performing soft reset on the sensor, reboot
+            delay yields to the event loop
+            -------------------------------------
+            Parameters
+            -
+        """
+        return await runSteps(self.bus_lock, self.sensor.softResetSteps())
+
+    async def setSleepMode(self):
+        """
+            Method for putting device into sleep mode
+            (see BME280.setSleepMode)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Get sensor configurations from slave
+        await runBus(self.bus_lock, self.sensor.getSensorConfig)
+        # Soft reset the sensor
+        await self.softReset()
+        # Reload sensor configurations
+        await runBus(self.bus_lock, self.sensor.reloadSensorSettings)
+
+    async def setSensorConfig(self, settings_sel):
+        """
+            Method for setting sensor configuration
+            (see BME280.setSensorConfig)
+            -------------------------------------
+            Parameters
+            settings_sel: Parameter for selecting which setting value to be overwritten
+        """
+        # Put device in sleep mode without blocking
+        if ((await runBus(self.bus_lock, self.sensor.getSensorMode)) != BME280_SLEEP_MODE):
+            await self.setSleepMode()
+        # Write configuration (device is already in sleep mode)
+        await runBus(self.bus_lock, self.sensor.setSensorConfig, settings_sel)
+
+    async def setSensorMode(self, sensor_mode):
+        """
+            Method for setting sensor power mode
+            (see BME280.setSensorMode)
+            -------------------------------------
+            Parameters
+            sensor_mode: Operation mode of the sensor
+        """
+        # Put device in sleep mode without blocking
+        if ((await runBus(self.bus_lock, self.sensor.getSensorMode)) != BME280_SLEEP_MODE):
+            await self.setSleepMode()
+        # Write power mode (device is already in sleep mode)
+        await runBus(self.bus_lock, self.sensor.setSensorMode, sensor_mode)
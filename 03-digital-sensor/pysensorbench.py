@@ -0,0 +1,424 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : pysensorbench.py
+#  Module Dependency : pympu6050.py, pybme280.py, pysensorsim.py,
+#                      pysensorfusion.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Benchmark for sensor library hot paths which run against
+#      simulated bus masters, results can be stored as JSON and
+#      compared with a previous run (bus cost is gated, wall and CPU
+#      time are only reported), module import time is measured
+#      in fresh interpreters (python -X importtime), orientation
+#      fusion throughput is measured per block length
+#      (python pysensorbench.py [--json result.json] [--compare baseline.json])
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import os
+import sys
+import time
+import json
+import random
+import argparse
+import subprocess
+import numpy as np
+
+from pympu6050 import *
+from pybme280 import *
+from pysensorsim import *
+from pysensorfusion import *
+
+###################################################################
+#                     Constants Declaration                       #
+###################################################################
+# Metrics compared in regression mode (deterministic cost per call from simulated bus)
+BENCH_COMPARE_METRICS   = ("transactions", "mmio_accesses", "bus_time")
+# Allowed relative increase before a metric is reported as regression
+BENCH_TOLERANCE         = 0.10
+# Timing metrics (host dependent, reported but never fail the benchmark)
+BENCH_TIMING_METRICS    = ("wall_time", "cpu_time")
+# Allowed relative increase before a timing metric is reported
+BENCH_TIMING_TOLERANCE  = 1.0
+
+# Allowed difference of integer compensation to compensateData (Pa, degC, %RH)
+BENCH_COMP_TOLERANCE    = (1.0, 0.01, 0.01)
+
+# Modules measured by import benchmark
+BENCH_IMPORT_MODULES    = ("pympu6050", "pybme280")
+# Dependencies which must not be loaded by importing the modules
+BENCH_IMPORT_HEAVY      = ("numpy", "cffi", "pycparser")
+
+# Block lengths of orientation fusion benchmark (FIFO drain sizes)
+BENCH_FUSION_BLOCKS     = (10, 50, 200, 1000)
+# Input rate for fusion load estimation (Hz)
+BENCH_FUSION_RATE       = 1000.0
+
+###################################################################
+#                      Function Declaration                       #
+###################################################################
+def benchCompensation(sample_num=2000):
+    """
+        Benchmark for BME280 compensation methods (compensateData,
+        compensateFloat and compensateInteger), returns dictionary
+        with time per sample (in second) and maximum difference to
+        compensateData result
+        -------------------------------------
+        Parameters
+        sample_num: Number of raw samples
+    """
+    # Create sensor with simulated SPI master
+    sensor = BME280(SimAxiQuadSPI(SimBME280()), 0, 0)
+    sensor.getCalibData()
+
+    # Generate raw samples around typical indoor condition
+    rand_gen = random.Random(0)
+    raw_data = [(rand_gen.randint(300000, 500000), rand_gen.randint(450000, 600000), rand_gen.randint(20000, 40000))
+                for i in range(sample_num)]
+
+    # Reference result (compensateData)
+    ref_result = []
+    start_time = time.perf_counter()
+    for uncomp_pres, uncomp_temp, uncomp_humid in raw_data:
+        sensor.uncomp_sensor_data["pressure"] = uncomp_pres
+        sensor.uncomp_sensor_data["temperature"] = uncomp_temp
+        sensor.uncomp_sensor_data["humidity"] = uncomp_humid
+        sensor.compensateData(BME280_ALL)
+        ref_result.append((sensor.sensor_data["pressure"], sensor.sensor_data["temperature"], sensor.sensor_data["humidity"]))
+    ref_time = (time.perf_counter() - start_time) / sample_num
+
+    # Benchmark result
+    result = {
+        "compensateData":{"time_per_sample":ref_time, "max_diff":(0.0, 0.0, 0.0)}
+    }
+
+    # Precomputed compensation methods
+    for method_name in ["compensateFloat", "compensateInteger"]:
+        method = getattr(sensor, method_name)
+        start_time = time.perf_counter()
+        comp_result = [method(uncomp_pres, uncomp_temp, uncomp_humid) for uncomp_pres, uncomp_temp, uncomp_humid in raw_data]
+        comp_time = (time.perf_counter() - start_time) / sample_num
+
+        # Compare with reference result (pressure, temperature, humidity)
+        max_diff = tuple(max(abs(float(comp[i]) - float(ref[i])) for comp, ref in zip(comp_result, ref_result)) for i in range(3))
+        result[method_name] = {"time_per_sample":comp_time, "max_diff":max_diff}
+
+    # Check all methods against datasheet example (adc_T = 519888, adc_P = 415148 -> 25.08 degC, 100653.27 Pa)
+    pressure, temperature, humidity = sensor.compensateInteger(415148, 519888, 0)
+    result["compensateInteger"]["datasheet_check"] = (temperature == 25.08) and (abs(pressure - 100653.27) < 0.5)
+    pressure, temperature, humidity = sensor.compensateFloat(415148, 519888, 0)
+    result["compensateFloat"]["datasheet_check"] = (abs(temperature - 25.08) < 0.005) and (abs(pressure - 100653.27) < 0.5)
+    sensor.uncomp_sensor_data["pressure"] = 415148
+    sensor.uncomp_sensor_data["temperature"] = 519888
+    sensor.uncomp_sensor_data["humidity"] = 0
+    sensor.compensateData(BME280_ALL)
+    pressure, temperature = sensor.sensor_data["pressure"], sensor.sensor_data["temperature"]
+    result["compensateData"]["datasheet_check"] = (abs(temperature - 25.08) < 0.005) and (abs(pressure - 100653.27) < 0.5)
+
+    # Return result
+    return result
+
+def benchFusion(block_lens=BENCH_FUSION_BLOCKS, sample_num=10000):
+    """
+        Benchmark for orientation fusion filters, returns dictionary
+        with time per sample (in second) and CPU load at
+        BENCH_FUSION_RATE input rate for each method and block length
+        -------------------------------------
+        Parameters
+        block_lens: Number of samples per update call
+        sample_num: Number of samples per benchmark
+    """
+    # Create sensor with simulated I2C master
+    i2c_master = SimAxiIIC()
+    i2c_master.attach(MPU6050_I2C_ADDR_PRIM, SimMPU6050())
+    sensor = MPU6050(i2c_master, MPU6050_SCALE_2000DPS, MPU6050_RANGE_2G)
+
+    # Generate raw frames of slowly rotating sensor with noise
+    rand_gen = random.Random(0)
+    raw_frames = np.array([(rand_gen.gauss(0, 200), rand_gen.gauss(0, 200), 16384 + rand_gen.gauss(0, 200),
+                            rand_gen.gauss(0, 20), rand_gen.gauss(0, 20), 300 + rand_gen.gauss(0, 20))
+                           for i in range(sample_num)]).astype(np.int16)
+
+    # Run benchmarks
+    result = {}
+    for method_name, method in [("complementary", FUSION_COMPLEMENTARY), ("madgwick", FUSION_MADGWICK)]:
+        for block_len in block_lens:
+            fusion = OrientationFusion(sensor, BENCH_FUSION_RATE, method)
+            start_time = time.perf_counter()
+            for block_start in range(0, sample_num, block_len):
+                fusion.update(raw_frames[block_start:block_start + block_len])
+            time_per_sample = (time.perf_counter() - start_time) / sample_num
+            result["{}.{}".format(method_name, block_len)] = {
+                "time_per_sample":time_per_sample,
+                "load":time_per_sample * BENCH_FUSION_RATE
+            }
+
+    # Return result
+    return result
+
+def benchMethod(master, method, call_num):
+    """
+        Benchmark for one driver method, returns dictionary with cost
+        per call (wall time, CPU time, bus transactions, MMIO accesses
+        and modelled bus time, time in second)
+        -------------------------------------
+        Parameters
+        master: Simulated bus master used by the method
+        method: Function to be benchmarked
+        call_num: Number of calls
+    """
+    # Reset bus statistics
+    master.resetStats()
+
+    # Call method
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    for i in range(call_num):
+        method()
+    wall_time = time.perf_counter() - start_wall
+    cpu_time = time.process_time() - start_cpu
+
+    # Bus transactions (I2C transfers or SPI chip select frames)
+    stats = master.stats
+    transactions = stats["transactions"] if ("transactions" in stats) else stats["frames"]
+
+    # Return cost per call
+    return {
+        "calls":call_num,
+        "wall_time":wall_time / call_num,
+        "cpu_time":cpu_time / call_num,
+        "transactions":transactions / call_num,
+        "mmio_accesses":(stats["mmio_reads"] + stats["mmio_writes"]) / call_num,
+        "bus_time":stats["bus_time"] / call_num
+    }
+
+def benchHotPaths(call_num=500, calib_sample_num=50):
+    """
+        Benchmark for MPU6050 and BME280 driver hot paths, returns
+        dictionary of benchMethod results (calibrateGyro is measured
+        without its sample delays, configuration and calibration
+        access is measured without shadow register cache)
+        -------------------------------------
+        Parameters
+        call_num: Number of calls per method
+        calib_sample_num: Number of samples per gyroscope calibration
+    """
+    # Create sensors with simulated masters
+    i2c_master = SimAxiIIC()
+    i2c_master.attach(MPU6050_I2C_ADDR_PRIM, SimMPU6050())
+    mpu_sensor = MPU6050(i2c_master, MPU6050_SCALE_2000DPS, MPU6050_RANGE_2G)
+    spi_master = SimAxiQuadSPI(SimBME280())
+    bme_sensor = BME280(spi_master, 0, 0)
+    # Cached registers would be served without bus access
+    bme_sensor_uncached = BME280(spi_master, 0, 0)
+    bme_sensor_uncached.use_reg_cache = False
+
+    # Gyroscope calibration without sample delays
+    def calibrateGyro():
+        for delay in mpu_sensor.calibrateGyroSteps(calib_sample_num):
+            pass
+
+    # Benchmarked methods (name, master, method, number of calls)
+    bench_list = [
+        ("MPU6050.getRawAccel", i2c_master, mpu_sensor.getRawAccel, call_num),
+        ("MPU6050.getRawGyro", i2c_master, mpu_sensor.getRawGyro, call_num),
+        ("MPU6050.getTemperature", i2c_master, mpu_sensor.getTemperature, call_num),
+        ("MPU6050.getSensorActivities", i2c_master, mpu_sensor.getSensorActivities, call_num),
+        ("MPU6050.calibrateGyro", i2c_master, calibrateGyro, max(call_num // calib_sample_num, 1)),
+        ("BME280.getCalibData", spi_master, bme_sensor_uncached.getCalibData, call_num),
+        ("BME280.getSensorData", spi_master, lambda: bme_sensor.getSensorData(BME280_ALL), call_num),
+        ("BME280.setSensorConfig", spi_master, lambda: bme_sensor_uncached.setSensorConfig(BME280_ALL_SETTINGS_SEL), call_num)
+    ]
+
+    # Run benchmarks
+    result = {}
+    for name, master, method, method_call_num in bench_list:
+        result[name] = benchMethod(master, method, method_call_num)
+
+    # Return result
+    return result
+
+def benchImportTime(module_names=BENCH_IMPORT_MODULES, repeat=5):
+    """
+        Benchmark for module import time, each import runs in a new
+        interpreter with -X importtime, returns dictionary with best
+        cumulative import time (wall_time, in second) and heavy
+        dependencies which have been loaded by the import
+        -------------------------------------
+        Parameters
+        module_names: Names of imported modules
+        repeat: Number of imports per module
+    """
+    # Import from directory of this file
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    result = {}
+
+    for module_name in module_names:
+        import_times = []
+        loaded_modules = set()
+        for i in range(repeat):
+            # Import module in new interpreter (timing is written to stderr)
+            import_process = subprocess.run([sys.executable, "-X", "importtime", "-c", "import {}".format(module_name)],
+                                            cwd=module_dir, capture_output=True, text=True, check=True)
+
+            # Parse "import time: self [us] | cumulative | imported package" lines
+            for line in import_process.stderr.splitlines():
+                fields = line.split("|")
+                if ((len(fields) != 3) or (not(fields[1].strip().isdigit()))):
+                    continue
+                imported_name = fields[2].strip()
+                if (imported_name == module_name):
+                    import_times.append(int(fields[1]) / 1e6)
+                elif (imported_name.split(".")[0] in BENCH_IMPORT_HEAVY):
+                    loaded_modules.add(imported_name.split(".")[0])
+
+        # Best time is least disturbed by other processes
+        result["import." + module_name] = {
+            "calls":repeat,
+            "wall_time":min(import_times),
+            "heavy_modules":sorted(loaded_modules)
+        }
+
+    # Return result
+    return result
+
+def saveResults(result, file_path):
+    """
+        Function for storing benchmark result as JSON file
+        -------------------------------------
+        Parameters
+        result: Benchmark result dictionary
+        file_path: JSON file path
+    """
+    with open(file_path, "w") as result_file:
+        json.dump(result, result_file, indent=2, sort_keys=True)
+
+def loadResults(file_path):
+    """
+        Function for loading benchmark result from JSON file
+        -------------------------------------
+        Parameters
+        file_path: JSON file path
+    """
+    with open(file_path, "r") as result_file:
+        return json.load(result_file)
+
+def compareResults(result, baseline, tolerance=BENCH_TOLERANCE, metrics=BENCH_COMPARE_METRICS):
+    """
+        Function for comparing benchmark result with baseline, returns
+        list of (name, metric, baseline value, new value, relative
+        change, regression flag) for every compared metric
+        -------------------------------------
+        Parameters
+        result: New benchmark result (benchHotPaths)
+        baseline: Baseline benchmark result
+        tolerance: Allowed relative increase (used for regression flag)
+        metrics: Compared metrics (BENCH_COMPARE_METRICS or BENCH_TIMING_METRICS)
+    """
+    comparison = []
+    for name in sorted(result):
+        if (name not in baseline):
+            continue
+        for metric in metrics:
+            if ((metric not in result[name]) or (metric not in baseline[name])):
+                continue
+            base_value = baseline[name][metric]
+            new_value = result[name][metric]
+
+            # Relative change (infinite if metric was zero before)
+            if (base_value != 0):
+                rel_change = (new_value - base_value) / base_value
+            else:
+                rel_change = 0.0 if (new_value == 0) else float("inf")
+            comparison.append((name, metric, base_value, new_value, rel_change, rel_change > tolerance))
+    return comparison
+
+###################################################################
+#                          Main Program                           #
+###################################################################
+if __name__ == "__main__":
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Sensor library benchmark")
+    parser.add_argument("--json", help="store hot path result as JSON file")
+    parser.add_argument("--compare", help="compare hot path result with baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=BENCH_TOLERANCE, help="allowed relative increase in compare mode")
+    parser.add_argument("--timing-tolerance", type=float, default=BENCH_TIMING_TOLERANCE,
+                        help="relative increase of wall/CPU time which is reported in compare mode")
+    parser.add_argument("--calls", type=int, default=500, help="number of calls per method")
+    parser.add_argument("--imports", type=int, default=5, help="number of imports per module")
+    args = parser.parse_args()
+
+    # Driver hot path benchmark
+    hot_path_result = benchHotPaths(args.calls)
+    for name in hot_path_result:
+        bench_result = hot_path_result[name]
+        print("{}: {:.2f} us wall, {:.2f} us CPU, {:.2f} transactions, {:.2f} MMIO, {:.2f} us bus".format(name,
+              bench_result["wall_time"] * 1e6, bench_result["cpu_time"] * 1e6, bench_result["transactions"],
+              bench_result["mmio_accesses"], bench_result["bus_time"] * 1e6))
+
+    # Module import benchmark (compared like hot paths)
+    import_result = benchImportTime(repeat=args.imports)
+    for name in import_result:
+        bench_result = import_result[name]
+        print("{}: {:.2f} ms".format(name, bench_result["wall_time"] * 1e3))
+        if (bench_result["heavy_modules"]):
+            print("[Status] {} loads {} at import!".format(name, ", ".join(bench_result["heavy_modules"])))
+    hot_path_result.update(import_result)
+
+    if (args.json):
+        saveResults(hot_path_result, args.json)
+
+    # Regression comparison (only deterministic bus cost fails the benchmark)
+    regression_num = 0
+    if (args.compare):
+        baseline_result = loadResults(args.compare)
+        for name, metric, base_value, new_value, rel_change, regression in compareResults(hot_path_result, baseline_result,
+                                                                                                   args.tolerance):
+            if (regression):
+                regression_num += 1
+                print("[Regression] {} {}: {:.4g} -> {:.4g} ({:+.1%})".format(name, metric, base_value, new_value, rel_change))
+        # Wall and CPU time depend on host load, slowdown is only reported
+        for name, metric, base_value, new_value, rel_change, slowdown in compareResults(hot_path_result, baseline_result,
+                                                                                                 args.timing_tolerance, BENCH_TIMING_METRICS):
+            if (slowdown):
+                print("[Timing] {} {}: {:.4g} -> {:.4g} ({:+.1%})".format(name, metric, base_value, new_value, rel_change))
+        print("[Status] {} regression(s) found".format(regression_num))
+
+    # BME280 compensation benchmark
+    comp_result = benchCompensation()
+    for method_name in comp_result:
+        print("{}: {:.2f} us/sample - max diff (P, T, H): {}".format(method_name, comp_result[method_name]["time_per_sample"] * 1e6,
+                                                                 comp_result[method_name]["max_diff"]))
+    # compensateFloat must give identical result, compensateInteger must agree within its resolution
+    comp_failed = False
+    if (comp_result["compensateFloat"]["max_diff"] != (0.0, 0.0, 0.0)):
+        print("[Status] compensateFloat result doesn't match compensateData!")
+        comp_failed = True
+    if (any(diff > tolerance for diff, tolerance in zip(comp_result["compensateInteger"]["max_diff"], BENCH_COMP_TOLERANCE))):
+        print("[Status] compensateInteger result doesn't match compensateData!")
+        comp_failed = True
+    for method_name in comp_result:
+        if (not(comp_result[method_name]["datasheet_check"])):
+            print("[Status] {} result doesn't match datasheet example!".format(method_name))
+            comp_failed = True
+
+    # Orientation fusion benchmark
+    fusion_result = benchFusion()
+    for name in fusion_result:
+        print("fusion.{}: {:.2f} us/sample - {:.1%} load at {:g} Hz".format(name, fusion_result[name]["time_per_sample"] * 1e6,
+                                                                       fusion_result[name]["load"], BENCH_FUSION_RATE))
+
+    # Regression or compensation mismatch fails the benchmark
+    if ((regression_num > 0) or comp_failed):
+        sys.exit(1)
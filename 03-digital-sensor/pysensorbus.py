@@ -0,0 +1,292 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : pysensorbus.py
+#  Module Dependency : pympu6050.py, pybme280.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Bus scheduler which shares one I2C or SPI master between
+#      several sensor drivers with per-sensor sampling rate,
+#      priority and bus time budget
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import time
+import threading
+
+from pympu6050 import *
+from pybme280 import *
+
+###################################################################
+#                     Constants Declaration                       #
+###################################################################
+# Default Scheduler Settings
+BUS_DEFAULT_BUDGET        = 0.8       # Maximum bus busy time fraction
+BUS_DEFAULT_WINDOW        = 0.1       # Maximum bus time credit (in budget window, second)
+BUS_DEFAULT_BATCH_WINDOW  = 0.0005    # Reads due within this time are batched (second)
+# Read Time Estimation Smoothing Factor
+BUS_READ_TIME_ALPHA       = 0.1
+
+###################################################################
+#                      Function Declaration                       #
+###################################################################
+class BusScheduler:
+    def __init__(self, bus_budget=BUS_DEFAULT_BUDGET, budget_window=BUS_DEFAULT_WINDOW, batch_window=BUS_DEFAULT_BATCH_WINDOW):
+        """
+            Create a new scheduler for sensors which share bus masters
+            -------------------------------------
+            Parameters
+            bus_budget: Maximum fraction of time each bus master may be busy
+            budget_window: Bus time credit is accumulated for at most this time (in second)
+            batch_window: Reads due within this time are executed as one batch (in second)
+        """
+        # Scheduler settings
+        self.bus_budget = bus_budget
+        self.budget_window = budget_window
+        self.batch_window = batch_window
+
+        # Scheduled sensors (name -> task dictionary)
+        self.tasks = {}
+        # Bus lock and status of each master (keyed by master id)
+        self.bus_locks = {}
+        self.bus_stats = {}
+        # Latest (timestamp, data) of each sensor
+        self.latest_data = {}
+
+        # Thread control
+        self.stop_event = threading.Event()
+
+    def getBusLock(self, master):
+        """
+            Method for getting the lock of a bus master, hold it while
+            accessing a scheduled sensor from outside the scheduler
+            -------------------------------------
+            Parameters
+            master: I2C or SPI master instance
+        """
+        # Create lock and status on first use
+        if (id(master) not in self.bus_locks):
+            self.bus_locks[id(master)] = threading.Lock()
+            self.bus_stats[id(master)] = {
+                "batches":0,
+                "reads":0,
+                "deferred":0,
+                "busy_time":0.0,
+                "credit":self.bus_budget * self.budget_window,
+                "credit_time":time.monotonic()
+            }
+        return self.bus_locks[id(master)]
+
+    def defaultReadMethod(self, sensor):
+        """
+            Method for getting default read method of a sensor
+            (MPU6050: readMotion, BME280: compensated sensor_data)
+            -------------------------------------
+            Parameters
+            sensor: MPU6050 or BME280 driver instance
+        """
+        if (isinstance(sensor, MPU6050)):
+            return sensor.readMotion
+        elif (isinstance(sensor, BME280)):
+            def readSensorData():
+                sensor.getSensorData(BME280_ALL)
+                return sensor.sensor_data
+            return readSensorData
+        else:
+            raise TypeError("Sensor must be MPU6050 or BME280 (or read_method must be given)")
+
+    def getBusLoad(self, master):
+        """
+            Method for getting estimated bus busy time fraction of a
+            bus master (sum of read time * sampling rate)
+            -------------------------------------
+            Parameters
+            master: I2C or SPI master instance
+        """
+        return sum(task["read_time"] / task["period"] for task in self.tasks.values() if (task["master"] is master))
+
+    def addSensor(self, name, sensor, sample_rate, priority=0, read_method=None, callback=None, read_time=None):
+        """
+            Method for adding a sensor to the scheduler, raises
+            ValueError if the bus budget would be exceeded
+            -------------------------------------
+            Parameters
+            name: Unique sensor name
+            sensor: Driver instance (master is taken from sensor.master)
+            sample_rate: Sampling rate in Hz
+            priority: Higher priority sensors are read first and deferred last
+            read_method: Function which reads one sample (default: defaultReadMethod)
+            callback: Function called as callback(name, timestamp, data) for each
+            sample (data may be reused by the driver, copy it if needed)
+            read_time: Estimated read time in second (default: measured once)
+        """
+        # Check sensor name
+        if (name in self.tasks):
+            raise ValueError("Sensor {} is already scheduled".format(name))
+
+        # Get read method and bus lock
+        if (read_method is None):
+            read_method = self.defaultReadMethod(sensor)
+        bus_lock = self.getBusLock(sensor.master)
+
+        # Measure read time
+        if (read_time is None):
+            with bus_lock:
+                start_time = time.perf_counter()
+                read_method()
+                read_time = time.perf_counter() - start_time
+
+        # Check bus budget
+        period = 1.0 / sample_rate
+        bus_load = self.getBusLoad(sensor.master) + (read_time / period)
+        if ((bus_load > self.bus_budget) or (read_time > (self.bus_budget * self.budget_window))):
+            raise ValueError("Bus budget exceeded ({:.2f} > {:.2f})".format(bus_load, self.bus_budget))
+
+        # Add task
+        self.tasks[name] = {
+            "sensor":sensor,
+            "master":sensor.master,
+            "period":period,
+            "priority":priority,
+            "read_method":read_method,
+            "callback":callback,
+            "read_time":read_time,
+            "next_time":time.monotonic(),
+            "samples":0,
+            "deferred":0,
+            "missed":0
+        }
+
+    def removeSensor(self, name):
+        """
+            Method for removing a sensor from the scheduler
+            -------------------------------------
+            Parameters
+            name: Sensor name
+        """
+        self.tasks.pop(name)
+        self.latest_data.pop(name, None)
+
+    def runOnce(self):
+        """
+            Method for executing all reads which are due, reads of the
+            same master are batched under one bus lock in priority
+            order, returns time until the next read is due (in second)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Group due tasks by bus master
+        current_time = time.monotonic()
+        due_groups = {}
+        for name, task in self.tasks.items():
+            if (task["next_time"] <= (current_time + self.batch_window)):
+                due_groups.setdefault(id(task["master"]), []).append((name, task))
+
+        for master_id, due_tasks in due_groups.items():
+            # Highest priority first, then earliest deadline
+            due_tasks.sort(key=lambda item: (-item[1]["priority"], item[1]["next_time"]))
+            bus_stats = self.bus_stats[master_id]
+
+            with self.bus_locks[master_id]:
+                # Accumulate bus time credit (bus_budget second per second)
+                bus_stats["credit"] = min(bus_stats["credit"] + ((current_time - bus_stats["credit_time"]) * self.bus_budget),
+                                          self.bus_budget * self.budget_window)
+                bus_stats["credit_time"] = current_time
+                bus_stats["batches"] += 1
+
+                for name, task in due_tasks:
+                    # Defer read until enough credit is accumulated
+                    if (task["read_time"] > bus_stats["credit"]):
+                        task["deferred"] += 1
+                        bus_stats["deferred"] += 1
+                        task["next_time"] = current_time + ((task["read_time"] - bus_stats["credit"]) / self.bus_budget)
+                        continue
+
+                    # Read sample
+                    timestamp = time.monotonic()
+                    start_time = time.perf_counter()
+                    data = task["read_method"]()
+                    read_time = time.perf_counter() - start_time
+
+                    # Update read time estimation and bus status
+                    task["read_time"] += BUS_READ_TIME_ALPHA * (read_time - task["read_time"])
+                    bus_stats["credit"] -= read_time
+                    bus_stats["busy_time"] += read_time
+                    bus_stats["reads"] += 1
+
+                    # Store data
+                    task["samples"] += 1
+                    self.latest_data[name] = (timestamp, data)
+                    if (task["callback"] is not None):
+                        task["callback"](name, timestamp, data)
+
+                    # Next deadline, skip sample periods which have already passed
+                    task["next_time"] += task["period"]
+                    if (task["next_time"] <= timestamp):
+                        late_periods = int((timestamp - task["next_time"]) / task["period"]) + 1
+                        task["missed"] += late_periods
+                        task["next_time"] += late_periods * task["period"]
+
+        # Return time until next read
+        if (not(self.tasks)):
+            return self.budget_window
+        return min(task["next_time"] for task in self.tasks.values()) - time.monotonic()
+
+    def run(self, duration=None):
+        """
+            Method for running the scheduler until stop() is called
+            or duration has passed
+            -------------------------------------
+            Parameters
+            duration: Running time in second (None for endless run)
+        """
+        # Declare internal variables
+        self.stop_event.clear()
+        end_time = None if (duration is None) else (time.monotonic() + duration)
+
+        while (not(self.stop_event.is_set())):
+            # Execute due reads
+            delay = self.runOnce()
+
+            # Check running time
+            if (end_time is not None):
+                delay = min(delay, end_time - time.monotonic())
+                if (time.monotonic() >= end_time):
+                    break
+
+            # Wait until next read
+            if (delay > 0):
+                self.stop_event.wait(delay)
+
+    def stop(self):
+        """
+            Method for stopping run() from another thread
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.stop_event.set()
+
+    def getSchedulerStats(self):
+        """
+            Method for getting scheduler status, returns dictionary of
+            sensor status (samples, deferred, missed, read_time) and
+            bus load of each sensor
+            -------------------------------------
+            Parameters
+            -
+        """
+        return {name:{"samples":task["samples"], "deferred":task["deferred"], "missed":task["missed"],
+                      "read_time":task["read_time"], "bus_load":task["read_time"] / task["period"]}
+                for name, task in self.tasks.items()}
@@ -0,0 +1,319 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : pysensorcache.py
+#  Module Dependency : pympu6050.py, pybme280.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Persisted calibration and configuration cache for fast
+#      sensor startup, entries are keyed by board, sensor type,
+#      bus, bus address and chip ID and are validated against the
+#      sensor before use (MPU6050(..., cache=SensorCache()))
+#
+#      Validation and invalidation rules:
+#      - Cache file with other format version or invalid JSON is ignored
+#      - Factory trim registers of the sensor must match (fingerprint,
+#        detects exchanged sensor with same chip ID and address)
+#      - MPU6050 gyroscope calibration must be younger than
+#        CACHE_GYRO_MAX_AGE, taken within CACHE_GYRO_MAX_TEMP_DELTA
+#        of current temperature, with same gyroscope scale and DLPF
+#      - Entry which fails validation is removed
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import os
+import json
+import time
+import platform
+
+from pympu6050 import *
+from pybme280 import *
+
+###################################################################
+#                     Constants Declaration                       #
+###################################################################
+# Cache File Format Version
+CACHE_VERSION               = 2              # Signed gyroscope calibration since version 2
+# Default Cache File Path
+CACHE_DEFAULT_PATH          = os.path.join(os.path.expanduser("~"), ".pysensor_cache.json")
+
+# Fingerprint Registers (start address, length)
+CACHE_MPU6050_FINGERPRINT   = (0x0D, 4)      # Factory self-test trim registers
+CACHE_BME280_FINGERPRINT    = (BME280_TEMP_PRESS_CALIB_DATA_ADDR, 6)
+
+# MPU6050 Gyroscope Calibration Validity
+CACHE_GYRO_MAX_AGE          = 86400.0        # Maximum calibration age (second)
+CACHE_GYRO_MAX_TEMP_DELTA   = 5.0            # Maximum temperature change (degree celsius)
+CACHE_GYRO_CONFIG_MSK       = {
+    MPU6050_REG_GYRO_CONFIG:0b00011000,      # Gyroscope scale
+    MPU6050_REG_CONFIG:0b00000111            # DLPF mode
+}
+
+###################################################################
+#                      Function Declaration                       #
+###################################################################
+def busName(master):
+    """
+        Function for getting name of a bus master (AXI base address
+        if available, otherwise class name)
+        -------------------------------------
+        Parameters
+        master: I2C or SPI master instance
+    """
+    mmio = getattr(master, "mmio", None)
+    if (mmio is not None):
+        return hex(mmio.base_addr)
+    return type(master).__name__
+
+class SensorCache:
+    def __init__(self, file_path=CACHE_DEFAULT_PATH, board_id=None):
+        """
+            Create a new persisted sensor cache (file is read on first
+            use and rewritten on change)
+            -------------------------------------
+            Parameters
+            file_path: Cache file path
+            board_id: Board name in cache key (default: BOARD environment
+            variable of PYNQ image or host name)
+        """
+        self.file_path = file_path
+        self.board_id = board_id if (board_id is not None) else os.environ.get("BOARD", platform.node())
+        self.entries = None
+
+    def loadFile(self):
+        """
+            Method for reading cache entries from file (missing, invalid
+            or other version file gives empty cache)
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.entries = {}
+        try:
+            with open(self.file_path, "r") as cache_file:
+                cache_data = json.load(cache_file)
+        except (OSError, ValueError):
+            return
+        if ((isinstance(cache_data, dict)) and (cache_data.get("version") == CACHE_VERSION)):
+            self.entries = cache_data.get("entries", {})
+
+    def saveFile(self):
+        """
+            Method for writing cache entries to file (written to a
+            temporary file first so an interrupted write keeps the old file)
+            -------------------------------------
+            Parameters
+            -
+        """
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, "w") as cache_file:
+            json.dump({"version":CACHE_VERSION, "entries":self.entries}, cache_file, indent=1, sort_keys=True)
+        os.replace(temp_path, self.file_path)
+
+    def getEntries(self):
+        """
+            Method for getting cache entries (read from file on first use)
+            -------------------------------------
+            Parameters
+            -
+        """
+        if (self.entries is None):
+            self.loadFile()
+        return self.entries
+
+    def getKey(self, sensor):
+        """
+            Method for getting cache key of a sensor
+            (board/type/bus/address/chip ID)
+            -------------------------------------
+            Parameters
+            sensor: MPU6050 or BME280 driver instance
+        """
+        if (isinstance(sensor, MPU6050)):
+            sensor_type, bus_addr = "MPU6050", sensor.slv_addr
+        elif (isinstance(sensor, BME280)):
+            sensor_type, bus_addr = "BME280", 0
+        else:
+            raise TypeError("Sensor must be MPU6050 or BME280")
+        return "{}/{}/{}/{:#04x}/{:#04x}".format(self.board_id, sensor_type, busName(sensor.master), bus_addr, sensor.chip_id)
+
+    def readFingerprint(self, sensor):
+        """
+            Method for reading factory trim registers which identify
+            a single sensor
+            -------------------------------------
+            Parameters
+            sensor: MPU6050 or BME280 driver instance
+        """
+        if (isinstance(sensor, MPU6050)):
+            reg_addr, reg_len = CACHE_MPU6050_FINGERPRINT
+            return list(sensor.I2CRead(reg_addr, reg_len))
+        else:
+            reg_addr, reg_len = CACHE_BME280_FINGERPRINT
+            return list(sensor.SPIRead(reg_addr, reg_len))
+
+    def createEntry(self, sensor):
+        """
+            Method for creating cache entry from current driver state
+            -------------------------------------
+            Parameters
+            sensor: MPU6050 or BME280 driver instance
+        """
+        # Common entry data
+        entry = {
+            "created":time.time(),
+            "fingerprint":self.readFingerprint(sensor)
+        }
+
+        if (isinstance(sensor, MPU6050)):
+            # Configuration which calibration depends on (only validated, not restored)
+            entry["registers"] = {str(reg_addr):sensor.I2CRead(reg_addr, 1)[0] for reg_addr in sorted(CACHE_GYRO_CONFIG_MSK)}
+            # Gyroscope calibration with calibration temperature
+            entry["temperature"] = sensor.getTemperature()
+            entry["use_calibrate"] = sensor.use_calibrate
+            entry["delta_gyro"] = dict(sensor.delta_gyro)
+            entry["threshold_data"] = dict(sensor.threshold_data)
+            entry["gyro_calib"] = sensor.gyro_calib
+        else:
+            # Calibration registers from shadow register cache (restored at startup)
+            entry["registers"] = {str(reg_addr):data for reg_addr, data in sorted(sensor.reg_cache.items())}
+            # Calibration data and settings
+            entry["calib_data"] = dict(sensor.calib_data)
+            entry["settings"] = dict(sensor.settings)
+        return entry
+
+    def store(self, sensor):
+        """
+            Method for storing calibration and configuration of a
+            sensor (file is only written if entry has changed)
+            -------------------------------------
+            Parameters
+            sensor: MPU6050 or BME280 driver instance
+        """
+        # Create new entry
+        entries = self.getEntries()
+        key = self.getKey(sensor)
+        entry = self.createEntry(sensor)
+
+        # Skip write if only creation time and temperature differ
+        # (temperature changes with every read but is only checked against drift)
+        old_entry = dict(entries.get(key, {}), created=entry["created"])
+        if ("temperature" in entry):
+            old_entry["temperature"] = entry["temperature"]
+        if (old_entry == json.loads(json.dumps(entry))):
+            return
+        entries[key] = entry
+        self.saveFile()
+
+    def load(self, sensor):
+        """
+            Method for restoring calibration and configuration of a
+            sensor, returns True if a valid entry has been restored
+            (invalid entry is removed)
+            -------------------------------------
+            Parameters
+            sensor: MPU6050 or BME280 driver instance
+        """
+        # Get entry
+        key = self.getKey(sensor)
+        entry = self.getEntries().get(key)
+        if (entry is None):
+            return False
+
+        # Validate and restore entry
+        if (isinstance(sensor, MPU6050)):
+            restored = self.restoreMPU6050(sensor, entry)
+        else:
+            restored = self.restoreBME280(sensor, entry)
+
+        # Remove invalid entry
+        if (not(restored)):
+            self.invalidate(sensor)
+        return restored
+
+    def restoreMPU6050(self, sensor, entry):
+        """
+            Method for validating and restoring gyroscope calibration
+            of MPU6050 sensor
+            -------------------------------------
+            Parameters
+            sensor: MPU6050 driver instance
+            entry: Cache entry
+        """
+        # Check sensor fingerprint and calibration age
+        if (entry["fingerprint"] != self.readFingerprint(sensor)):
+            return False
+        if (abs(time.time() - entry["created"]) > CACHE_GYRO_MAX_AGE):
+            return False
+
+        # Check configuration which changes gyroscope offset and noise
+        for reg_addr, reg_mask in CACHE_GYRO_CONFIG_MSK.items():
+            cached_data = entry["registers"].get(str(reg_addr))
+            current_data = sensor.I2CRead(reg_addr, 1)[0]
+            if ((cached_data is None) or ((cached_data & reg_mask) != (current_data & reg_mask))):
+                return False
+
+        # Check temperature drift
+        if (abs(sensor.getTemperature() - entry["temperature"]) > CACHE_GYRO_MAX_TEMP_DELTA):
+            return False
+
+        # Restore calibration
+        if (entry["use_calibrate"]):
+            sensor.delta_gyro.update(entry["delta_gyro"])
+            sensor.threshold_data.update(entry["threshold_data"])
+            sensor.gyro_calib = entry["gyro_calib"]
+            sensor.use_calibrate = True
+            if (sensor.actual_threshold > 0):
+                sensor.setThreshold(sensor.actual_threshold)
+        return True
+
+    def restoreBME280(self, sensor, entry):
+        """
+            Method for validating and restoring calibration data of
+            BME280 sensor (configuration registers are read from sensor)
+            -------------------------------------
+            Parameters
+            sensor: BME280 driver instance
+            entry: Cache entry
+        """
+        # Check sensor fingerprint (first calibration registers)
+        if (entry["fingerprint"] != self.readFingerprint(sensor)):
+            return False
+
+        # Restore calibration registers into shadow register cache
+        sensor.reg_cache.clear()
+        for reg_addr, data in entry["registers"].items():
+            if (int(reg_addr) not in BME280_CONFIG_REGS):
+                sensor.reg_cache[int(reg_addr)] = data
+
+        # Configuration may have changed since last run (read from sensor)
+        sensor.getSensorConfig()
+
+        # Restore calibration data
+        sensor.calib_data.update(entry["calib_data"])
+        sensor.prepareCompensation()
+        return True
+
+    def invalidate(self, sensor=None):
+        """
+            Method for removing cache entry of a sensor
+            -------------------------------------
+            Parameters
+            sensor: MPU6050 or BME280 driver instance (None removes all entries)
+        """
+        entries = self.getEntries()
+        if (sensor is None):
+            entries.clear()
+        elif (entries.pop(self.getKey(sensor), None) is None):
+            return
+        self.saveFile()
@@ -0,0 +1,392 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : pysensorfusion.py
+#  Module Dependency : pympu6050.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Block-based orientation fusion for MPU6050 motion data
+#      (FIFO drains, sampler or recording blocks), filter state is
+#      carried across blocks and orientation is returned as
+#      quaternion (w, x, y, z) and euler angle (roll, pitch, yaw
+#      in degree) arrays
+#
+#      - Complementary filter: tilt from accelerometer blended with
+#        integrated gyroscope rate, solved as first order recursion
+#        over the whole block
+#      - Madgwick filter: gyroscope propagation at full rate (block
+#        vectorized), accelerometer gradient correction every
+#        correction_interval samples with segment mean acceleration
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import math
+import numpy as np
+
+from pympu6050 import *
+
+###################################################################
+#                     Constants Declaration                       #
+###################################################################
+# Fusion Method Select
+FUSION_COMPLEMENTARY            = 0
+FUSION_MADGWICK                 = 1
+
+# Default Filter Settings
+FUSION_COMPLEMENTARY_ALPHA      = 0.98    # Gyroscope weight per sample
+FUSION_MADGWICK_BETA            = 0.1     # Gradient descent gain (rad/s)
+FUSION_CORRECTION_INTERVAL      = 8       # Samples per accelerometer correction
+
+# Largest scaling (decades) of recursion solved with one cumulative sum
+FUSION_SCAN_RANGE               = 8.0
+
+###################################################################
+#                      Function Declaration                       #
+###################################################################
+def quatMultiply(quat_a, quat_b):
+    """
+        Function for multiplying quaternion arrays (Hamilton product)
+        -------------------------------------
+        Parameters
+        quat_a, quat_b: (..., 4) quaternion arrays (w, x, y, z)
+    """
+    a_w, a_x, a_y, a_z = quat_a[..., 0], quat_a[..., 1], quat_a[..., 2], quat_a[..., 3]
+    b_w, b_x, b_y, b_z = quat_b[..., 0], quat_b[..., 1], quat_b[..., 2], quat_b[..., 3]
+    quat = np.empty(np.broadcast_shapes(np.shape(quat_a), np.shape(quat_b)))
+    quat[..., 0] = (a_w * b_w) - (a_x * b_x) - (a_y * b_y) - (a_z * b_z)
+    quat[..., 1] = (a_w * b_x) + (a_x * b_w) + (a_y * b_z) - (a_z * b_y)
+    quat[..., 2] = (a_w * b_y) - (a_x * b_z) + (a_y * b_w) + (a_z * b_x)
+    quat[..., 3] = (a_w * b_z) + (a_x * b_y) - (a_y * b_x) + (a_z * b_w)
+    return quat
+
+def quatToEuler(quat):
+    """
+        Function for converting quaternion array into euler angle
+        array (roll, pitch, yaw in degree, ZYX rotation order)
+        -------------------------------------
+        Parameters
+        quat: (N, 4) quaternion array (w, x, y, z)
+    """
+    q_w, q_x, q_y, q_z = quat[:, 0], quat[:, 1], quat[:, 2], quat[:, 3]
+    roll = np.arctan2(2 * ((q_w * q_x) + (q_y * q_z)), 1 - (2 * ((q_x * q_x) + (q_y * q_y))))
+    pitch = np.arcsin(np.clip(2 * ((q_w * q_y) - (q_z * q_x)), -1.0, 1.0))
+    yaw = np.arctan2(2 * ((q_w * q_z) + (q_x * q_y)), 1 - (2 * ((q_y * q_y) + (q_z * q_z))))
+    return np.degrees(np.stack([roll, pitch, yaw], axis=1))
+
+def eulerToQuat(euler):
+    """
+        Function for converting euler angle array (roll, pitch, yaw
+        in degree, ZYX rotation order) into quaternion array
+        -------------------------------------
+        Parameters
+        euler: (N, 3) euler angle array
+    """
+    half_angle = np.radians(euler) / 2
+    cos_r, cos_p, cos_y = np.cos(half_angle).T
+    sin_r, sin_p, sin_y = np.sin(half_angle).T
+    return np.stack([(cos_r * cos_p * cos_y) + (sin_r * sin_p * sin_y),
+                     (sin_r * cos_p * cos_y) - (cos_r * sin_p * sin_y),
+                     (cos_r * sin_p * cos_y) + (sin_r * cos_p * sin_y),
+                     (cos_r * cos_p * sin_y) - (sin_r * sin_p * cos_y)], axis=1)
+
+def recursionScan(inputs, gain, initial):
+    """
+        Function for solving first order recursion
+        y[n] = gain * y[n - 1] + inputs[n] for a whole array with
+        cumulative sums, returns (N,) array
+        -------------------------------------
+        Parameters
+        inputs: (N,) input array
+        gain: Recursion gain (0 - 1)
+        initial: Value of y[-1]
+    """
+    # Without memory / pure accumulation
+    if (gain <= 0.0):
+        return np.array(inputs, dtype=np.float64)
+    if (gain >= 1.0):
+        return initial + np.cumsum(inputs)
+
+    # y[n] = gain^(n+1) * (y[-1] + sum(inputs[k] / gain^(k+1))), solved in
+    # chunks so that gain^-(k+1) stays within FUSION_SCAN_RANGE decades
+    chunk_len = max(int(FUSION_SCAN_RANGE / -math.log10(gain)), 1)
+    gain_powers = gain ** np.arange(1, min(chunk_len, len(inputs)) + 1)
+    outputs = np.empty(len(inputs), dtype=np.float64)
+    for start in range(0, len(inputs), chunk_len):
+        chunk = inputs[start:start + chunk_len]
+        powers = gain_powers[:len(chunk)]
+        outputs[start:start + len(chunk)] = powers * (initial + np.cumsum(chunk / powers))
+        initial = outputs[start + len(chunk) - 1]
+    return outputs
+
+class OrientationFusion:
+    def __init__(self, sensor, sample_rate=None, method=FUSION_MADGWICK, alpha=FUSION_COMPLEMENTARY_ALPHA,
+                 beta=FUSION_MADGWICK_BETA, correction_interval=FUSION_CORRECTION_INTERVAL, gyro_bias=None):
+        """
+            Create a new orientation fusion stage for MPU6050 motion
+            data (gyroscope is scaled with sensor dps_per_digit)
+            -------------------------------------
+            Parameters
+            sensor: MPU6050 driver instance
+            sample_rate: Sampling rate in Hz (default: sensor output data rate)
+            method: FUSION_COMPLEMENTARY or FUSION_MADGWICK
+            alpha: Complementary filter gyroscope weight per sample
+            beta: Madgwick filter gain (in rad/s)
+            correction_interval: Samples per Madgwick accelerometer correction
+            (1 for correction at every sample)
+            gyro_bias: Raw gyroscope bias (x, y, z) (default: sensor delta_gyro
+            if calibrated, as signed data)
+        """
+        # Fusion settings
+        self.sensor = sensor
+        self.sample_rate = sample_rate if (sample_rate is not None) else sensor.sample_rate
+        self.method = method
+        self.alpha = alpha
+        self.beta = beta
+        self.correction_interval = max(int(correction_interval), 1)
+        self.gyro_bias = gyro_bias
+
+        # Filter state
+        self.reset()
+
+    def reset(self, quaternion=(1.0, 0.0, 0.0, 0.0)):
+        """
+            Method for resetting filter state
+            -------------------------------------
+            Parameters
+            quaternion: Initial orientation (w, x, y, z)
+        """
+        # Current orientation
+        self.quaternion = np.array(quaternion, dtype=np.float64)
+        self.quaternion /= np.linalg.norm(self.quaternion)
+        self.euler = quatToEuler(self.quaternion[np.newaxis])[0]
+        # Samples since last Madgwick correction (with acceleration and time sums)
+        self.correction_phase = 0
+        self.pending_accel = np.zeros(3)
+        self.pending_time = 0.0
+        # Timestamp of last sample (None if not known)
+        self.last_timestamp = None
+        # Number of processed samples
+        self.sample_count = 0
+
+    def getGyroBias(self):
+        """
+            Method for getting raw gyroscope bias (x, y, z)
+            -------------------------------------
+            Parameters
+            -
+        """
+        if (self.gyro_bias is not None):
+            return np.asarray(self.gyro_bias, dtype=np.float64)
+        if (self.sensor.use_calibrate):
+            return self.sensor.getSignedDeltaGyro()
+        return np.zeros(3)
+
+    def update(self, raw_frames, timestamps=None):
+        """
+            Method for processing a block of motion data, returns
+            (quaternions, euler) arrays of shape (N, 4) and (N, 3)
+            -------------------------------------
+            Parameters
+            raw_frames: (N, 6) accel/gyro or (N, 7) accel/temp/gyro raw frames,
+            or MPU6050_MOTION_DTYPE records
+            timestamps: (N,) sample times in second (default: fixed sample period)
+        """
+        # Get accelerometer and gyroscope columns
+        raw_accel, raw_temp, raw_gyro = self.sensor.splitMotionBatch(raw_frames)
+        sample_num = raw_accel.shape[0]
+        if (sample_num == 0):
+            return np.zeros((0, 4)), np.zeros((0, 3))
+
+        # Gyroscope rate (degree per second) and accelerometer data (only direction is used)
+        gyro = (raw_gyro - self.getGyroBias()) * self.sensor.dps_per_digit
+        accel = raw_accel.astype(np.float64)
+
+        # Sample period of each sample
+        if (timestamps is None):
+            delta_time = np.full(sample_num, 1.0 / self.sample_rate)
+        else:
+            # First sample continues previous block (fixed period for first block)
+            timestamps = np.asarray(timestamps, dtype=np.float64)
+            if (self.last_timestamp is None):
+                self.last_timestamp = timestamps[0] - (1.0 / self.sample_rate)
+            delta_time = np.diff(timestamps, prepend=self.last_timestamp)
+            self.last_timestamp = timestamps[-1]
+
+        # Run filter
+        if (self.method == FUSION_COMPLEMENTARY):
+            euler = self.updateComplementary(accel, gyro, delta_time)
+            quaternions = eulerToQuat(euler)
+        else:
+            quaternions = self.updateMadgwick(accel, np.radians(gyro), delta_time)
+            euler = quatToEuler(quaternions)
+
+        # Store last orientation
+        self.quaternion = quaternions[-1].copy()
+        self.euler = euler[-1].copy()
+        self.sample_count += sample_num
+
+        # Return data
+        return quaternions, euler
+
+    def updateComplementary(self, accel, gyro, delta_time):
+        """
+            Method for running complementary filter over a block,
+            returns (N, 3) euler angle array (in degree)
+            -------------------------------------
+            Parameters
+            accel: (N, 3) accelerometer data
+            gyro: (N, 3) gyroscope rate (in degree per second)
+            delta_time: (N,) sample periods (in second)
+        """
+        # Tilt angles from accelerometer
+        accel_roll = np.degrees(np.arctan2(accel[:, 1], accel[:, 2]))
+        accel_pitch = np.degrees(np.arctan2(-accel[:, 0], np.hypot(accel[:, 1], accel[:, 2])))
+
+        # angle[n] = alpha * (angle[n - 1] + rate[n] * dt) + (1 - alpha) * accel_angle[n]
+        roll = recursionScan((self.alpha * gyro[:, 0] * delta_time) + ((1 - self.alpha) * accel_roll), self.alpha, self.euler[0])
+        pitch = recursionScan((self.alpha * gyro[:, 1] * delta_time) + ((1 - self.alpha) * accel_pitch), self.alpha, self.euler[1])
+
+        # Yaw has no absolute reference (integrated gyroscope rate)
+        yaw = self.euler[2] + np.cumsum(gyro[:, 2] * delta_time)
+        yaw = ((yaw + 180.0) % 360.0) - 180.0
+
+        # Return data
+        return np.stack([roll, pitch, yaw], axis=1)
+
+    def updateMadgwick(self, accel, gyro, delta_time):
+        """
+            Method for running Madgwick filter over a block, returns
+            (N, 4) quaternion array
+            -------------------------------------
+            Parameters
+            accel: (N, 3) accelerometer data
+            gyro: (N, 3) gyroscope rate (in radian per second)
+            delta_time: (N,) sample periods (in second)
+        """
+        # Declare internal variables
+        sample_num = accel.shape[0]
+        interval = self.correction_interval
+
+        # Rotation of each sample period (exact for constant rate)
+        angle = np.linalg.norm(gyro, axis=1) * delta_time
+        axis_scale = np.where(angle > 0, np.sin(angle / 2) / np.where(angle > 0, angle, 1.0), 0.5) * delta_time
+        delta_quat = np.column_stack([np.cos(angle / 2), gyro * axis_scale[:, np.newaxis]])
+
+        # Align block to correction segments (identity rotation as padding)
+        pad_front = self.correction_phase
+        segment_num = -(-(pad_front + sample_num) // interval)
+        pad_back = (segment_num * interval) - pad_front - sample_num
+        segment_quat = np.zeros((segment_num * interval, 4))
+        segment_quat[:, 0] = 1.0
+        segment_quat[pad_front:pad_front + sample_num] = delta_quat
+        segment_quat = segment_quat.reshape(segment_num, interval, 4)
+
+        # Rotation from segment start to each sample of the segment
+        # (prefix product in log2(correction_interval) steps)
+        scan_step = 1
+        while (scan_step < interval):
+            segment_quat[:, scan_step:] = quatMultiply(segment_quat[:, :-scan_step], segment_quat[:, scan_step:])
+            scan_step *= 2
+
+        # Mean acceleration of each segment (padding excluded)
+        segment_accel = np.zeros((segment_num * interval, 3))
+        segment_accel[pad_front:pad_front + sample_num] = accel
+        segment_accel = segment_accel.reshape(segment_num, interval, 3).sum(axis=1)
+        segment_dt = np.zeros(segment_num * interval)
+        segment_dt[pad_front:pad_front + sample_num] = delta_time
+        segment_dt = segment_dt.reshape(segment_num, interval).sum(axis=1)
+
+        # First segment continues samples of previous block
+        segment_accel[0] += self.pending_accel
+        segment_dt[0] += self.pending_time
+        segment_accel = segment_accel.tolist()
+        segment_dt = segment_dt.tolist()
+
+        # Propagate segment by segment, correct at each complete segment end
+        segment_end = segment_quat[:, -1].tolist()
+        start_quat = np.empty((segment_num, 4))
+        end_quat = np.empty((segment_num, 4))
+        q_w, q_x, q_y, q_z = self.quaternion.tolist()
+        for segment_idx in range(segment_num):
+            start_quat[segment_idx] = (q_w, q_x, q_y, q_z)
+
+            # Gyroscope propagation over segment
+            r_w, r_x, r_y, r_z = segment_end[segment_idx]
+            q_w, q_x, q_y, q_z = ((q_w * r_w) - (q_x * r_x) - (q_y * r_y) - (q_z * r_z),
+                                  (q_w * r_x) + (q_x * r_w) + (q_y * r_z) - (q_z * r_y),
+                                  (q_w * r_y) - (q_x * r_z) + (q_y * r_w) + (q_z * r_x),
+                                  (q_w * r_z) + (q_x * r_y) - (q_y * r_x) + (q_z * r_w))
+
+            # Accelerometer correction (last segment may be incomplete)
+            if ((segment_idx < segment_num - 1) or (pad_back == 0)):
+                q_w, q_x, q_y, q_z = self.correctMadgwick((q_w, q_x, q_y, q_z), segment_accel[segment_idx], segment_dt[segment_idx])
+            end_quat[segment_idx] = (q_w, q_x, q_y, q_z)
+
+        # Orientation of each sample (segment start rotated within segment)
+        quaternions = quatMultiply(start_quat[:, np.newaxis], segment_quat)
+        quaternions[:, -1] = end_quat
+        quaternions = quaternions.reshape(-1, 4)[pad_front:pad_front + sample_num]
+        quaternions /= np.linalg.norm(quaternions, axis=1)[:, np.newaxis]
+
+        # Samples of incomplete last segment are continued by next block
+        self.correction_phase = (pad_front + sample_num) % interval
+        if (self.correction_phase > 0):
+            self.pending_accel = np.array(segment_accel[-1])
+            self.pending_time = segment_dt[-1]
+        else:
+            self.pending_accel = np.zeros(3)
+            self.pending_time = 0.0
+        self.quaternion = quaternions[-1].copy()
+
+        # Return data
+        return quaternions
+
+    def correctMadgwick(self, quat, accel, correction_time):
+        """
+            Method for applying Madgwick gradient descent step toward
+            measured gravity direction, returns normalized quaternion
+            -------------------------------------
+            Parameters
+            quat: Orientation (w, x, y, z)
+            accel: Acceleration (x, y, z), only direction is used
+            correction_time: Time covered by the correction (in second)
+        """
+        # Normalize quaternion and acceleration
+        q_w, q_x, q_y, q_z = quat
+        norm = math.sqrt((q_w * q_w) + (q_x * q_x) + (q_y * q_y) + (q_z * q_z))
+        q_w, q_x, q_y, q_z = q_w / norm, q_x / norm, q_y / norm, q_z / norm
+        a_x, a_y, a_z = accel
+        norm = math.sqrt((a_x * a_x) + (a_y * a_y) + (a_z * a_z))
+        if (norm == 0.0):
+            return q_w, q_x, q_y, q_z
+        a_x, a_y, a_z = a_x / norm, a_y / norm, a_z / norm
+
+        # Objective function (estimated minus measured gravity direction)
+        f_x = (2 * ((q_x * q_z) - (q_w * q_y))) - a_x
+        f_y = (2 * ((q_w * q_x) + (q_y * q_z))) - a_y
+        f_z = (1 - (2 * ((q_x * q_x) + (q_y * q_y)))) - a_z
+
+        # Gradient (Jacobian transpose times objective function)
+        s_w = (-2 * q_y * f_x) + (2 * q_x * f_y)
+        s_x = (2 * q_z * f_x) + (2 * q_w * f_y) - (4 * q_x * f_z)
+        s_y = (-2 * q_w * f_x) + (2 * q_z * f_y) - (4 * q_y * f_z)
+        s_z = (2 * q_x * f_x) + (2 * q_y * f_y)
+        norm = math.sqrt((s_w * s_w) + (s_x * s_x) + (s_y * s_y) + (s_z * s_z))
+        if (norm == 0.0):
+            return q_w, q_x, q_y, q_z
+
+        # Gradient descent step
+        step = self.beta * correction_time / norm
+        q_w, q_x, q_y, q_z = q_w - (step * s_w), q_x - (step * s_x), q_y - (step * s_y), q_z - (step * s_z)
+        norm = math.sqrt((q_w * q_w) + (q_x * q_x) + (q_y * q_y) + (q_z * q_z))
+        return q_w / norm, q_x / norm, q_y / norm, q_z / norm
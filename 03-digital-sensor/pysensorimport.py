@@ -0,0 +1,49 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : pysensorimport.py
+#  Module Dependency : -
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Lazy import helper shared by the sensor libraries, heavy
+#      dependencies (numpy, cffi) are loaded on first attribute
+#      access instead of at module import time
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import sys
+import importlib.util
+
+###################################################################
+#                      Function Declaration                       #
+###################################################################
+def lazyImport(module_name):
+    """
+        Function for importing module which is loaded on first
+        attribute access (already imported module is returned)
+        -------------------------------------
+        Parameters
+        module_name: Module name
+    """
+    if (module_name in sys.modules):
+        return sys.modules[module_name]
+    module_spec = importlib.util.find_spec(module_name)
+    if (module_spec is None):
+        raise ImportError("No module named '%s'" % module_name,
+                          name=module_name)
+    module_loader = importlib.util.LazyLoader(module_spec.loader)
+    module_spec.loader = module_loader
+    module = importlib.util.module_from_spec(module_spec)
+    sys.modules[module_name] = module
+    module_loader.exec_module(module)
+    return module
@@ -0,0 +1,260 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : pysensorinstr.py
+#  Module Dependency : -
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Opt-in instrumentation for sensor libraries, drivers report
+#      timed operations (bus transfer phases, conversion, sleep) to
+#      an instrument which keeps log-linear latency histograms and
+#      forwards events to a pluggable sink
+#      (sensor.instrument = SensorInstrument())
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import time
+import threading
+import collections
+
+###################################################################
+#                     Constants Declaration                       #
+###################################################################
+# Histogram precision (sub-buckets per power of two = 2 ** (bits - 1))
+HIST_SUB_BUCKET_BITS    = 6
+# Largest value with full precision is 2 ** HIST_MAX_VALUE_BITS ns (~18 minutes)
+HIST_MAX_VALUE_BITS     = 40
+
+# Percentiles in histogram summary
+HIST_SUMMARY_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+# Default number of events kept by EventLog
+EVENT_LOG_LEN           = 4096
+
+###################################################################
+#                      Function Declaration                       #
+###################################################################
+class LatencyHistogram:
+    def __init__(self, sub_bucket_bits=HIST_SUB_BUCKET_BITS, max_value_bits=HIST_MAX_VALUE_BITS):
+        """
+            Create a new log-linear (HDR style) latency histogram with
+            integer nanosecond values, relative bucket error is
+            2 ** -(sub_bucket_bits - 1)
+            -------------------------------------
+            Parameters
+            sub_bucket_bits: Number of significant bits per bucket
+            max_value_bits: Bit length of largest recorded value (larger values are clamped)
+        """
+        # Bucket layout (values below sub_bucket_count are exact)
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.sub_bucket_half = self.sub_bucket_count >> 1
+        self.max_value = (1 << max_value_bits) - 1
+        self.counts = [0] * (self.sub_bucket_count + ((max_value_bits - sub_bucket_bits) * self.sub_bucket_half))
+
+        # Summary values
+        self.count = 0
+        self.total = 0
+        self.min_value = 0
+        self.max_recorded = 0
+
+    def getIndex(self, value):
+        """
+            Method for getting bucket index of a value
+            -------------------------------------
+            Parameters
+            value: Non-negative integer value
+        """
+        if (value < self.sub_bucket_count):
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + ((shift - 1) * self.sub_bucket_half) + ((value >> shift) - self.sub_bucket_half)
+
+    def getValue(self, index):
+        """
+            Method for getting highest value of a bucket
+            -------------------------------------
+            Parameters
+            index: Bucket index
+        """
+        if (index < self.sub_bucket_count):
+            return index
+        shift = ((index - self.sub_bucket_count) // self.sub_bucket_half) + 1
+        sub_bucket = ((index - self.sub_bucket_count) % self.sub_bucket_half) + self.sub_bucket_half
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value):
+        """
+            Method for recording one value
+            -------------------------------------
+            Parameters
+            value: Latency (in nanosecond)
+        """
+        value = min(max(int(value), 0), self.max_value)
+        self.counts[self.getIndex(value)] += 1
+
+        # Update summary values
+        if ((self.count == 0) or (value < self.min_value)):
+            self.min_value = value
+        if (value > self.max_recorded):
+            self.max_recorded = value
+        self.count += 1
+        self.total += value
+
+    def getPercentile(self, percentile):
+        """
+            Method for getting value at percentile (highest value of
+            the bucket, in nanosecond)
+            -------------------------------------
+            Parameters
+            percentile: Percentile (0 - 100)
+        """
+        if (self.count == 0):
+            return 0
+        # Rank of requested value (at least first value)
+        target = max(int(round((percentile / 100.0) * self.count)), 1)
+        accumulated = 0
+        for index, bucket_count in enumerate(self.counts):
+            accumulated += bucket_count
+            if (accumulated >= target):
+                return min(self.getValue(index), self.max_recorded)
+        return self.max_recorded
+
+    def merge(self, histogram):
+        """
+            Method for adding values of another histogram with the
+            same layout
+            -------------------------------------
+            Parameters
+            histogram: LatencyHistogram instance
+        """
+        if (histogram.count == 0):
+            return
+        for index, bucket_count in enumerate(histogram.counts):
+            self.counts[index] += bucket_count
+        self.min_value = histogram.min_value if (self.count == 0) else min(self.min_value, histogram.min_value)
+        self.max_recorded = max(self.max_recorded, histogram.max_recorded)
+        self.count += histogram.count
+        self.total += histogram.total
+
+    def reset(self):
+        """
+            Method for removing all recorded values
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total = 0
+        self.min_value = 0
+        self.max_recorded = 0
+
+    def getSummary(self):
+        """
+            Method for getting histogram summary (count and latency
+            in microsecond)
+            -------------------------------------
+            Parameters
+            -
+        """
+        summary = {
+            "count":self.count,
+            "min_us":self.min_value / 1000,
+            "mean_us":(self.total / self.count / 1000) if (self.count > 0) else 0.0,
+            "max_us":self.max_recorded / 1000
+        }
+        for percentile in HIST_SUMMARY_PERCENTILES:
+            summary["p{:g}_us".format(percentile)] = self.getPercentile(percentile) / 1000
+        return summary
+
+class EventLog:
+    def __init__(self, max_len=EVENT_LOG_LEN):
+        """
+            Create a new event sink which keeps the latest events
+            -------------------------------------
+            Parameters
+            max_len: Maximum number of kept events
+        """
+        self.events = collections.deque(maxlen=max_len)
+
+    def __call__(self, op_name, reg_addr, byte_count, duration):
+        self.events.append((time.monotonic(), op_name, reg_addr, byte_count, duration))
+
+    def getEvents(self):
+        """
+            Method for getting copy of kept events, list of
+            (timestamp, operation, register address, byte count,
+            duration in second)
+            -------------------------------------
+            Parameters
+            -
+        """
+        return list(self.events)
+
+class SensorInstrument:
+    def __init__(self, sink=None):
+        """
+            Create a new instrument for sensor drivers, assign it to
+            sensor.instrument to enable instrumentation (None disables it)
+            -------------------------------------
+            Parameters
+            sink: Function called as sink(operation, register address,
+            byte count, duration in second) for each event (e.g. EventLog)
+        """
+        self.sink = sink
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def event(self, op_name, reg_addr, byte_count, duration):
+        """
+            Method for recording timed operation
+            -------------------------------------
+            Parameters
+            op_name: Operation name (e.g. "i2c_read.wait")
+            reg_addr: Register address (None if not a register access)
+            byte_count: Number of transferred bytes
+            duration: Operation duration (in second)
+        """
+        # Record latency
+        histogram = self.histograms.get(op_name)
+        if (histogram is None):
+            with self.lock:
+                histogram = self.histograms.setdefault(op_name, LatencyHistogram())
+        histogram.record(duration * 1e9)
+
+        # Forward event
+        if (self.sink is not None):
+            self.sink(op_name, reg_addr, byte_count, duration)
+
+    def getSummary(self):
+        """
+            Method for getting latency summary of all operations (can
+            be called from another thread while acquisition is running)
+            -------------------------------------
+            Parameters
+            -
+        """
+        with self.lock:
+            histograms = list(self.histograms.items())
+        return {op_name:histogram.getSummary() for op_name, histogram in sorted(histograms)}
+
+    def reset(self):
+        """
+            Method for removing all recorded latencies
+            -------------------------------------
+            Parameters
+            -
+        """
+        with self.lock:
+            self.histograms = {}
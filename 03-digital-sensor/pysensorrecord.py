@@ -0,0 +1,322 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : pysensorrecord.py
+#  Module Dependency : pympu6050.py, pybme280.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Append-only binary recording of raw sensor frames with
+#      calibration and configuration snapshot, recordings are
+#      replayed through memory-mapped NumPy views
+#
+#      File layout:
+#      - Magic (8 bytes) and header length (uint32, little endian)
+#      - JSON header (sensor type, record format, snapshot),
+#        padded with spaces to 8 byte boundary
+#      - Fixed size records (float64 timestamp + raw register frame)
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import json
+import struct
+import time
+import numpy as np
+
+from pympu6050 import *
+from pybme280 import *
+
+###################################################################
+#                     Constants Declaration                       #
+###################################################################
+# File Magic and Prefix Format (magic, header length)
+RECORD_MAGIC            = b"PSREC001"
+RECORD_PREFIX_FORMAT    = "<8sI"
+RECORD_PREFIX_LEN       = struct.calcsize(RECORD_PREFIX_FORMAT)
+
+# Default Number of Records per Flushed Block
+RECORD_BLOCK_LEN        = 4096
+
+# Record Format (MPU6050: big endian signed words, BME280: register bytes)
+RECORD_FRAME_FORMAT     = {
+    "MPU6050":(">i2", MPU6050_MOTION_DATA_LEN // 2),
+    "BME280":("u1", BME280_P_T_H_DATA_LEN)
+}
+
+# Driver Attributes Stored in Snapshot
+RECORD_SNAPSHOT_ATTRS   = {
+    "MPU6050":("dps_per_digit", "range_per_digit", "use_calibrate", "delta_gyro",
+               "actual_threshold", "threshold_gyro", "dlpf_mode", "smplrt_div", "sample_rate"),
+    "BME280":("calib_data", "settings")
+}
+
+###################################################################
+#                      Function Declaration                       #
+###################################################################
+def recordDtype(sensor_type):
+    """
+        Function for getting record dtype of a sensor type
+        -------------------------------------
+        Parameters
+        sensor_type: "MPU6050" or "BME280"
+    """
+    frame_type, frame_num = RECORD_FRAME_FORMAT[sensor_type]
+    return np.dtype([("timestamp", "<f8"), ("frame", frame_type, (frame_num,))])
+
+class SensorRecorder:
+    def __init__(self, file_path, sensor, block_len=RECORD_BLOCK_LEN, metadata=None):
+        """
+            Create a new recording file (existing file is overwritten)
+            and write header with sensor snapshot
+            -------------------------------------
+            Parameters
+            file_path: Recording file path
+            sensor: MPU6050 or BME280 driver instance
+            block_len: Number of records per flushed block
+            metadata: Additional JSON serializable header data
+        """
+        # Check sensor type
+        if (isinstance(sensor, MPU6050)):
+            self.sensor_type = "MPU6050"
+        elif (isinstance(sensor, BME280)):
+            self.sensor_type = "BME280"
+        else:
+            raise TypeError("Sensor must be MPU6050 or BME280")
+
+        # Recorder properties
+        self.sensor = sensor
+        self.record_dtype = recordDtype(self.sensor_type)
+        self.block_len = block_len
+        self.record_count = 0
+
+        # Preallocated record block
+        self.block = np.zeros(block_len, dtype=self.record_dtype)
+        self.block_idx = 0
+        # Receive pointer to each frame of the block (I2C reads directly into block)
+        if (self.sensor_type == "MPU6050"):
+            self.frame_ptrs = [loadFFI().from_buffer("unsigned char []", self.block["frame"][i]) for i in range(block_len)]
+
+        # Create file and write header
+        self.file = open(file_path, "wb")
+        self.writeHeader(metadata)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def getSnapshot(self):
+        """
+            Method for getting calibration and configuration snapshot
+            of the sensor
+            -------------------------------------
+            Parameters
+            -
+        """
+        return {attr:getattr(self.sensor, attr) for attr in RECORD_SNAPSHOT_ATTRS[self.sensor_type]}
+
+    def writeHeader(self, metadata):
+        """
+            Method for writing file prefix and JSON header
+            -------------------------------------
+            Parameters
+            metadata: Additional JSON serializable header data
+        """
+        # Encode header
+        header = {
+            "sensor_type":self.sensor_type,
+            "record_format":self.record_dtype.descr,
+            "created":time.time(),
+            "snapshot":self.getSnapshot(),
+            "metadata":metadata
+        }
+        header_data = json.dumps(header, default=float).encode("utf-8")
+
+        # Pad header so that records start at 8 byte boundary
+        pad_len = -(RECORD_PREFIX_LEN + len(header_data)) % 8
+        header_data += b" " * pad_len
+
+        # Write prefix and header
+        self.file.write(struct.pack(RECORD_PREFIX_FORMAT, RECORD_MAGIC, len(header_data)))
+        self.file.write(header_data)
+
+    def recordSample(self):
+        """
+            Method for reading one raw frame from sensor directly into
+            the record block
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Store timestamp
+        record = self.block[self.block_idx]
+        record["timestamp"] = time.monotonic()
+
+        # Read raw frame
+        if (self.sensor_type == "MPU6050"):
+            self.sensor.I2CBurstRead(MPU6050_REG_ACCEL_XOUT_H, MPU6050_MOTION_DATA_LEN, self.frame_ptrs[self.block_idx])
+        else:
+            record["frame"] = self.sensor.SPIRead(BME280_DATA_ADDR, BME280_P_T_H_DATA_LEN)
+
+        # Flush full block
+        self.block_idx += 1
+        if (self.block_idx == self.block_len):
+            self.flush()
+
+    def writeFrames(self, timestamps, frames):
+        """
+            Method for appending batch of raw frames (e.g. from
+            SensorSampler.drain())
+            -------------------------------------
+            Parameters
+            timestamps: (N,) array of timestamps
+            frames: (N, frame_len) uint8 array of raw register frames
+        """
+        # Declare internal variables
+        frames = np.ascontiguousarray(frames, dtype=np.uint8)
+        frame_type, frame_num = RECORD_FRAME_FORMAT[self.sensor_type]
+        frame_idx = 0
+
+        while (frame_idx < len(timestamps)):
+            # Copy as many frames as fit into current block
+            copy_len = min(len(timestamps) - frame_idx, self.block_len - self.block_idx)
+            block_slice = self.block[self.block_idx:self.block_idx + copy_len]
+            block_slice["timestamp"] = timestamps[frame_idx:frame_idx + copy_len]
+            block_slice["frame"] = frames[frame_idx:frame_idx + copy_len].view(frame_type)
+
+            # Flush full block
+            self.block_idx += copy_len
+            frame_idx += copy_len
+            if (self.block_idx == self.block_len):
+                self.flush()
+
+    def flush(self):
+        """
+            Method for writing buffered records to file
+            -------------------------------------
+            Parameters
+            -
+        """
+        if (self.block_idx > 0):
+            self.file.write(memoryview(self.block[:self.block_idx]).cast("B"))
+            self.record_count += self.block_idx
+            self.block_idx = 0
+        self.file.flush()
+
+    def close(self):
+        """
+            Method for flushing buffered records and closing the file
+            -------------------------------------
+            Parameters
+            -
+        """
+        if (not(self.file.closed)):
+            self.flush()
+            self.file.close()
+
+class SensorReplay:
+    def __init__(self, file_path):
+        """
+            Open recording file as read-only memory-mapped records,
+            incomplete record at the end of file is ignored
+            -------------------------------------
+            Parameters
+            file_path: Recording file path
+        """
+        with open(file_path, "rb") as record_file:
+            # Read and check prefix
+            magic, header_len = struct.unpack(RECORD_PREFIX_FORMAT, record_file.read(RECORD_PREFIX_LEN))
+            if (magic != RECORD_MAGIC):
+                raise ValueError("{} isn't a sensor recording".format(file_path))
+
+            # Read header
+            header = json.loads(record_file.read(header_len).decode("utf-8"))
+            record_file.seek(0, 2)
+            file_len = record_file.tell()
+
+        # Recording properties
+        self.header = header
+        self.sensor_type = header["sensor_type"]
+        self.snapshot = header["snapshot"]
+        self.metadata = header["metadata"]
+        self.record_dtype = recordDtype(self.sensor_type)
+
+        # Memory-map complete records
+        data_offset = RECORD_PREFIX_LEN + header_len
+        self.record_count = (file_len - data_offset) // self.record_dtype.itemsize
+        if (self.record_count > 0):
+            self.records = np.memmap(file_path, dtype=self.record_dtype, mode="r", offset=data_offset, shape=(self.record_count,))
+        else:
+            self.records = np.zeros(0, dtype=self.record_dtype)
+
+        # Zero-copy views of timestamps and raw frames
+        self.timestamps = self.records["timestamp"]
+        self.frames = self.records["frame"]
+
+    def __len__(self):
+        return self.record_count
+
+    def createSensor(self):
+        """
+            Method for creating a driver instance without bus master
+            which holds the recorded snapshot, only for batch conversion
+            (convertAccelBatch, compensateDataBatch, ...)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Create instance without calling constructor (no bus access)
+        sensor_class = MPU6050 if (self.sensor_type == "MPU6050") else BME280
+        sensor = sensor_class.__new__(sensor_class)
+        sensor.master = None
+
+        # Restore snapshot
+        for attr, value in self.snapshot.items():
+            setattr(sensor, attr, value)
+
+        # Precompute compensation constants (snapshot may hold unsigned coefficients)
+        if (self.sensor_type == "BME280"):
+            sensor.calib_data = dict(sensor.calib_data)
+            sensor.prepareCompensation()
+        return sensor
+
+    def iterBlocks(self, block_len=RECORD_BLOCK_LEN):
+        """
+            Generator for iterating recording in blocks, yields
+            (timestamps, frames) views
+            -------------------------------------
+            Parameters
+            block_len: Number of records per block
+        """
+        for block_start in range(0, self.record_count, block_len):
+            yield self.timestamps[block_start:block_start + block_len], self.frames[block_start:block_start + block_len]
+
+    def convertFrames(self, frames, sensor=None):
+        """
+            Method for converting block of raw frames, returns (N, 7)
+            int16 accel/temp/gyro frames (MPU6050) or dictionary of
+            pressure, temperature and humidity arrays (BME280)
+            -------------------------------------
+            Parameters
+            frames: Raw frames (from frames or iterBlocks())
+            sensor: Driver instance for compensation (default: createSensor())
+        """
+        if (self.sensor_type == "MPU6050"):
+            # Native signed 16-bit data
+            return frames.astype(np.int16)
+        else:
+            # Parse and compensate data with recorded calibration data
+            if (sensor is None):
+                sensor = self.createSensor()
+            uncomp_pres, uncomp_temp, uncomp_humid = sensor.parseSensorDataBatch(frames)
+            return sensor.compensateDataBatch(uncomp_pres, uncomp_temp, uncomp_humid)
@@ -0,0 +1,274 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : pysensorsampler.py
+#  Module Dependency : pympu6050.py, pybme280.py, pysensorasync.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Background acquisition thread which reads raw sensor frames
+#      into a preallocated ring buffer, consumers read the buffer
+#      without blocking the sampling thread
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import time
+import threading
+import numpy as np
+
+from pympu6050 import *
+from pybme280 import *
+from pysensorasync import getBusLock
+
+###################################################################
+#                     Constants Declaration                       #
+###################################################################
+# Default Ring Buffer Length (samples)
+SAMPLER_BUFFER_LEN  = 1024
+
+###################################################################
+#                      Function Declaration                       #
+###################################################################
+class SensorSampler:
+    def __init__(self, sensor, sample_rate=None, buffer_len=SAMPLER_BUFFER_LEN, bus_lock=None):
+        """
+            Create a new background sampler for a sensor (MPU6050 stores
+            14 byte motion frames, BME280 stores 8 byte data frames),
+            the bus lock is held during each read, other users of the
+            bus master must hold the same lock
+            -------------------------------------
+            Parameters
+            sensor: MPU6050 or BME280 driver instance
+            sample_rate: Sampling rate in Hz (default: MPU6050 output
+            data rate read from sensor, BME280 has no default)
+            buffer_len: Number of samples in ring buffer
+            bus_lock: Lock held during bus access (default: getBusLock(sensor.master),
+            BusScheduler.getBusLock(master) for sensors which are also scheduled)
+        """
+        # Select frame format
+        if (isinstance(sensor, MPU6050)):
+            frame_len = MPU6050_MOTION_DATA_LEN
+            if (sample_rate is None):
+                sample_rate = sensor.loadSampleRate()
+        elif (isinstance(sensor, BME280)):
+            frame_len = BME280_P_T_H_DATA_LEN
+            if (sample_rate is None):
+                raise ValueError("BME280 sampler needs a sample rate")
+        else:
+            raise TypeError("Sensor must be MPU6050 or BME280")
+
+        # Sampler properties
+        self.sensor = sensor
+        self.bus_lock = bus_lock if (bus_lock is not None) else getBusLock(sensor.master)
+        self.sample_rate = sample_rate
+        self.buffer_len = buffer_len
+        self.frame_len = frame_len
+
+        # Preallocated ring buffer (raw register frames and sample time)
+        self.frames = np.zeros((buffer_len, frame_len), dtype=np.uint8)
+        self.timestamps = np.zeros(buffer_len, dtype=np.float64)
+        # Receive pointer to each ring buffer slot (I2C reads directly into slot)
+        self.frame_ptrs = [loadFFI().from_buffer("unsigned char[]", self.frames[i]) for i in range(buffer_len)]
+
+        # Total number of written samples (only written by sampling thread)
+        self.write_count = 0
+        # Read cursor for drain()
+        self.drain_cursor = 0
+
+        # Sampler status
+        self.sampler_stats = {
+            "samples":0,
+            "missed_deadlines":0,
+            "overrun_samples":0,
+            "overrun_reads":0
+        }
+        self.error = None
+
+        # Thread control
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        """
+            Method for starting background sampling thread
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Check if sampler is already running
+        if ((self.thread is not None) and (self.thread.is_alive())):
+            return
+
+        # Start thread
+        self.error = None
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.sampleLoop, daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=None):
+        """
+            Method for stopping background sampling thread
+            -------------------------------------
+            Parameters
+            timeout: Maximum time to wait for thread (in second)
+        """
+        self.stop_event.set()
+        if (self.thread is not None):
+            self.thread.join(timeout)
+
+    def isRunning(self):
+        """
+            Method for checking if sampling thread is running
+            -------------------------------------
+            Parameters
+            -
+        """
+        return (self.thread is not None) and (self.thread.is_alive())
+
+    def readFrame(self, slot):
+        """
+            Method for reading one raw frame from sensor into ring
+            buffer slot
+            -------------------------------------
+            Parameters
+            slot: Ring buffer slot index
+        """
+        if (self.frame_len == MPU6050_MOTION_DATA_LEN):
+            # Burst read directly into ring buffer slot
+            self.sensor.I2CBurstRead(MPU6050_REG_ACCEL_XOUT_H, MPU6050_MOTION_DATA_LEN, self.frame_ptrs[slot])
+        else:
+            # Burst read directly into ring buffer slot
+            self.sensor.SPIBurstRead(BME280_DATA_ADDR, BME280_P_T_H_DATA_LEN, self.frames[slot])
+
+    def sampleLoop(self):
+        """
+            Method for sampling thread main loop (deadline scheduling,
+            periods which have already passed are skipped)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Declare internal variables
+        period = 1.0 / self.sample_rate
+        start_time = time.monotonic()
+        sample_idx = 0
+
+        try:
+            while (not(self.stop_event.is_set())):
+                # Wait until next deadline
+                deadline = start_time + (sample_idx * period)
+                delay = deadline - time.monotonic()
+                if ((delay > 0) and (self.stop_event.wait(delay))):
+                    break
+
+                # Read new sample into next slot (bus may be shared with other threads)
+                slot = self.write_count % self.buffer_len
+                with self.bus_lock:
+                    self.timestamps[slot] = time.monotonic()
+                    self.readFrame(slot)
+
+                # Publish sample (consumer only reads slots below write_count)
+                self.write_count += 1
+                self.sampler_stats["samples"] = self.write_count
+
+                # Skip sample periods which have already passed
+                late_periods = int((time.monotonic() - deadline) / period)
+                if (late_periods > 0):
+                    self.sampler_stats["missed_deadlines"] += 1
+                sample_idx += 1 + late_periods
+        except Exception as sample_error:
+            # Keep error for consumer and stop sampling
+            self.error = sample_error
+
+    def latest(self):
+        """
+            Method for getting the latest sample without blocking,
+            returns (timestamp, frame) or None if no sample is available
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Get newest slot
+        write_count = self.write_count
+        if (write_count == 0):
+            return None
+        slot = (write_count - 1) % self.buffer_len
+
+        # Copy sample, retry if slot has been overwritten during copy
+        while (True):
+            timestamp = self.timestamps[slot]
+            frame = self.frames[slot].copy()
+            if ((self.write_count - write_count) < (self.buffer_len - 1)):
+                return timestamp, frame
+            write_count = self.write_count
+            slot = (write_count - 1) % self.buffer_len
+
+    def readSince(self, cursor):
+        """
+            Method for reading all samples written after cursor without
+            blocking, returns (timestamps, frames, new_cursor), samples
+            which have been overwritten are counted as overrun
+            -------------------------------------
+            Parameters
+            cursor: Sample count returned by previous read (0 for first read)
+        """
+        # Get available samples
+        write_count = self.write_count
+        # Skip samples which have already been overwritten
+        if ((write_count - cursor) > self.buffer_len):
+            self.sampler_stats["overrun_samples"] += write_count - self.buffer_len - cursor
+            self.sampler_stats["overrun_reads"] += 1
+            cursor = write_count - self.buffer_len
+
+        # Copy samples (ring buffer can wrap once)
+        slot_idx = np.arange(cursor, write_count) % self.buffer_len
+        timestamps = self.timestamps[slot_idx]
+        frames = self.frames[slot_idx]
+
+        # Drop samples which were overwritten during copy (including slot being written)
+        overwritten = (self.write_count - self.buffer_len + 1) - cursor
+        if (overwritten > 0):
+            self.sampler_stats["overrun_samples"] += overwritten
+            self.sampler_stats["overrun_reads"] += 1
+            timestamps = timestamps[overwritten:]
+            frames = frames[overwritten:]
+
+        # Return data with new cursor
+        return timestamps, frames, write_count
+
+    def drain(self):
+        """
+            Method for reading all samples which haven't been drained
+            yet, returns (timestamps, frames)
+            -------------------------------------
+            Parameters
+            -
+        """
+        timestamps, frames, self.drain_cursor = self.readSince(self.drain_cursor)
+        return timestamps, frames
+
+    def convertFrames(self, frames):
+        """
+            Method for converting raw frames, returns (N, 7) signed
+            accel/temp/gyro frames (MPU6050) or dictionary of pressure,
+            temperature and humidity arrays (BME280)
+            -------------------------------------
+            Parameters
+            frames: Raw frames from readSince() or drain()
+        """
+        if (self.frame_len == MPU6050_MOTION_DATA_LEN):
+            # Big endian 16-bit data
+            return frames.view(">i2").astype(np.int16)
+        else:
+            # Parse and compensate data
+            uncomp_pres, uncomp_temp, uncomp_humid = self.sensor.parseSensorDataBatch(frames)
+            return self.sensor.compensateDataBatch(uncomp_pres, uncomp_temp, uncomp_humid)
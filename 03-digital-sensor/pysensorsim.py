@@ -0,0 +1,1042 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : pysensorsim.py
+#  Module Dependency : -
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Simulated bus masters and sensor register models which can
+#      be used in place of the AXI IIC and AXI quad SPI IP core to
+#      run the sensor libraries without a PYNQ board and count bus
+#      transactions, with optional simulated clock which advances
+#      by modelled bus time (deterministic sensor sampling)
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import struct
+import threading
+
+###################################################################
+#                     Constants Declaration                       #
+###################################################################
+# Default bus timing
+SIM_IIC_SCL_FREQ              = 400000      # AXI IIC SCL clock (Hz)
+SIM_SPI_SCK_FREQ              = 6250000     # AXI quad SPI clock (100 MHz / 16, Hz)
+SIM_MMIO_ACCESS_TIME          = 1e-7        # AXI-Lite register access (second)
+
+# AXI IIC register offset
+SIM_IIC_ISR_ADDR              = 0x20
+
+# AXI IIC interrupt status bits
+SIM_IIC_ISR_TX_EMPTY          = 0x04
+SIM_IIC_ISR_RX_FULL           = 0x08
+
+# AXI quad SPI register offset
+SIM_SPI_CR_ADDR               = 0x60
+SIM_SPI_SR_ADDR               = 0x64
+SIM_SPI_DTR_ADDR              = 0x68
+SIM_SPI_DRR_ADDR              = 0x6C
+SIM_SPI_SSR_ADDR              = 0x70
+SIM_SPI_TX_OCY_ADDR           = 0x74
+SIM_SPI_RX_OCY_ADDR           = 0x78
+
+# AXI quad SPI control register bits
+SIM_SPI_CR_TX_RESET           = 0x20
+SIM_SPI_CR_RX_RESET           = 0x40
+SIM_SPI_CR_MANUAL_SS          = 0x80
+SIM_SPI_CR_INHIBIT            = 0x100
+
+# AXI quad SPI status register bits
+SIM_SPI_SR_RX_EMPTY           = 0x01
+SIM_SPI_SR_TX_EMPTY           = 0x04
+
+# MPU6050 register map size
+SIM_MPU6050_REG_LEN           = 128
+
+# MPU6050 FIFO size
+SIM_MPU6050_FIFO_SIZE         = 1024
+
+# MPU6050 register address used by the model
+SIM_MPU6050_REG_SMPLRT_DIV    = 0x19
+SIM_MPU6050_REG_CONFIG        = 0x1A
+SIM_MPU6050_REG_FIFO_EN       = 0x23
+SIM_MPU6050_REG_INT_ENABLE    = 0x38
+SIM_MPU6050_REG_INT_STATUS    = 0x3A
+SIM_MPU6050_REG_ACCEL_XOUT_H  = 0x3B
+SIM_MPU6050_REG_TEMP_OUT_H    = 0x41
+SIM_MPU6050_REG_GYRO_XOUT_H   = 0x43
+SIM_MPU6050_REG_USER_CTRL     = 0x6A
+SIM_MPU6050_REG_PWR_MGMT_1    = 0x6B
+SIM_MPU6050_REG_FIFO_COUNT_H  = 0x72
+SIM_MPU6050_REG_FIFO_COUNT_L  = 0x73
+SIM_MPU6050_REG_FIFO_R_W      = 0x74
+SIM_MPU6050_REG_WHO_AM_I      = 0x75
+
+# BME280 register address used by the model
+SIM_BME280_REG_CALIB_00       = 0x88
+SIM_BME280_REG_CHIP_ID        = 0xD0
+SIM_BME280_REG_RESET          = 0xE0
+SIM_BME280_REG_CALIB_26       = 0xE1
+SIM_BME280_REG_CTRL_HUM       = 0xF2
+SIM_BME280_REG_STATUS         = 0xF3
+SIM_BME280_REG_CTRL_MEAS      = 0xF4
+SIM_BME280_REG_CONFIG         = 0xF5
+SIM_BME280_REG_DATA           = 0xF7
+
+# BME280 oversampling value of osr setting and standby time of t_sb setting (ms)
+SIM_BME280_OSR_MAP            = (0, 1, 2, 4, 8, 16, 16, 16)
+SIM_BME280_STANDBY_MAP        = (0.5, 62.5, 125.0, 250.0, 500.0, 1000.0, 10.0, 20.0)
+
+# BME280 calibration data (datasheet example values)
+SIM_BME280_CALIB_00           = bytes([0x70, 0x6B, 0x43, 0x67, 0x18, 0xFC, 0x7D, 0x8E, 0x43, 0xD6, 0xD0, 0x0B, 0x27,
+                                       0x0B, 0x8C, 0x00, 0xF9, 0xFF, 0x8C, 0x3C, 0xF8, 0xC6, 0x70, 0x17, 0x00, 0x4B])
+SIM_BME280_CALIB_26           = bytes([0x62, 0x01, 0x00, 0x14, 0x2D, 0x03, 0x1E])
+
+###################################################################
+#                      Function Declaration                       #
+###################################################################
+class SimClock:
+    def __init__(self, start_time=0.0):
+        """
+            Create a new simulated clock, time only advances by bus
+            activity of connected masters or explicit sleep()
+            -------------------------------------
+            Parameters
+            start_time: Initial simulated time (in second)
+        """
+        self.sim_time = start_time
+        self.devices = []
+
+    def attach(self, device):
+        """
+            Method for connecting sensor model which is updated when
+            the clock advances
+            -------------------------------------
+            Parameters
+            device: Sensor model (e.g. SimMPU6050)
+        """
+        self.devices.append(device)
+        device.connectClock(self)
+
+    def monotonic(self):
+        """
+            Method for getting simulated time (same use as time.monotonic)
+            -------------------------------------
+            Parameters
+            -
+        """
+        return self.sim_time
+
+    def advance(self, delta_time):
+        """
+            Method for advancing simulated time
+            -------------------------------------
+            Parameters
+            delta_time: Elapsed time (in second)
+        """
+        self.sim_time += delta_time
+        for device in self.devices:
+            device.update(self.sim_time)
+
+    def sleep(self, delay):
+        """
+            Method for waiting in simulated time (same use as time.sleep)
+            -------------------------------------
+            Parameters
+            delay: Waiting time (in second)
+        """
+        if (delay > 0):
+            self.advance(delay)
+
+class SimInterrupt:
+    def __init__(self):
+        """
+            Create a new simulated interrupt line (wait source)
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.event = threading.Event()
+        self.trigger_count = 0
+
+    def trigger(self):
+        """
+            Method for triggering interrupt
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.trigger_count += 1
+        self.event.set()
+
+    def wait(self, timeout=None):
+        """
+            Method for waiting until interrupt is triggered, returns
+            TRUE if interrupt occurred before timeout
+            -------------------------------------
+            Parameters
+            timeout: Maximum waiting time (in second)
+        """
+        result = self.event.wait(timeout)
+        self.event.clear()
+        return result
+
+class SimMPU6050:
+    def __init__(self, chip_id=0x98):
+        """
+            Create a new register model of MPU6050 sensor
+            -------------------------------------
+            Parameters
+            chip_id: Value returned by WHO_AM_I register
+        """
+        # Register map, register pointer and FIFO content
+        self.regs = bytearray(SIM_MPU6050_REG_LEN)
+        self.reg_ptr = 0
+        self.fifo = bytearray()
+        self.int_line = None
+
+        # Sample generation in simulated time
+        self.clock = None
+        self.motion_source = None
+        self.sample_count = 0
+        self.next_sample_time = None
+
+        # Reset value of the registers
+        self.regs[SIM_MPU6050_REG_WHO_AM_I] = chip_id
+        self.regs[SIM_MPU6050_REG_PWR_MGMT_1] = 0x40
+
+    def setMotion(self, accel, temperature, gyro):
+        """
+            Method for loading new sample into output registers
+            -------------------------------------
+            Parameters
+            accel: Raw accelerometer data (x, y, z)
+            temperature: Raw temperature data
+            gyro: Raw gyroscope data (x, y, z)
+        """
+        # Pack data as big-endian signed 16-bit value
+        sample = struct.pack(">7h", accel[0], accel[1], accel[2], temperature, gyro[0], gyro[1], gyro[2])
+        self.regs[SIM_MPU6050_REG_ACCEL_XOUT_H:SIM_MPU6050_REG_ACCEL_XOUT_H + 14] = sample
+
+    def setMotionSource(self, motion_source):
+        """
+            Method for setting function which generates new sample
+            data in each simulated sample period
+            -------------------------------------
+            Parameters
+            motion_source: Function called as motion_source(sample_count),
+            returns (accel, temperature, gyro) raw data
+        """
+        self.motion_source = motion_source
+
+    def connectClock(self, clock):
+        """
+            Method for connecting simulated clock (see SimClock.attach)
+            -------------------------------------
+            Parameters
+            clock: Simulated clock
+        """
+        self.clock = clock
+        self.next_sample_time = None
+
+    def getSampleRate(self):
+        """
+            Method for calculating output data rate from CONFIG and
+            SMPLRT_DIV registers (in Hz)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Gyroscope output rate is 8 kHz when DLPF is disabled
+        dlpf_cfg = self.regs[SIM_MPU6050_REG_CONFIG] & 0x07
+        gyro_rate = 8000 if (dlpf_cfg in (0, 7)) else 1000
+        return gyro_rate / (1 + self.regs[SIM_MPU6050_REG_SMPLRT_DIV])
+
+    def update(self, sim_time):
+        """
+            Method for generating all samples up to simulated time
+            (no samples are generated in sleep mode)
+            -------------------------------------
+            Parameters
+            sim_time: Current simulated time (in second)
+        """
+        # Check sleep mode
+        if (self.regs[SIM_MPU6050_REG_PWR_MGMT_1] & 0x40):
+            self.next_sample_time = None
+            return
+
+        # First sample period starts now
+        period = 1.0 / self.getSampleRate()
+        if (self.next_sample_time is None):
+            self.next_sample_time = sim_time + period
+
+        # Generate samples of all elapsed sample periods
+        while (self.next_sample_time <= sim_time):
+            if (self.motion_source is not None):
+                accel, temperature, gyro = self.motion_source(self.sample_count)
+                self.setMotion(accel, temperature, gyro)
+            self.pushSample()
+            self.sample_count += 1
+            self.next_sample_time += period
+
+    def pushSample(self):
+        """
+            Method for simulating end of sample period (sets data ready
+            status and writes current output registers to FIFO)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Set data ready status and trigger INT pin
+        self.regs[SIM_MPU6050_REG_INT_STATUS] |= 0x01
+        if ((self.int_line is not None) and (self.regs[SIM_MPU6050_REG_INT_ENABLE] & 0x01)):
+            self.int_line.trigger()
+
+        # Check whether FIFO is enabled
+        if (not(self.regs[SIM_MPU6050_REG_USER_CTRL] & 0x40)):
+            return
+
+        # Build FIFO frame in register order
+        fifo_en = self.regs[SIM_MPU6050_REG_FIFO_EN]
+        frame = bytearray()
+        if (fifo_en & 0x08):
+            frame += self.regs[SIM_MPU6050_REG_ACCEL_XOUT_H:SIM_MPU6050_REG_ACCEL_XOUT_H + 6]
+        if (fifo_en & 0x80):
+            frame += self.regs[SIM_MPU6050_REG_TEMP_OUT_H:SIM_MPU6050_REG_TEMP_OUT_H + 2]
+        for axis in range(3):
+            if (fifo_en & (0x40 >> axis)):
+                reg_addr = SIM_MPU6050_REG_GYRO_XOUT_H + (2 * axis)
+                frame += self.regs[reg_addr:reg_addr + 2]
+
+        # Oldest data is lost when FIFO overflows
+        self.fifo += frame
+        if (len(self.fifo) > SIM_MPU6050_FIFO_SIZE):
+            del self.fifo[:len(self.fifo) - SIM_MPU6050_FIFO_SIZE]
+            self.regs[SIM_MPU6050_REG_INT_STATUS] |= 0x10
+
+    def connectInterrupt(self, int_line):
+        """
+            Method for connecting INT pin to simulated interrupt line
+            -------------------------------------
+            Parameters
+            int_line: Interrupt line (e.g. SimInterrupt)
+        """
+        self.int_line = int_line
+
+    def readRegister(self, reg_addr):
+        """
+            Method for reading register value (including side effects)
+            -------------------------------------
+            Parameters
+            reg_addr: Register address
+        """
+        if (reg_addr == SIM_MPU6050_REG_FIFO_COUNT_H):
+            return (len(self.fifo) >> 8) & 0xFF
+        elif (reg_addr == SIM_MPU6050_REG_FIFO_COUNT_L):
+            return len(self.fifo) & 0xFF
+        elif (reg_addr == SIM_MPU6050_REG_FIFO_R_W):
+            if (len(self.fifo) == 0):
+                return 0
+            value = self.fifo[0]
+            del self.fifo[0]
+            return value
+        elif (reg_addr == SIM_MPU6050_REG_INT_STATUS):
+            # Interrupt status is cleared on read
+            value = self.regs[reg_addr]
+            self.regs[reg_addr] = 0
+            return value
+        else:
+            return self.regs[reg_addr]
+
+    def writeRegister(self, reg_addr, data):
+        """
+            Method for writing register value (including side effects)
+            -------------------------------------
+            Parameters
+            reg_addr: Register address
+            data: Data to be written
+        """
+        if (reg_addr == SIM_MPU6050_REG_USER_CTRL):
+            # FIFO reset bit is cleared automatically
+            if (data & 0x04):
+                self.fifo = bytearray()
+            data &= ~0x04
+        self.regs[reg_addr] = data & 0xFF
+
+    def i2cWrite(self, data):
+        """
+            Method for handling write transaction from master
+            -------------------------------------
+            Parameters
+            data: Received bytes (register address followed by data)
+        """
+        # First byte sets register pointer
+        self.reg_ptr = data[0] % SIM_MPU6050_REG_LEN
+        # Remaining bytes are written with auto-increment
+        for value in data[1:]:
+            self.writeRegister(self.reg_ptr, value)
+            self.reg_ptr = (self.reg_ptr + 1) % SIM_MPU6050_REG_LEN
+
+    def i2cRead(self, length):
+        """
+            Method for handling read transaction from master
+            -------------------------------------
+            Parameters
+            length: Number of bytes requested by master
+        """
+        # Read bytes with auto-increment (FIFO register is not incremented)
+        data = []
+        for i in range(length):
+            data.append(self.readRegister(self.reg_ptr))
+            if (self.reg_ptr != SIM_MPU6050_REG_FIFO_R_W):
+                self.reg_ptr = (self.reg_ptr + 1) % SIM_MPU6050_REG_LEN
+        # Return data
+        return data
+
+class SimAxiIIC:
+    def __init__(self, scl_freq=SIM_IIC_SCL_FREQ, clock=None, mmio_time=SIM_MMIO_ACCESS_TIME):
+        """
+            Create a new simulated AXI IIC master
+            (same send/receive/wait/read/write interface as AxiIIC)
+            -------------------------------------
+            Parameters
+            scl_freq: SCL clock frequency (in Hz)
+            clock: Simulated clock advanced by bus time (optional)
+            mmio_time: Time of one IP core register access (in second)
+        """
+        # Attached slave devices and IP core registers
+        self.devices = {}
+        self.registers = {
+            SIM_IIC_ISR_ADDR:0
+        }
+
+        # Bus timing
+        self.scl_freq = scl_freq
+        self.clock = clock
+        self.mmio_time = mmio_time
+
+        # Transaction statistics (bus and MMIO time in second)
+        self.stats = {
+            "transactions":0,
+            "bytes_sent":0,
+            "bytes_received":0,
+            "waits":0,
+            "mmio_reads":0,
+            "mmio_writes":0,
+            "bus_time":0.0,
+            "mmio_time":0.0
+        }
+
+    def attach(self, slv_addr, device):
+        """
+            Method for attaching simulated slave to the bus
+            -------------------------------------
+            Parameters
+            slv_addr: I2C slave address
+            device: Slave register model (e.g. SimMPU6050)
+        """
+        self.devices[slv_addr] = device
+
+    def resetStats(self):
+        """
+            Method for resetting transaction statistics
+            -------------------------------------
+            Parameters
+            -
+        """
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def addTime(self, bus_time, mmio_time):
+        """
+            Method for accounting bus and MMIO time (advances clock)
+            -------------------------------------
+            Parameters
+            bus_time: I2C bus time (in second)
+            mmio_time: Register access time (in second)
+        """
+        self.stats["bus_time"] += bus_time
+        self.stats["mmio_time"] += mmio_time
+        if (self.clock is not None):
+            self.clock.advance(bus_time + mmio_time)
+
+    def transactionTime(self, length):
+        """
+            Method for calculating I2C transaction time (start, address
+            byte, data bytes with ACK bit and stop or repeated start)
+            -------------------------------------
+            Parameters
+            length: Number of data bytes
+        """
+        return (2 + (9 * (1 + length))) / self.scl_freq
+
+    def getDevice(self, slv_addr):
+        """
+            Method for getting attached slave (NACK if not found)
+            -------------------------------------
+            Parameters
+            slv_addr: I2C slave address
+        """
+        if (slv_addr not in self.devices):
+            raise RuntimeError("No I2C device at address {}".format(hex(slv_addr)))
+        return self.devices[slv_addr]
+
+    def send(self, address, data, length, option=0):
+        """
+            Method for sending data to I2C slave
+            -------------------------------------
+            Parameters
+            address: I2C slave address
+            data: Buffer which contains data to be sent
+            length: Number of bytes to be sent
+            option: Set to 1 for repeated start (no stop condition)
+        """
+        device = self.getDevice(address)
+        device.i2cWrite([data[i] for i in range(length)])
+
+        # Update status and statistics
+        self.registers[SIM_IIC_ISR_ADDR] |= SIM_IIC_ISR_TX_EMPTY
+        self.stats["transactions"] += 1
+        self.stats["bytes_sent"] += length
+        self.addTime(self.transactionTime(length), 0.0)
+
+    def receive(self, address, data, length, option=0):
+        """
+            Method for receiving data from I2C slave
+            -------------------------------------
+            Parameters
+            address: I2C slave address
+            data: Buffer for storing received data
+            length: Number of bytes to be received
+            option: Set to 1 for repeated start (no stop condition)
+        """
+        device = self.getDevice(address)
+        rx_data = device.i2cRead(length)
+        for i in range(length):
+            data[i] = rx_data[i]
+
+        # Update status and statistics
+        self.registers[SIM_IIC_ISR_ADDR] |= SIM_IIC_ISR_RX_FULL
+        self.stats["transactions"] += 1
+        self.stats["bytes_received"] += length
+        self.addTime(self.transactionTime(length), 0.0)
+
+    def wait(self):
+        """
+            Method for waiting until the transfer is done
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.stats["waits"] += 1
+
+    def read(self, offset):
+        """
+            Method for reading AXI IIC register
+            -------------------------------------
+            Parameters
+            offset: Register offset
+        """
+        self.stats["mmio_reads"] += 1
+        self.addTime(0.0, self.mmio_time)
+        return self.registers.get(offset, 0)
+
+    def write(self, offset, value):
+        """
+            Method for writing AXI IIC register
+            -------------------------------------
+            Parameters
+            offset: Register offset
+            value: Data to be written
+        """
+        self.stats["mmio_writes"] += 1
+        self.addTime(0.0, self.mmio_time)
+        # Interrupt status register is cleared by writing 1 (toggle on write)
+        if (offset == SIM_IIC_ISR_ADDR):
+            self.registers[offset] &= ~value
+        else:
+            self.registers[offset] = value
+
+class SimBME280:
+    def __init__(self, chip_id=0x60):
+        """
+            Create a new register model of BME280 sensor (SPI interface)
+            -------------------------------------
+            Parameters
+            chip_id: Value returned by chip ID register
+        """
+        # Register map and SPI frame state
+        self.regs = bytearray(256)
+        self.chip_id = chip_id
+        self.reg_ptr = 0
+        self.frame_pos = 0
+        self.read_mode = False
+
+        # Measurement in simulated time
+        self.clock = None
+        self.sim_time = 0.0
+        self.data_source = None
+        self.meas_count = 0
+        self.reset()
+
+    def reset(self):
+        """
+            Method for loading reset value of the registers
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.meas_end_time = None
+        self.next_meas_time = None
+        self.regs[:] = bytearray(256)
+        self.regs[SIM_BME280_REG_CHIP_ID] = self.chip_id
+        self.regs[SIM_BME280_REG_CALIB_00:SIM_BME280_REG_CALIB_00 + 26] = SIM_BME280_CALIB_00
+        self.regs[SIM_BME280_REG_CALIB_26:SIM_BME280_REG_CALIB_26 + 7] = SIM_BME280_CALIB_26
+
+    def setRawData(self, uncomp_pres, uncomp_temp, uncomp_humid):
+        """
+            Method for loading new conversion result into data registers
+            -------------------------------------
+            Parameters
+            uncomp_pres: Uncompensated pressure data (20-bit)
+            uncomp_temp: Uncompensated temperature data (20-bit)
+            uncomp_humid: Uncompensated humidity data (16-bit)
+        """
+        self.regs[SIM_BME280_REG_DATA:SIM_BME280_REG_DATA + 8] = bytes([
+            (uncomp_pres >> 12) & 0xFF, (uncomp_pres >> 4) & 0xFF, (uncomp_pres << 4) & 0xF0,
+            (uncomp_temp >> 12) & 0xFF, (uncomp_temp >> 4) & 0xFF, (uncomp_temp << 4) & 0xF0,
+            (uncomp_humid >> 8) & 0xFF, uncomp_humid & 0xFF
+        ])
+
+    def setDataSource(self, data_source):
+        """
+            Method for setting function which generates new raw data
+            at the end of each measurement
+            -------------------------------------
+            Parameters
+            data_source: Function called as data_source(meas_count),
+            returns (uncomp_pres, uncomp_temp, uncomp_humid)
+        """
+        self.data_source = data_source
+
+    def connectClock(self, clock):
+        """
+            Method for connecting simulated clock (see SimClock.attach),
+            without clock forced measurements finish immediately
+            -------------------------------------
+            Parameters
+            clock: Simulated clock
+        """
+        self.clock = clock
+        self.sim_time = clock.monotonic()
+
+    def getMeasTime(self):
+        """
+            Method for calculating maximum measurement time from
+            oversampling settings (datasheet appendix B, in second)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Get oversampling values
+        temp_osr = SIM_BME280_OSR_MAP[(self.regs[SIM_BME280_REG_CTRL_MEAS] >> 5) & 0x07]
+        pres_osr = SIM_BME280_OSR_MAP[(self.regs[SIM_BME280_REG_CTRL_MEAS] >> 2) & 0x07]
+        humid_osr = SIM_BME280_OSR_MAP[self.regs[SIM_BME280_REG_CTRL_HUM] & 0x07]
+
+        # Calculate measurement time
+        meas_time = 1.25 + (2.3 * temp_osr)
+        if (pres_osr):
+            meas_time += (2.3 * pres_osr) + 0.575
+        if (humid_osr):
+            meas_time += (2.3 * humid_osr) + 0.575
+        return meas_time / 1000
+
+    def startMeasurement(self, start_time):
+        """
+            Method for starting measurement (sets measuring status)
+            -------------------------------------
+            Parameters
+            start_time: Measurement start time (in second)
+        """
+        self.meas_end_time = start_time + self.getMeasTime()
+        self.regs[SIM_BME280_REG_STATUS] |= 0x08
+
+    def finishMeasurement(self):
+        """
+            Method for finishing measurement (updates data registers
+            and returns to sleep mode after forced measurement)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Load new conversion result
+        if (self.data_source is not None):
+            uncomp_pres, uncomp_temp, uncomp_humid = self.data_source(self.meas_count)
+            self.setRawData(uncomp_pres, uncomp_temp, uncomp_humid)
+        self.meas_count += 1
+
+        # Clear measuring status
+        self.meas_end_time = None
+        self.regs[SIM_BME280_REG_STATUS] &= ~0x08
+        if ((self.regs[SIM_BME280_REG_CTRL_MEAS] & 0x03) in (0x01, 0x02)):
+            self.regs[SIM_BME280_REG_CTRL_MEAS] &= ~0x03
+
+    def update(self, sim_time):
+        """
+            Method for running measurements up to simulated time
+            (normal mode measures every measurement + standby time)
+            -------------------------------------
+            Parameters
+            sim_time: Current simulated time (in second)
+        """
+        self.sim_time = sim_time
+        while (True):
+            if (self.meas_end_time is not None):
+                # Measurement in progress
+                if (self.meas_end_time > sim_time):
+                    break
+                meas_end_time = self.meas_end_time
+                self.finishMeasurement()
+                # Next normal mode measurement starts after standby time
+                if ((self.regs[SIM_BME280_REG_CTRL_MEAS] & 0x03) == 0x03):
+                    stby_time = SIM_BME280_STANDBY_MAP[(self.regs[SIM_BME280_REG_CONFIG] >> 5) & 0x07] / 1000
+                    self.next_meas_time = meas_end_time + stby_time
+            elif ((self.next_meas_time is not None) and (self.next_meas_time <= sim_time)):
+                # Start normal mode measurement
+                self.startMeasurement(self.next_meas_time)
+                self.next_meas_time = None
+            else:
+                break
+
+    def writeRegister(self, reg_addr, data):
+        """
+            Method for writing register value (including side effects)
+            -------------------------------------
+            Parameters
+            reg_addr: Register address
+            data: Data to be written
+        """
+        # Soft reset command
+        if (reg_addr == SIM_BME280_REG_RESET):
+            if (data == 0xB6):
+                self.reset()
+            return
+        self.regs[reg_addr] = data & 0xFF
+
+        # Power mode change
+        if (reg_addr == SIM_BME280_REG_CTRL_MEAS):
+            sensor_mode = data & 0x03
+            if (sensor_mode == 0x00):
+                # Sleep mode stops normal mode measurements
+                self.next_meas_time = None
+            elif (sensor_mode == 0x03):
+                # Normal mode starts measuring immediately (only modelled with clock)
+                if ((self.clock is not None) and (self.meas_end_time is None) and (self.next_meas_time is None)):
+                    self.next_meas_time = self.sim_time
+                    self.update(self.sim_time)
+            elif (self.meas_end_time is None):
+                # Forced mode (finished immediately without clock)
+                self.startMeasurement(self.sim_time)
+                if (self.clock is None):
+                    self.finishMeasurement()
+
+    def spiBegin(self):
+        """
+            Method for handling chip select assertion
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.frame_pos = 0
+
+    def spiEnd(self):
+        """
+            Method for handling chip select deassertion
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.frame_pos = 0
+
+    def spiTransfer(self, mosi_data):
+        """
+            Method for handling one byte of SPI frame, returns MISO byte
+            -------------------------------------
+            Parameters
+            mosi_data: Byte sent by master
+        """
+        # Control byte (bit 7 is read/write flag)
+        if ((self.frame_pos == 0) or (not(self.read_mode) and (self.frame_pos % 2 == 0))):
+            self.read_mode = bool(mosi_data & 0x80)
+            self.reg_ptr = mosi_data | 0x80
+            self.frame_pos += 1
+            return 0x00
+
+        self.frame_pos += 1
+        # Read data with auto-increment
+        if (self.read_mode):
+            miso_data = self.regs[self.reg_ptr]
+            self.reg_ptr = (self.reg_ptr + 1) & 0xFF
+            return miso_data
+        # Write data
+        self.writeRegister(self.reg_ptr, mosi_data)
+        return 0x00
+
+class SimAxiQuadSPI:
+    def __init__(self, device, word_len=16, sck_freq=SIM_SPI_SCK_FREQ, clock=None, mmio_time=SIM_MMIO_ACCESS_TIME,
+                 shift_timing=False):
+        """
+            Create a new simulated AXI quad SPI master (MMIO interface)
+            -------------------------------------
+            Parameters
+            device: Slave register model (e.g. SimBME280)
+            word_len: Transaction width of the IP core (in bit)
+            sck_freq: SPI clock frequency (in Hz)
+            clock: Simulated clock advanced by bus time (optional)
+            mmio_time: Time of one IP core register access (in second)
+            shift_timing: Set to TRUE to shift words while time passes
+            (FIFO reset or deselect cuts words which are still queued),
+            otherwise TX FIFO is shifted out at once
+        """
+        # Attached slave device and IP core registers
+        self.device = device
+        self.word_len = word_len
+        self.registers = {
+            SIM_SPI_CR_ADDR:0,
+            SIM_SPI_SSR_ADDR:0xFF
+        }
+        self.tx_fifo = []
+        self.rx_fifo = []
+        self.frame_active = False
+
+        # Bus timing (local time is used without clock)
+        self.sck_freq = sck_freq
+        self.clock = clock
+        self.mmio_time = mmio_time
+        self.shift_timing = shift_timing
+        self.local_time = 0.0
+        # End time of word in shift register (shift timing mode)
+        self.word_end_time = None
+
+        # Transaction statistics (bus and MMIO time in second)
+        self.stats = {
+            "frames":0,
+            "words":0,
+            "bytes":0,
+            "mmio_reads":0,
+            "mmio_writes":0,
+            "bus_time":0.0,
+            "mmio_time":0.0,
+            "aborted_words":0
+        }
+
+    def resetStats(self):
+        """
+            Method for resetting transaction statistics
+            -------------------------------------
+            Parameters
+            -
+        """
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def addTime(self, bus_time, mmio_time):
+        """
+            Method for accounting bus and MMIO time (advances clock)
+            -------------------------------------
+            Parameters
+            bus_time: SPI bus time (in second)
+            mmio_time: Register access time (in second)
+        """
+        self.stats["bus_time"] += bus_time
+        self.stats["mmio_time"] += mmio_time
+        self.local_time += bus_time + mmio_time
+        if (self.clock is not None):
+            self.clock.advance(bus_time + mmio_time)
+
+    def getTime(self):
+        """
+            Method for getting current bus time (in second)
+            -------------------------------------
+            Parameters
+            -
+        """
+        return self.clock.monotonic() if (self.clock is not None) else self.local_time
+
+    def beginFrame(self):
+        """
+            Method for asserting chip select
+            -------------------------------------
+            Parameters
+            -
+        """
+        if (not(self.frame_active)):
+            self.frame_active = True
+            self.device.spiBegin()
+            self.stats["frames"] += 1
+
+    def endFrame(self):
+        """
+            Method for deasserting chip select
+            -------------------------------------
+            Parameters
+            -
+        """
+        if (self.frame_active):
+            self.frame_active = False
+            self.device.spiEnd()
+
+    def transfer(self):
+        """
+            Method for shifting out TX FIFO content
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Check whether master transaction is inhibited
+        control = self.registers[SIM_SPI_CR_ADDR]
+        if ((control & SIM_SPI_CR_INHIBIT) or (len(self.tx_fifo) == 0)):
+            return
+        manual_ss = control & SIM_SPI_CR_MANUAL_SS
+
+        # Chip select is asserted while TX FIFO is not empty (automatic
+        # mode) or while slave select register is low (manual mode)
+        if (manual_ss and (self.registers[SIM_SPI_SSR_ADDR] & 0x01)):
+            self.tx_fifo = []
+            return
+        self.beginFrame()
+
+        # Shift timing mode: first word ends one word time from now (see shiftWords)
+        if (self.shift_timing):
+            if (self.word_end_time is None):
+                self.word_end_time = self.getTime() + (self.word_len / self.sck_freq)
+            return
+
+        word_num = len(self.tx_fifo)
+        while (len(self.tx_fifo) > 0):
+            self.shiftWord()
+        if (not(manual_ss)):
+            self.endFrame()
+
+        # Shift time of all words
+        self.addTime((word_num * self.word_len) / self.sck_freq, 0.0)
+
+    def shiftWord(self):
+        """
+            Method for shifting first TX FIFO word to slave
+            -------------------------------------
+            Parameters
+            -
+        """
+        tx_word = self.tx_fifo.pop(0)
+        rx_word = 0
+        for shift in range(self.word_len - 8, -8, -8):
+            rx_word = (rx_word << 8) | self.device.spiTransfer((tx_word >> shift) & 0xFF)
+        self.rx_fifo.append(rx_word)
+        self.stats["words"] += 1
+        self.stats["bytes"] += self.word_len // 8
+
+    def shiftWords(self):
+        """
+            Method for shifting all words which have ended until
+            current bus time (shift timing mode)
+            -------------------------------------
+            Parameters
+            -
+        """
+        # Check whether a word is being shifted
+        if (self.word_end_time is None):
+            return
+        word_time = self.word_len / self.sck_freq
+        current_time = self.getTime()
+
+        # Shift ended words (time has already passed)
+        while ((len(self.tx_fifo) > 0) and (self.word_end_time <= current_time)):
+            self.shiftWord()
+            self.stats["bus_time"] += word_time
+            self.word_end_time += word_time
+
+        # Transfer ends with empty TX FIFO (inhibited master starts next word on release)
+        control = self.registers[SIM_SPI_CR_ADDR]
+        if ((len(self.tx_fifo) == 0) or (control & SIM_SPI_CR_INHIBIT)):
+            self.word_end_time = None
+            if ((len(self.tx_fifo) == 0) and not(control & SIM_SPI_CR_MANUAL_SS)):
+                self.endFrame()
+
+    def abortWords(self):
+        """
+            Method for dropping words which haven't been shifted yet
+            (counted in aborted_words)
+            -------------------------------------
+            Parameters
+            -
+        """
+        self.stats["aborted_words"] += len(self.tx_fifo)
+        self.tx_fifo = []
+        self.word_end_time = None
+
+    def read(self, offset):
+        """
+            Method for reading AXI quad SPI register
+            -------------------------------------
+            Parameters
+            offset: Register offset
+        """
+        self.stats["mmio_reads"] += 1
+        self.addTime(0.0, self.mmio_time)
+        self.shiftWords()
+        if (offset == SIM_SPI_DRR_ADDR):
+            return self.rx_fifo.pop(0) if (len(self.rx_fifo) > 0) else 0
+        elif (offset == SIM_SPI_SR_ADDR):
+            status = SIM_SPI_SR_TX_EMPTY if (len(self.tx_fifo) == 0) else 0
+            status |= SIM_SPI_SR_RX_EMPTY if (len(self.rx_fifo) == 0) else 0
+            return status
+        elif (offset == SIM_SPI_TX_OCY_ADDR):
+            # Occupancy register contains number of words - 1
+            return max(len(self.tx_fifo) - 1, 0)
+        elif (offset == SIM_SPI_RX_OCY_ADDR):
+            return max(len(self.rx_fifo) - 1, 0)
+        return self.registers.get(offset, 0)
+
+    def write(self, offset, value):
+        """
+            Method for writing AXI quad SPI register
+            -------------------------------------
+            Parameters
+            offset: Register offset
+            value: Data to be written
+        """
+        self.stats["mmio_writes"] += 1
+        self.addTime(0.0, self.mmio_time)
+        self.shiftWords()
+        if (offset == SIM_SPI_CR_ADDR):
+            # FIFO reset bits are cleared automatically
+            if (value & SIM_SPI_CR_TX_RESET):
+                self.abortWords()
+            if (value & SIM_SPI_CR_RX_RESET):
+                self.rx_fifo = []
+            self.registers[offset] = value & ~(SIM_SPI_CR_TX_RESET | SIM_SPI_CR_RX_RESET)
+            self.transfer()
+        elif (offset == SIM_SPI_DTR_ADDR):
+            self.tx_fifo.append(value)
+            self.transfer()
+        elif (offset == SIM_SPI_SSR_ADDR):
+            self.registers[offset] = value
+            # Slave deselected ends the frame (queued words are cut)
+            if (value & 0x01):
+                self.abortWords()
+                self.endFrame()
+            else:
+                self.transfer()
+        else:
+            self.registers[offset] = value
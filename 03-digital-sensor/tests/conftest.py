@@ -0,0 +1,80 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : conftest.py
+#  Module Dependency : pympu6050.py, pybme280.py, pysensorsim.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Shared pytest fixtures, sensor drivers run against the
+#      simulated bus masters of pysensorsim
+#      (python -m pytest tests)
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import os
+import sys
+import types
+import random
+
+import pytest
+
+# Sensor libraries are plain modules next to the tests directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pympu6050
+import pybme280
+from pympu6050 import *
+from pybme280 import *
+from pysensorsim import *
+
+###################################################################
+#                        Fixture Declaration                      #
+###################################################################
+@pytest.fixture
+def sim_clock(monkeypatch):
+    """
+        Simulated clock which replaces time of both drivers
+        (delays advance simulated time instead of sleeping)
+    """
+    clock = SimClock()
+    sim_time = types.SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep, perf_counter=clock.monotonic)
+    monkeypatch.setattr(pympu6050, "time", sim_time)
+    monkeypatch.setattr(pybme280, "time", sim_time)
+    return clock
+
+@pytest.fixture
+def sim_mpu(sim_clock):
+    """
+        Factory for MPU6050 driver on simulated I2C master, returns
+        (sensor, device) with gyroscope samples drawn around gyro_bias
+        with gyro_noise standard deviation
+    """
+    def createSensor(gyro_bias=(0, 0, 0), gyro_noise=0.0, seed=0):
+        # Simulated sensor on clocked I2C master
+        device = SimMPU6050()
+        master = SimAxiIIC(clock=sim_clock)
+        master.attach(MPU6050_I2C_ADDR_PRIM, device)
+        sim_clock.attach(device)
+
+        # Gyroscope data source (signed raw data)
+        rand_gen = random.Random(seed)
+        device.setMotionSource(lambda sample_count: ((0, 0, 16384), 0,
+                               tuple(int(round(rand_gen.gauss(bias, gyro_noise))) for bias in gyro_bias)))
+
+        # Driver delays advance simulated time
+        sensor = MPU6050(master, MPU6050_SCALE_2000DPS, MPU6050_RANGE_2G)
+        sensor.sleep = sim_clock.sleep
+        # Wait for first sample in data registers
+        sim_clock.sleep(0.01)
+        return sensor, device
+    return createSensor
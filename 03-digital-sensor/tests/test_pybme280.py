@@ -0,0 +1,80 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : test_pybme280.py
+#  Module Dependency : pybme280.py, pysensorsim.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Tests for BME280 compensation against the datasheet example
+#      (simulated sensor holds the datasheet calibration data)
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import numpy as np
+import pytest
+
+from pybme280 import *
+from pysensorsim import *
+
+###################################################################
+#                     Constants Declaration                       #
+###################################################################
+# Datasheet example (adc_P, adc_T -> Pa, degC)
+TEST_ADC_PRES       = 415148
+TEST_ADC_TEMP       = 519888
+TEST_PRESSURE       = 100653.27
+TEST_TEMPERATURE    = 25.08
+
+###################################################################
+#                        Test Declaration                         #
+###################################################################
+@pytest.fixture
+def bme_sensor():
+    sensor = BME280(SimAxiQuadSPI(SimBME280()), 0, 0)
+    sensor.getCalibData()
+    return sensor
+
+def test_calib_data_is_signed(bme_sensor):
+    # Datasheet example coefficients (negative T3 and P2)
+    assert bme_sensor.calib_data["temp_coef_1"] == 27504
+    assert bme_sensor.calib_data["temp_coef_3"] == -1000
+    assert bme_sensor.calib_data["pres_coef_2"] == -10685
+
+def test_compensate_data_datasheet(bme_sensor):
+    bme_sensor.uncomp_sensor_data["pressure"] = TEST_ADC_PRES
+    bme_sensor.uncomp_sensor_data["temperature"] = TEST_ADC_TEMP
+    bme_sensor.uncomp_sensor_data["humidity"] = 0
+    bme_sensor.compensateData(BME280_ALL)
+    assert bme_sensor.sensor_data["temperature"] == pytest.approx(TEST_TEMPERATURE, abs=0.005)
+    assert bme_sensor.sensor_data["pressure"] == pytest.approx(TEST_PRESSURE, abs=0.5)
+
+@pytest.mark.parametrize("method_name", ["compensateFloat", "compensateInteger"])
+def test_precomputed_compensation_datasheet(bme_sensor, method_name):
+    pressure, temperature, humidity = getattr(bme_sensor, method_name)(TEST_ADC_PRES, TEST_ADC_TEMP, 0)
+    assert temperature == pytest.approx(TEST_TEMPERATURE, abs=0.005)
+    assert pressure == pytest.approx(TEST_PRESSURE, abs=0.5)
+
+def test_batch_compensation_matches_scalar(bme_sensor):
+    uncomp_pres = np.array([TEST_ADC_PRES, 300000, 500000])
+    uncomp_temp = np.array([TEST_ADC_TEMP, 450000, 600000])
+    uncomp_humid = np.array([0, 20000, 40000])
+    comp_data = bme_sensor.compensateDataBatch(uncomp_pres, uncomp_temp, uncomp_humid)
+
+    # Same result as compensateData for each sample
+    for sample_idx in range(uncomp_pres.size):
+        bme_sensor.uncomp_sensor_data["pressure"] = int(uncomp_pres[sample_idx])
+        bme_sensor.uncomp_sensor_data["temperature"] = int(uncomp_temp[sample_idx])
+        bme_sensor.uncomp_sensor_data["humidity"] = int(uncomp_humid[sample_idx])
+        bme_sensor.compensateData(BME280_ALL)
+        for data_name in ("pressure", "temperature", "humidity"):
+            assert comp_data[data_name][sample_idx] == pytest.approx(bme_sensor.sensor_data[data_name], abs=1e-6)
@@ -0,0 +1,110 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : test_pympu6050.py
+#  Module Dependency : pympu6050.py, pysensorsim.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Tests for MPU6050 gyroscope calibration and FIFO overflow
+#      handling against the simulated sensor
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import numpy as np
+import pytest
+
+from pympu6050 import *
+
+###################################################################
+#                     Constants Declaration                       #
+###################################################################
+# Gyroscope bias around zero (noise of x axis crosses zero) and noise
+TEST_GYRO_BIAS      = (0, -20, 50)
+TEST_GYRO_NOISE     = 2.0
+
+###################################################################
+#                        Test Declaration                         #
+###################################################################
+@pytest.mark.parametrize("use_fifo", [False, True])
+def test_calibrate_gyro_signed_bias(sim_mpu, use_fifo):
+    sensor, device = sim_mpu(TEST_GYRO_BIAS, TEST_GYRO_NOISE)
+    sensor.calibrateGyro(1000, delay=0.001, use_fifo=use_fifo)
+
+    # Signed mean and standard deviation of the noise
+    delta_gyro = (sensor.delta_gyro["x_axis"], sensor.delta_gyro["y_axis"], sensor.delta_gyro["z_axis"])
+    threshold_data = (sensor.threshold_data["x_axis"], sensor.threshold_data["y_axis"], sensor.threshold_data["z_axis"])
+    assert delta_gyro == pytest.approx(TEST_GYRO_BIAS, abs=0.5)
+    assert threshold_data == pytest.approx((TEST_GYRO_NOISE,) * 3, rel=0.2)
+    assert np.allclose(sensor.getSignedDeltaGyro(), delta_gyro)
+
+def test_calibrated_conversion_keeps_rotation(sim_mpu):
+    sensor, device = sim_mpu(TEST_GYRO_BIAS, TEST_GYRO_NOISE)
+    sensor.calibrateGyro(500, delay=0.001)
+    sensor.setThreshold(3)
+
+    # Bias is removed, rotation above noise threshold is kept
+    raw_frames = np.array([[0, 0, 16384, 0, -20, 50], [0, 0, 16384, 1000, -1020, 1050]]).astype(np.uint16)
+    norm_gyro = sensor.convertGyroBatch(raw_frames)
+    assert np.all(norm_gyro[0] == 0.0)
+    assert norm_gyro[1] == pytest.approx(np.array([1000, -1000, 1000]) * sensor.dps_per_digit, abs=sensor.dps_per_digit)
+
+    # Scalar conversion gives the same result for negative raw data
+    device.setMotionSource(lambda sample_count: ((0, 0, 16384), 0, (1000, -1020, 1050)))
+    sensor.sleep(0.01)
+    sensor.getNormGyro()
+    assert sensor.norm_gyro["y_axis"] == pytest.approx(norm_gyro[1][1], abs=sensor.dps_per_digit)
+
+def test_read_fifo_discards_overflow(sim_mpu, sim_clock):
+    sensor, device = sim_mpu(TEST_GYRO_BIAS)
+    sensor.enableFIFO(MPU6050_FIFO_GYRO)
+
+    # FIFO overflows while it isn't drained, misaligned frames are discarded
+    sim_clock.sleep(1.0)
+    fifo_frames = sensor.readFIFO()
+    assert fifo_frames.shape == (0, 3)
+    assert sensor.fifo_overflow_count == 1
+
+    # FIFO is restarted with aligned frames
+    sim_clock.sleep(0.005)
+    fifo_frames = sensor.readFIFO()
+    assert fifo_frames.shape[0] > 0
+    assert np.all(fifo_frames == TEST_GYRO_BIAS)
+    sensor.disableFIFO()
+
+def test_read_fifo_without_channel(sim_mpu):
+    sensor, device = sim_mpu()
+    with pytest.raises(RuntimeError):
+        sensor.readFIFO()
+
+def test_calibrate_gyro_restarts_after_overflow(sim_mpu, sim_clock):
+    sensor, device = sim_mpu(TEST_GYRO_BIAS, TEST_GYRO_NOISE)
+
+    # Consumer stalls once, statistics are restarted after the overflow
+    for step_idx, step_delay in enumerate(sensor.calibrateGyroSteps(1000, use_fifo=True)):
+        sim_clock.sleep(1.0 if (step_idx == 2) else step_delay)
+    assert sensor.fifo_overflow_count == 1
+    assert sensor.gyro_calib["count"] == 1000
+    assert sensor.delta_gyro["y_axis"] == pytest.approx(TEST_GYRO_BIAS[1], abs=0.5)
+
+def test_calibrate_gyro_fails_on_repeated_overflow(sim_mpu, sim_clock):
+    sensor, device = sim_mpu(TEST_GYRO_BIAS, TEST_GYRO_NOISE)
+
+    # Consumer stalls at every step, calibration gives up without publishing
+    with pytest.raises(RuntimeError):
+        for step_delay in sensor.calibrateGyroSteps(1000, use_fifo=True):
+            sim_clock.sleep(1.0)
+    assert not(sensor.use_calibrate)
+
+    # FIFO and sample rate divider are restored
+    assert device.regs[MPU6050_REG_FIFO_EN] == 0
+    assert device.regs[MPU6050_REG_SMPLRT_DIV] == 0
@@ -0,0 +1,95 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : test_pysensorcache.py
+#  Module Dependency : pysensorcache.py, pysensorsim.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Tests for persisted calibration cache round trip and
+#      invalidation against the simulated sensors
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import json
+
+import pytest
+
+from pysensorsim import *
+from pysensorcache import *
+
+###################################################################
+#                        Test Declaration                         #
+###################################################################
+@pytest.fixture
+def sensor_cache(tmp_path):
+    return SensorCache(str(tmp_path / "sensor_cache.json"), board_id="test")
+
+def createMPU(device, cache):
+    master = SimAxiIIC()
+    master.attach(MPU6050_I2C_ADDR_PRIM, device)
+    return MPU6050(master, MPU6050_SCALE_2000DPS, MPU6050_RANGE_2G, cache=cache)
+
+def test_mpu6050_round_trip(sensor_cache):
+    device = SimMPU6050()
+    sensor = createMPU(device, sensor_cache)
+    sensor.delta_gyro.update(x_axis=0.5, y_axis=-20.0, z_axis=50.0)
+    sensor.threshold_data.update(x_axis=2.0, y_axis=2.0, z_axis=2.0)
+    sensor.use_calibrate = True
+    sensor_cache.store(sensor)
+
+    # New driver instance restores signed calibration
+    restored = createMPU(device, SensorCache(sensor_cache.file_path, board_id="test"))
+    assert restored.use_calibrate
+    assert restored.delta_gyro == sensor.delta_gyro
+    assert restored.threshold_data == sensor.threshold_data
+
+def test_mpu6050_temperature_change_keeps_file(sensor_cache):
+    device = SimMPU6050()
+    sensor = createMPU(device, sensor_cache)
+    sensor.use_calibrate = True
+    sensor_cache.store(sensor)
+    with open(sensor_cache.file_path, "r") as cache_file:
+        cache_data = cache_file.read()
+
+    # Small temperature change doesn't rewrite the entry
+    device.regs[MPU6050_REG_TEMP_OUT_H + 1] = 100
+    sensor_cache.store(sensor)
+    with open(sensor_cache.file_path, "r") as cache_file:
+        assert cache_file.read() == cache_data
+
+def test_mpu6050_invalid_entry(sensor_cache):
+    device = SimMPU6050()
+    sensor = createMPU(device, sensor_cache)
+    sensor.use_calibrate = True
+    sensor_cache.store(sensor)
+
+    # Changed gyroscope scale invalidates and removes the entry
+    sensor.setSensorScale(MPU6050_SCALE_250DPS)
+    assert not(sensor_cache.load(sensor))
+    assert sensor_cache.getKey(sensor) not in sensor_cache.getEntries()
+
+def test_bme280_round_trip(sensor_cache):
+    device = SimBME280()
+    sensor = BME280(SimAxiQuadSPI(device), 0, 0, cache=sensor_cache)
+    sensor.getCalibData()
+
+    # New driver instance restores calibration without reading it from sensor
+    master = SimAxiQuadSPI(device)
+    restored = BME280(master, 0, 0, cache=SensorCache(sensor_cache.file_path, board_id="test"))
+    assert restored.calib_data == sensor.calib_data
+    assert restored.compensateFloat(415148, 519888, 0) == sensor.compensateFloat(415148, 519888, 0)
+
+def test_other_version_is_ignored(sensor_cache):
+    with open(sensor_cache.file_path, "w") as cache_file:
+        json.dump({"version":CACHE_VERSION - 1, "entries":{"key":{}}}, cache_file)
+    assert sensor_cache.getEntries() == {}
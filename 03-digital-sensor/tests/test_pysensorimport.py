@@ -0,0 +1,38 @@
+##################################################################
+#                       [ Python Library ]
+#
+#  Institution       : Korea Advanded Institute of Technology
+#  Name              : Dalta Imam Maulana
+#
+#  Project Name      : EE878 - Biomedical System Design - PYNQ
+#
+#  Create Date       : 10/17/2026
+#  File Name         : test_pysensorimport.py
+#  Module Dependency : pysensorimport.py, pysensorbench.py
+#
+#  Tool Version      : -
+#
+#  Description:
+#      Tests for lazy loading of heavy dependencies (driver import
+#      runs in a new interpreter with -X importtime)
+#
+###################################################################
+###################################################################
+#                         Import Library                          #
+###################################################################
+import pytest
+
+from pysensorimport import lazyImport
+from pysensorbench import benchImportTime, BENCH_IMPORT_MODULES
+
+###################################################################
+#                        Test Declaration                         #
+###################################################################
+@pytest.mark.parametrize("module_name", BENCH_IMPORT_MODULES)
+def test_import_loads_no_heavy_module(module_name):
+    import_result = benchImportTime([module_name], repeat=1)
+    assert import_result["import." + module_name]["heavy_modules"] == []
+
+def test_lazy_import_missing_module():
+    with pytest.raises(ImportError):
+        lazyImport("pysensor_missing_module")